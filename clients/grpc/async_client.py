@@ -0,0 +1,21 @@
+# Асинхронный канал связи из grpc.aio. В отличие от clients.grpc.client,
+# этот модуль не инициализирует gevent: grpc.aio работает поверх asyncio.
+from grpc.aio import Channel
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента на основе grpc.aio.
+
+    Хранит общий асинхронный канал (grpc.aio.Channel) для связи с gRPC-сервером.
+    От него наследуются все асинхронные клиенты сервисов.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Конструктор базового асинхронного клиента.
+
+        :param channel: Асинхронный gRPC-канал. Должен создаваться внутри того event loop,
+                        в котором будут выполняться вызовы.
+        """
+        self.channel = channel
@@ -127,7 +127,9 @@ def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
 
     :return: Инициализированный клиент для AccountsGatewayService.
     """
-    return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return AccountsGatewayGRPCClient(
+        channel=build_gateway_grpc_client(service="accounts")
+    )
 
 
 def build_accounts_gateway_locust_grpc_client(
@@ -143,5 +145,5 @@ def build_accounts_gateway_locust_grpc_client(
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
     return AccountsGatewayGRPCClient(
-        channel=build_gateway_locust_grpc_client(environment)
+        channel=build_gateway_locust_grpc_client(environment, service="accounts")
     )
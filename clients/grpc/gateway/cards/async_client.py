@@ -0,0 +1,112 @@
+from typing import TYPE_CHECKING
+
+from grpc.aio import Channel
+
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.client import (
+    build_gateway_async_grpc_client,
+    build_gateway_locust_async_grpc_client,
+)
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import (
+    CardsGatewayServiceStub,
+)
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
+    IssuePhysicalCardRequest,
+    IssuePhysicalCardResponse,
+)
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
+    IssueVirtualCardRequest,
+    IssueVirtualCardResponse,
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class CardsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с CardsGatewayService.
+    Предоставляет высокоуровневые методы для получения и создания карт.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsGatewayServiceStub(channel)
+
+    async def issue_virtual_card_api(
+        self, request: IssueVirtualCardRequest
+    ) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя и аккаунта.
+        :return: Ответ от сервиса с данными виртуальной карты.
+        """
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(
+        self, request: IssuePhysicalCardRequest
+    ) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя и аккаунта.
+        :return: Ответ от сервиса с данными виртуальной карты.
+        """
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(
+        self, user_id: str, account_id: str
+    ) -> IssueVirtualCardResponse:
+        """
+        Создание новой аиртуальной карты для пользователя
+
+        :return: Ответ с информацией о созданной виртуальной карте.
+        """
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(
+        self, user_id: str, account_id: str
+    ) -> IssuePhysicalCardResponse:
+        """
+        Создание новой физической карты для пользователя
+
+        :return: Ответ с информацией о созданной физической карте.
+        """
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_cards_gateway_async_grpc_client() -> CardsGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsGatewayAsyncGRPCClient.
+
+    :return: Инициализированный клиент для CardsGatewayService.
+    """
+    return CardsGatewayAsyncGRPCClient(
+        channel=build_gateway_async_grpc_client(service="cards")
+    )
+
+
+def build_cards_gateway_locust_async_grpc_client(
+    environment: "Environment",
+) -> CardsGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр CardsGatewayAsyncGRPCClient с хуками сбора метрик.
+    """
+    return CardsGatewayAsyncGRPCClient(
+        channel=build_gateway_locust_async_grpc_client(environment, service="cards")
+    )
@@ -87,7 +87,7 @@ def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
 
     :return: Инициализированный клиент для CardsGatewayService.
     """
-    return CardsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return CardsGatewayGRPCClient(channel=build_gateway_grpc_client(service="cards"))
 
 
 def build_cards_gateway_locust_grpc_client(
@@ -102,4 +102,6 @@ def build_cards_gateway_locust_grpc_client(
     :param environment: объект окружения Locust.
     :return: экземпляр CardsGatewayGRPCClient с хуками сбора метрик.
     """
-    return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return CardsGatewayGRPCClient(
+        channel=build_gateway_locust_grpc_client(environment, service="cards")
+    )
@@ -1,32 +1,146 @@
-from grpc import Channel, insecure_channel, intercept_channel
-from locust.env import Environment
+from typing import TYPE_CHECKING
 
+from grpc import Channel, aio, insecure_channel, intercept_channel
+
+from clients.grpc.interceptors.capture_interceptor import CaptureInterceptor
+from clients.grpc.interceptors.locust_async_interceptor import AsyncLocustInterceptor
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.pool import GRPCChannelOptions, get_shared_grpc_channel_pool
+from config import settings
+from replay.writer import get_traffic_writer
+
+if TYPE_CHECKING:
+    # Импорт locust выполняет gevent monkey-patching, несовместимый с asyncio,
+    # поэтому окружение Locust импортируется только для аннотаций типов
+    from locust.env import Environment
 
 
-def build_gateway_grpc_client() -> Channel:
+def build_gateway_grpc_client(service: str | None = None) -> Channel:
     """
     Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
 
-    :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
+    Адрес и опции канала (keepalive, размеры сообщений, сжатие) берутся
+    из настроек (config.settings).
+
+    Возвращается общий для процесса пул каналов (см. clients.grpc.pool): клиенты
+    всех сервисов gateway с одинаковыми настройками используют одни и те же соединения,
+    а вызовы распределяются по каналам пула по кругу. Размер пула задаётся настройкой channels.
+
+    :param service: Имя сервиса (users, accounts и т.д.) для применения его переопределений.
+    :return: gRPC-канал (пул каналов), настроенный на адрес grpc-gateway.
     """
-    return insecure_channel("localhost:9003")
+    config = settings.get_gateway_grpc_client_config(service)
 
+    def build_channel(options: GRPCChannelOptions) -> Channel:
+        return insecure_channel(
+            config.client_url,
+            options=options,
+            compression=config.channel_compression,
+        )
 
-def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
+    return get_shared_grpc_channel_pool(
+        name=config.model_dump_json(),
+        size=config.channels,
+        build_channel=build_channel,
+        options=config.channel_options,
+    )
+
+
+def build_gateway_locust_grpc_client(
+    environment: "Environment",
+    report_phases: bool | None = None,
+    service: str | None = None,
+) -> Channel:
     """
     Фабричная функция для создания gRPC-канала, адаптированного для Locust.
-    В канал автоматически встраивается интерцептор LocustInterceptor,
+    В каждый канал пула автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    Пул каналов общий для всех клиентов, собранных для одного окружения Locust
+    в рамках воркера (см. build_gateway_grpc_client).
+
+    С CAPTURE.ENABLED=true вызовы дополнительно записываются в журнал трафика
+    интерцептором CaptureInterceptor.
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :param report_phases: Отправлять ли в Locust фазы вызова (сервер, сеть)
+                          отдельными метриками с типом "gRPC:<фаза>".
+                          None — значение из настроек (report_phases).
+    :param service: Имя сервиса (users, accounts и т.д.) для применения его переопределений.
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
+    config = settings.get_gateway_grpc_client_config(service)
+    if report_phases is None:
+        report_phases = config.report_phases
+
     # Создаём экземпляр интерцептора, передаём в него окружение Locust
-    locust_interceptor = LocustInterceptor(environment=environment)
+    locust_interceptor = LocustInterceptor(
+        environment=environment, report_phases=report_phases
+    )
+
+    # Интерцептор записи трафика стоит снаружи LocustInterceptor,
+    # чтобы не попадать в замер времени вызова
+    interceptors = [locust_interceptor]
+    if settings.capture.enabled:
+        interceptors.insert(0, CaptureInterceptor(get_traffic_writer()))
+
+    def build_channel(options: GRPCChannelOptions) -> Channel:
+        # Создаём обычный канал
+        channel = insecure_channel(
+            config.client_url,
+            options=options,
+            compression=config.channel_compression,
+        )
+
+        # Оборачиваем канал интерцепторами, чтобы все запросы проходили через них
+        return intercept_channel(channel, *interceptors)
+
+    return get_shared_grpc_channel_pool(
+        # Пулы с разным режимом отчёта о фазах и записи трафика не должны совпадать
+        name=f"locust:{report_phases}:{settings.capture.enabled}:{config.model_dump_json()}",
+        size=config.channels,
+        build_channel=build_channel,
+        options=config.channel_options,
+        environment=environment,
+    )
 
-    # Создаём обычный канал
-    channel = insecure_channel("localhost:9003")
 
-    # Оборачиваем канал интерцептором, чтобы все запросы проходили через него
-    return intercept_channel(channel, locust_interceptor)
\ No newline at end of file
+def build_gateway_async_grpc_client(service: str | None = None) -> aio.Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway.
+
+    Канал привязан к event loop, поэтому вызывать билдер нужно внутри корутины.
+
+    :param service: Имя сервиса (users, accounts и т.д.) для применения его переопределений.
+    :return: Асинхронный gRPC-канал, настроенный на адрес grpc-gateway.
+    """
+    config = settings.get_gateway_grpc_client_config(service)
+
+    return aio.insecure_channel(
+        config.client_url,
+        options=config.channel_options,
+        compression=config.channel_compression,
+    )
+
+
+def build_gateway_locust_async_grpc_client(
+    environment: "Environment", service: str | None = None
+) -> aio.Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала, адаптированного для Locust.
+    В канал встраивается интерцептор AsyncLocustInterceptor, который регистрирует
+    вызовы в системе метрик Locust.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :param service: Имя сервиса (users, accounts и т.д.) для применения его переопределений.
+    :return: Асинхронный gRPC-канал с интерцептором.
+    """
+    config = settings.get_gateway_grpc_client_config(service)
+
+    # В grpc.aio интерцепторы передаются при создании канала
+    return aio.insecure_channel(
+        config.client_url,
+        options=config.channel_options,
+        compression=config.channel_compression,
+        interceptors=[AsyncLocustInterceptor(environment=environment)],
+    )
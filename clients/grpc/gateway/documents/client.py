@@ -72,7 +72,9 @@ def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
 
     :return: Инициализированный клиент для DocumentsGatewayService.
     """
-    return DocumentsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return DocumentsGatewayGRPCClient(
+        channel=build_gateway_grpc_client(service="documents")
+    )
 
 
 def build_documents_gateway_locust_grpc_client(
@@ -88,5 +90,5 @@ def build_documents_gateway_locust_grpc_client(
     :return: экземпляр DocumentsGatewayGRPCClient с хуками сбора метрик.
     """
     return DocumentsGatewayGRPCClient(
-        channel=build_gateway_locust_grpc_client(environment)
+        channel=build_gateway_locust_grpc_client(environment, service="documents")
     )
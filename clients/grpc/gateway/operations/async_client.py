@@ -0,0 +1,392 @@
+from typing import TYPE_CHECKING
+
+from grpc.aio import Channel
+
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.client import (
+    build_gateway_async_grpc_client,
+    build_gateway_locust_async_grpc_client,
+)
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import (
+    OperationsGatewayServiceStub,
+)
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import (
+    GetOperationRequest,
+    GetOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (
+    GetOperationReceiptRequest,
+    GetOperationReceiptResponse,
+)
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import (
+    GetOperationsRequest,
+    GetOperationsResponse,
+)
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import (
+    GetOperationsSummaryRequest,
+    GetOperationsSummaryResponse,
+)
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (
+    MakeBillPaymentOperationRequest,
+    MakeBillPaymentOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationRequest,
+    MakeCashWithdrawalOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (
+    MakeCashbackOperationRequest,
+    MakeCashbackOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (
+    MakeFeeOperationRequest,
+    MakeFeeOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
+    MakePurchaseOperationRequest,
+    MakePurchaseOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
+    MakeTopUpOperationRequest,
+    MakeTopUpOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
+    MakeTransferOperationRequest,
+    MakeTransferOperationResponse,
+)
+from contracts.services.operations.operation_pb2 import OperationStatus
+from tools.fakers import fake
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class OperationsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с OperationsGatewayService.
+    Предоставляет высокоуровневые методы для получения и создания пользователей.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к OperationsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    async def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
+        """
+        Низкоуровневый вызов метода GetOperation через gRPC.
+
+        :param request: gRPC-запрос с ID операции.
+        :return: Ответ от сервиса с данными операции.
+        """
+        return await self.stub.GetOperation(request)
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponse:
+        """
+        Получение данных операции по ее ID.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ с информацией о операции.
+        """
+        request = GetOperationRequest(id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt_api(
+        self, request: GetOperationReceiptRequest
+    ) -> GetOperationReceiptResponse:
+        """
+        Низкоуровневый вызов метода GetOperationReceipt через gRPC.
+
+        :param request: gRPC-запрос с ID операции.
+        :return: Ответ от сервиса с данными чека операции.
+        """
+        return await self.stub.GetOperationReceipt(request)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+        """
+        Получение данных чека операции по ее ID.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ с информацией о чеке операции.
+        """
+        request = GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations_api(
+        self, request: GetOperationsRequest
+    ) -> GetOperationsResponse:
+        """
+        Низкоуровневый вызов метода GetOperations через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта.
+        :return: Ответ от сервиса с данными операций по аккаунту.
+        """
+        return await self.stub.GetOperations(request)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponse:
+        """
+        Получение данных операции по счету по его ID.
+
+        :param account_id: Идентификатор аккаугта.
+        :return: Ответ с информацией о операциях.
+        """
+        request = GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary_api(
+        self, request: GetOperationsSummaryRequest
+    ) -> GetOperationsSummaryResponse:
+        """
+        Низкоуровневый вызов метода GetOperationsSummary через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта.
+        :return: Ответ от сервиса с данными операций по аккаунту.
+        """
+        return await self.stub.GetOperationsSummary(request)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+        """
+        Получение статистики по счету по его ID.
+
+        :param account_id: Идентификатор аккаугта.
+        :return: Ответ с статистикой о операциях.
+        """
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation_api(
+        self, request: MakeFeeOperationRequest
+    ) -> MakeFeeOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeFeeOperation через gRPC.
+
+        :param request: gRPC-запрос с суммой, статусом, id карты и id счета.
+        :return: Ответ от сервиса с данными по созданной операции.
+        """
+        return await self.stub.MakeFeeOperation(request)
+
+    async def make_fee_operation(
+        self, card_id: str, account_id: str
+    ) -> MakeFeeOperationResponse:
+        """
+        Создание операции комиссии.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор аккаунта.
+        :return: результат выполнения операции комиссии.
+        """
+        request = MakeFeeOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.float(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_fee_operation_api(request)
+
+    async def make_top_up_operation_api(
+        self, request: MakeTopUpOperationRequest
+    ) -> MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeFeeOperation через gRPC.
+
+        :param request: gRPC-запрос с суммой, статусом, id карты и id счета.
+        :return: Ответ от сервиса с данными по созданной операции.
+        """
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_top_up_operation(
+        self, card_id: str, account_id: str
+    ) -> MakeTopUpOperationResponse:
+        """
+        Создание операции пополнения.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор аккаунта.
+        :return: результат выполнения операции комиссии.
+        """
+        request = MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.float(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_top_up_operation_api(request)
+
+    async def make_cashback_operation_api(
+        self, request: MakeCashbackOperationRequest
+    ) -> MakeCashbackOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashbackOperation через gRPC.
+
+        :param request: gRPC-запрос с суммой, статусом, id карты и id счета.
+        :return: Ответ от сервиса с данными по созданной операции.
+        """
+        return await self.stub.MakeCashbackOperation(request)
+
+    async def make_cashback_operation(
+        self, card_id: str, account_id: str
+    ) -> MakeCashbackOperationResponse:
+        """
+        Создание операции кэшбека.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор аккаунта.
+        :return: результат выполнения операции комиссии.
+        """
+        request = MakeCashbackOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.float(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_cashback_operation_api(request)
+
+    async def make_transfer_operation_api(
+        self, request: MakeTransferOperationRequest
+    ) -> MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTransferOperation через gRPC.
+
+        :param request: gRPC-запрос с суммой, статусом, id карты и id счета.
+        :return: Ответ от сервиса с данными по созданной операции.
+        """
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_transfer_operation(
+        self, card_id: str, account_id: str
+    ) -> MakeTransferOperationResponse:
+        """
+        Создание операции перевода.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор аккаунта.
+        :return: результат выполнения операции перевода.
+        """
+        request = MakeTransferOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.float(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation_api(
+        self, request: MakePurchaseOperationRequest
+    ) -> MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов метода MakePurchaseOperation через gRPC.
+
+        :param request: gRPC-запрос с суммой, статусом, категорией, id карты и id счета.
+        :return: Ответ от сервиса с данными по созданной операции.
+        """
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_purchase_operation(
+        self, card_id: str, account_id: str
+    ) -> MakePurchaseOperationResponse:
+        """
+        Создание операции покупки.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор аккаунта.
+        :return: результат выполнения операции покупки.
+        """
+        request = MakePurchaseOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.float(),
+            card_id=card_id,
+            account_id=account_id,
+            category=fake.category(),
+        )
+        return await self.make_purchase_operation_api(request)
+
+    async def make_bill_payment_operation_api(
+        self, request: MakeBillPaymentOperationRequest
+    ) -> MakeBillPaymentOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeBillPaymentOperation через gRPC.
+
+        :param request: gRPC-запрос с суммой, статусом, категорией, id карты и id счета.
+        :return: Ответ от сервиса с данными по созданной операции.
+        """
+        return await self.stub.MakeBillPaymentOperation(request)
+
+    async def make_bill_payment_operation(
+        self, card_id: str, account_id: str
+    ) -> MakeBillPaymentOperationResponse:
+        """
+        Создание операции оплаты счета.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор аккаунта.
+        :return: результат выполнения операции оплаты счета.
+        """
+        request = MakeBillPaymentOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.float(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_bill_payment_operation_api(request)
+
+    async def make_cash_withdrawal_operation_api(
+        self, request: MakeCashWithdrawalOperationRequest
+    ) -> MakeCashWithdrawalOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashWithdrawalOperation через gRPC.
+
+        :param request: gRPC-запрос с суммой, статусом, категорией, id карты и id счета.
+        :return: Ответ от сервиса с данными по созданной операции.
+        """
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    async def make_cash_withdrawal_operation(
+        self, card_id: str, account_id: str
+    ) -> MakeCashWithdrawalOperationResponse:
+        """
+        Создание операции снятия наличных.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор аккаунта.
+        :return: результат выполнения операции снятия наличных.
+        """
+        request = MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.float(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
+def build_operations_gateway_async_grpc_client() -> OperationsGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsGatewayAsyncGRPCClient.
+
+    :return: Инициализированный клиент для OperationsGatewayAsyncGRPCClient.
+    """
+    return OperationsGatewayAsyncGRPCClient(
+        channel=build_gateway_async_grpc_client(service="operations")
+    )
+
+
+def build_operations_gateway_locust_async_grpc_client(
+    environment: "Environment",
+) -> OperationsGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр OperationsGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр OperationsGatewayAsyncGRPCClient с хуками сбора метрик.
+    """
+    return OperationsGatewayAsyncGRPCClient(
+        channel=build_gateway_locust_async_grpc_client(environment, service="operations")
+    )
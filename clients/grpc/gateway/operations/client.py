@@ -153,7 +153,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :return: Ответ с статистикой о операциях.
         """
         request = GetOperationsSummaryRequest(account_id=account_id)
-        return self.get_operations_summary(request)
+        return self.get_operations_summary_api(request)
 
     def make_fee_operation_api(
         self, request: MakeFeeOperationRequest
@@ -366,7 +366,9 @@ def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
 
     :return: Инициализированный клиент для OperationsGatewayGRPCClient.
     """
-    return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return OperationsGatewayGRPCClient(
+        channel=build_gateway_grpc_client(service="operations")
+    )
 
 
 def build_operations_gateway_locust_grpc_client(
@@ -382,5 +384,5 @@ def build_operations_gateway_locust_grpc_client(
     :return: экземпляр OperationsGatewayGRPCClient с хуками сбора метрик.
     """
     return OperationsGatewayGRPCClient(
-        channel=build_gateway_locust_grpc_client(environment)
+        channel=build_gateway_locust_grpc_client(environment, service="operations")
     )
@@ -88,7 +88,7 @@ def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
 
     :return: Инициализированный клиент для UsersGatewayService.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return UsersGatewayGRPCClient(channel=build_gateway_grpc_client(service="users"))
 
 
 def build_users_gateway_locust_grpc_client(
@@ -103,4 +103,6 @@ def build_users_gateway_locust_grpc_client(
     :param environment: объект окружения Locust.
     :return: экземпляр UsersGatewayGRPCClient с хуками сбора метрик.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return UsersGatewayGRPCClient(
+        channel=build_gateway_locust_grpc_client(environment, service="users")
+    )
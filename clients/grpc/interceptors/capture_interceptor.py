@@ -0,0 +1,44 @@
+from google.protobuf.json_format import MessageToDict
+from grpc import UnaryUnaryClientInterceptor
+
+from replay.writer import TrafficWriter
+
+
+class CaptureInterceptor(UnaryUnaryClientInterceptor):
+    """
+    gRPC-интерцептор, записывающий unary-unary вызовы в журнал трафика
+    (формат replay.schema.TrafficRecord) для последующего проигрывания.
+
+    Сообщение запроса преобразуется в JSON в фоновом потоке TrafficWriter,
+    на пути вызова остаётся только выборка, постановка записи в очередь
+    и отметка о завершении вызова.
+    Потоковые вызовы не записываются: проигрыватель воспроизводит только unary-вызовы.
+    """
+
+    def __init__(self, writer: TrafficWriter):
+        """
+        :param writer: Фоновая запись журнала трафика.
+        """
+        self.writer = writer
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        # Запись ставится в очередь до вызова: журнал упорядочен по моменту отправки
+        entry = self.writer.start(
+            lambda: {
+                "grpc_method": client_call_details.method,
+                "body": MessageToDict(request),
+            }
+        )
+        if entry is None:
+            return continuation(client_call_details, request)
+
+        response = continuation(client_call_details, request)
+
+        def on_done(call) -> None:
+            code = call.code()
+            entry.complete(code.name if code is not None else None)
+
+        # Для блокирующего вызова callback выполняется сразу, для future — по завершении,
+        # поэтому интерцептор не превращает асинхронный вызов в блокирующий
+        response.add_done_callback(on_done)
+        return response
@@ -0,0 +1,63 @@
+import time
+from typing import TYPE_CHECKING
+
+from grpc.aio import AioRpcError, UnaryUnaryClientInterceptor
+
+if TYPE_CHECKING:
+    # Импорт locust выполняет gevent monkey-patching, несовместимый с asyncio,
+    # поэтому окружение Locust импортируется только для аннотаций типов
+    from locust.env import Environment
+
+
+class AsyncLocustInterceptor(UnaryUnaryClientInterceptor):
+    """
+    grpc.aio-интерцептор для сбора метрик Locust.
+    Асинхронный аналог LocustInterceptor для каналов grpc.aio.
+    """
+
+    def __init__(self, environment: "Environment"):
+        """
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        """
+        self.environment = environment
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary вызовов grpc.aio.
+
+        :param continuation: Корутина, запускающая фактический gRPC вызов.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Объект вызова (grpc.aio.UnaryUnaryCall).
+        """
+        response = None
+        exception: AioRpcError | None = None
+        start_time = time.perf_counter()
+        response_length = 0
+
+        # Запускаем вызов; ожидание самого ответа происходит ниже
+        call = await continuation(client_call_details, request)
+
+        try:
+            response = await call
+            response_length = response.ByteSize()
+        except AioRpcError as error:
+            exception = error
+
+        # В grpc.aio имя метода может приходить в виде bytes
+        method = client_call_details.method
+        if isinstance(method, bytes):
+            method = method.decode()
+
+        self.environment.events.request.fire(
+            name=method,
+            context=None,
+            response=response,
+            exception=exception,
+            request_type="gRPC",
+            response_time=(time.perf_counter() - start_time) * 1000,
+            response_length=response_length,
+        )
+
+        # Возвращаем объект вызова: повторный await вернёт уже готовый результат
+        return call
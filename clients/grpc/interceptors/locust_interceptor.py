@@ -1,20 +1,282 @@
 import time
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
-from locust.env import Environment
+from google.protobuf.message import Message
+from grpc import (
+    RpcError,
+    StreamStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    UnaryUnaryClientInterceptor,
+)
 
+if TYPE_CHECKING:
+    # Импорт locust выполняет gevent monkey-patching, несовместимый с asyncio,
+    # поэтому окружение Locust импортируется только для аннотаций типов
+    from locust.env import Environment
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+# Ключи trailing metadata, в которых сервер может передать время обработки вызова:
+# - "x-server-time-ms" — число миллисекунд, например "12.5";
+# - "server-timing" — формат заголовка Server-Timing, например "app;dur=12.5, db;dur=3".
+SERVER_TIME_METADATA_KEYS = ("x-server-time-ms", "server-timing")
+
+
+def get_server_time(metadata: Sequence[tuple[str, str | bytes]] | None) -> float | None:
+    """
+    Извлекает время обработки вызова на сервере (в мс) из trailing metadata.
+
+    Для Server-Timing берётся максимальное значение dur: вложенные метрики
+    (например, db) не могут быть длиннее всей обработки запроса.
+
+    :param metadata: Trailing metadata вызова.
+    :return: Время на сервере в миллисекундах или None, если сервер его не передал.
+    """
+    for key, value in metadata or ():
+        if key not in SERVER_TIME_METADATA_KEYS:
+            continue
+
+        if isinstance(value, bytes):
+            value = value.decode(errors="ignore")
+
+        try:
+            if key == "x-server-time-ms":
+                return float(value)
+
+            durations = [
+                float(param.split("=", 1)[1])
+                for metric in value.split(",")
+                for param in metric.split(";")
+                if param.strip().startswith("dur=")
+            ]
+            if durations:
+                return max(durations)
+        except ValueError:
+            continue
+
+    return None
+
+
+class GRPCCallTimings:
+    """
+    Длительности фаз unary gRPC-вызова в миллисекундах.
+
+    Полное время вызова измеряется монотонными часами (time.perf_counter_ns).
+    Синхронный канал выполняет блокирующий вызов целиком внутри continuation,
+    вместе с сериализацией запроса и разбором ответа, поэтому отправку, ожидание
+    ответа и (де)сериализацию напрямую разделить нельзя. Время раскладывается так:
+    - server — время обработки на сервере из trailing metadata (если сервер его передал);
+    - network — остаток: сеть, очереди gRPC и (де)сериализация (только если известно server);
+    - wait — всё время вызова, если server неизвестно.
+    """
+
+    __slots__ = ("started", "finished", "server")
+
+    def __init__(self) -> None:
+        self.started: int = time.perf_counter_ns()
+        self.finished: int | None = None
+        self.server: float | None = None
+
+    def complete(self) -> None:
+        self.finished = time.perf_counter_ns()
+
+    @property
+    def total(self) -> float:
+        """
+        Полное время вызова в миллисекундах.
+        """
+        end = self.finished or time.perf_counter_ns()
+        return (end - self.started) / 1_000_000
+
+    def get_phases(self) -> dict[str, float]:
+        """
+        Возвращает длительности фаз в миллисекундах.
+        Фазы, которые не удалось измерить, не возвращаются.
+        """
+        if self.server is None:
+            return {"wait": self.total}
+
+        return {"server": self.server, "network": max(self.total - self.server, 0)}
+
+
+class LocustRequestIterator:
+    """
+    Обёртка над итератором запросов клиентского стрима.
+
+    gRPC вычитывает итератор запросов сам (в своём потоке), обёртка лишь
+    подсчитывает число отправленных сообщений и их суммарный размер.
+    """
+
+    def __init__(self, request_iterator: Iterable[Message]) -> None:
+        self.request_iterator = iter(request_iterator)
+        self.messages = 0
+        self.length = 0
+
+    def __iter__(self) -> Iterator[Message]:
+        return self
+
+    def __next__(self) -> Message:
+        request = next(self.request_iterator)
+
+        self.messages += 1
+        self.length += request.ByteSize()
+
+        return request
+
+
+class LocustResponseIterator:
+    """
+    Обёртка над серверным стримом (объектом вызова unary-stream / stream-stream).
+
+    Когда стрим завершается (дочитан до конца, упал с ошибкой или отменён клиентом),
+    в Locust отправляется одна метрика "gRPC": полное время стрима и суммарный размер
+    всех сообщений. Число сообщений, скорость (сообщений в секунду) и наибольший
+    интервал между сообщениями (для первого — с начала вызова) передаются в context.
+
+    С report_phases по каждому сообщению дополнительно отправляется метрика
+    "gRPC:message" (интервал и размер сообщения), как и фазы unary-вызовов, —
+    по умолчанию нет: иначе каждое сообщение считалось бы в Locust отдельным запросом.
+
+    Остальные методы объекта вызова (code, details, trailing_metadata и т.д.)
+    проксируются без изменений, поэтому обёртку можно использовать вместо вызова.
+    """
+
+    def __init__(
+        self,
+        call: Any,
+        environment: "Environment",
+        method: str,
+        request_length: int = 0,
+        requests: LocustRequestIterator | None = None,
+        report_phases: bool = False,
+    ) -> None:
+        """
+        :param call: Объект вызова gRPC (итератор ответов и grpc.Call одновременно).
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        :param method: Имя вызываемого метода.
+        :param request_length: Размер запроса для unary-stream вызова.
+        :param requests: Итератор запросов для stream-stream вызова.
+        :param report_phases: Отправлять ли метрику "gRPC:message" по каждому сообщению.
+        """
+        self.call = call
+        self.environment = environment
+        self.method = method
+        self.request_length = request_length
+        self.requests = requests
+        self.report_phases = report_phases
+
+        self.started = time.perf_counter_ns()
+        self.last_message = self.started
+        self.messages = 0
+        self.length = 0
+        self.max_interval = 0.0
+        self.completed = False
+
+    def __iter__(self) -> Iterator[Message]:
+        return self
+
+    def __next__(self) -> Message:
+        try:
+            message = next(self.call)
+        except StopIteration:
+            self.complete()
+            raise
+        except RpcError as error:
+            self.complete(error)
+            raise
+
+        now = time.perf_counter_ns()
+        interval = (now - self.last_message) / 1_000_000
+        message_length = message.ByteSize()
+
+        if self.report_phases:
+            self.environment.events.request.fire(
+                name=self.method,
+                context=None,
+                response=message,
+                exception=None,
+                request_type="gRPC:message",
+                response_time=interval,
+                response_length=message_length,
+            )
+
+        self.last_message = now
+        self.max_interval = max(self.max_interval, interval)
+        self.messages += 1
+        self.length += message_length
+
+        return message
+
+    def __getattr__(self, name: str) -> Any:
+        # Методы grpc.Call и grpc.Future берутся у исходного объекта вызова
+        return getattr(self.call, name)
+
+    def cancel(self) -> bool:
+        """
+        Отменяет вызов. Итоговая метрика отправляется сразу: после отмены
+        клиент, как правило, стрим больше не читает.
+        """
+        cancelled = self.call.cancel()
+        self.complete()
+        return cancelled
+
+    def complete(self, exception: RpcError | None = None) -> None:
+        """
+        Отправляет итоговую метрику стрима (один раз).
+
+        :param exception: Ошибка, которой завершился стрим, если она была.
+        """
+        if self.completed:
+            return
+        self.completed = True
+
+        response_time = (time.perf_counter_ns() - self.started) / 1_000_000
+        context = {
+            "request_length": self.request_length,
+            "messages": self.messages,
+            "messages_per_second": (
+                self.messages / (response_time / 1000) if response_time else 0
+            ),
+            "max_message_interval": self.max_interval,
+        }
+        if self.requests is not None:
+            context["request_length"] = self.requests.length
+            context["request_messages"] = self.requests.messages
+
+        self.environment.events.request.fire(
+            name=self.method,
+            context=context,
+            response=self.call,
+            exception=exception,
+            request_type="gRPC",
+            response_time=response_time,
+            response_length=self.length,  # Суммарный размер всех сообщений стрима
+        )
+
+
+class LocustInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor,
+):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+
+    Поддерживаются все виды вызовов: unary-unary, unary-stream, stream-unary
+    и stream-stream. Для серверных стримов метрика отправляется по стриму целиком,
+    а с report_phases — и по каждому сообщению (см. LocustResponseIterator).
     """
 
-    def __init__(self, environment: Environment):
+    def __init__(self, environment: "Environment", report_phases: bool = False):
         """
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        :param report_phases: Отправлять ли фазы вызова отдельными метриками
+                              с типом "gRPC:<фаза>" (например, "gRPC:server"),
+                              а для стримов — метрику "gRPC:message" по каждому сообщению.
         """
         self.environment = environment
+        self.report_phases = report_phases
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
@@ -27,29 +289,129 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         """
         response = None
         exception: RpcError | None = None
-        start_time = time.perf_counter()  # Засекаем время начала запроса
         response_length = 0
+        request_length = request.ByteSize()  # Размер запроса в байтах
+
+        timings = GRPCCallTimings()  # Засекаем время начала запроса
 
         try:
             # Выполняем gRPC вызов и получаем response future
             response = continuation(client_call_details, request)
 
             # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
+            result = response.result()
+            timings.complete()
+            response_length = result.ByteSize()
         except RpcError as error:
             # В случае ошибки сохраняем исключение для метрик
+            timings.complete()
             exception = error
 
         # Регистрируем вызов в системе метрик Locust
         self.environment.events.request.fire(
             name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
-            context=None,  # Можно использовать для передачи кастомных данных
+            context={"request_length": request_length},  # Размер запроса в байтах
             response=response,  # Объект ответа (если нужен для контекста)
             exception=exception,  # Если произошла ошибка — передаём её сюда
             request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
+            response_time=timings.total,  # Время выполнения в миллисекундах
             response_length=response_length,  # Размер ответа в байтах
         )
 
+        if self.report_phases:
+            # RpcError синхронного канала тоже является объектом вызова с trailing metadata
+            call = response if exception is None else exception
+            trailing_metadata = getattr(call, "trailing_metadata", None)
+            timings.server = get_server_time(
+                trailing_metadata() if trailing_metadata else None
+            )
+
+            for phase, phase_time in timings.get_phases().items():
+                self.environment.events.request.fire(
+                    name=client_call_details.method,
+                    context=None,
+                    response=response,
+                    exception=None,
+                    request_type=f"gRPC:{phase}",
+                    response_time=phase_time,
+                    response_length=response_length,
+                )
+
         # Возвращаем результат вызова (future-объект)
-        return response
\ No newline at end of file
+        return response
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-stream gRPC вызовов (серверный стрим).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Итератор ответов, совместимый с объектом вызова gRPC.
+        """
+        return LocustResponseIterator(
+            call=continuation(client_call_details, request),
+            environment=self.environment,
+            method=client_call_details.method,
+            request_length=request.ByteSize(),
+            report_phases=self.report_phases,
+        )
+
+    def intercept_stream_unary(
+        self, continuation, client_call_details, request_iterator
+    ):
+        """
+        Метод-перехватчик для stream-unary gRPC вызовов (клиентский стрим).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request_iterator: Итератор запросов, отправляемых на сервер.
+        :return: gRPC response (future объект).
+        """
+        response = None
+        exception: RpcError | None = None
+        response_length = 0
+        requests = LocustRequestIterator(request_iterator)
+        start_time = time.perf_counter_ns()
+
+        try:
+            response = continuation(client_call_details, requests)
+            response_length = response.result().ByteSize()
+        except RpcError as error:
+            exception = error
+
+        self.environment.events.request.fire(
+            name=client_call_details.method,
+            context={
+                "request_length": requests.length,  # Суммарный размер всех запросов
+                "request_messages": requests.messages,  # Число отправленных сообщений
+            },
+            response=response,
+            exception=exception,
+            request_type="gRPC",
+            response_time=(time.perf_counter_ns() - start_time) / 1_000_000,
+            response_length=response_length,
+        )
+
+        return response
+
+    def intercept_stream_stream(
+        self, continuation, client_call_details, request_iterator
+    ):
+        """
+        Метод-перехватчик для stream-stream gRPC вызовов (двунаправленный стрим).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request_iterator: Итератор запросов, отправляемых на сервер.
+        :return: Итератор ответов, совместимый с объектом вызова gRPC.
+        """
+        requests = LocustRequestIterator(request_iterator)
+
+        return LocustResponseIterator(
+            call=continuation(client_call_details, requests),
+            environment=self.environment,
+            method=client_call_details.method,
+            requests=requests,
+            report_phases=self.report_phases,
+        )
@@ -0,0 +1,203 @@
+import os
+from itertools import count
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+from weakref import WeakSet
+
+from grpc import Channel
+
+if TYPE_CHECKING:
+    # Импорт locust выполняет gevent monkey-patching, несовместимый с asyncio,
+    # поэтому окружение Locust импортируется только для аннотаций типов
+    from locust.env import Environment
+
+# Ключ реестра: (PID процесса, имя пула, идентификатор окружения Locust).
+# PID нужен, чтобы форкнутые воркеры Locust не унаследовали каналы родителя.
+GRPCChannelPoolKey = tuple[int, str, int | None]
+
+# Опции канала в формате grpc: [("grpc.keepalive_time_ms", 10000), ...]
+GRPCChannelOptions = list[tuple[str, Any]]
+
+
+class GRPCChannelPoolMultiCallable:
+    """
+    Multi-callable пула: каждый вызов уходит в следующий канал по кругу (round-robin).
+
+    Multi-callable каждого канала создаётся один раз, при создании стаба,
+    поэтому на каждый вызов приходится только выбор канала.
+    """
+
+    def __init__(self, callables: Sequence[Any]) -> None:
+        self.callables = callables
+        self.counter = count()
+
+    def next_callable(self) -> Any:
+        return self.callables[next(self.counter) % len(self.callables)]
+
+    def __call__(self, *args, **kwargs):
+        return self.next_callable()(*args, **kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self.next_callable().with_call(*args, **kwargs)
+
+    def future(self, *args, **kwargs):
+        return self.next_callable().future(*args, **kwargs)
+
+
+class GRPCChannelPool(Channel):
+    """
+    Пул gRPC-каналов, который распределяет вызовы по нескольким каналам.
+
+    Один канал — это одно HTTP/2 соединение, число одновременных вызовов в котором
+    ограничено сервером (MAX_CONCURRENT_STREAMS). Пул раскладывает вызовы по N каналам,
+    каждый со своим соединением, поэтому пропускная способность воркера не упирается
+    в одно TCP-соединение. Пул реализует интерфейс grpc.Channel и передаётся в стабы
+    как обычный канал; close() пула ничего не делает (см. close_shared_grpc_channel_pools).
+    """
+
+    def __init__(self, channels: Sequence[Channel]) -> None:
+        """
+        :param channels: Каналы пула. Чтобы каналы не делили одно соединение,
+                         они должны создаваться с разными опциями
+                         (см. build_grpc_channel_pool_options).
+        """
+        self.channels = list(channels)
+
+    def subscribe(self, callback, try_to_connect=False) -> None:
+        for channel in self.channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback) -> None:
+        for channel in self.channels:
+            channel.unsubscribe(callback)
+
+    def unary_unary(self, method, *args, **kwargs) -> GRPCChannelPoolMultiCallable:
+        return GRPCChannelPoolMultiCallable(
+            [channel.unary_unary(method, *args, **kwargs) for channel in self.channels]
+        )
+
+    def unary_stream(self, method, *args, **kwargs) -> GRPCChannelPoolMultiCallable:
+        return GRPCChannelPoolMultiCallable(
+            [channel.unary_stream(method, *args, **kwargs) for channel in self.channels]
+        )
+
+    def stream_unary(self, method, *args, **kwargs) -> GRPCChannelPoolMultiCallable:
+        return GRPCChannelPoolMultiCallable(
+            [channel.stream_unary(method, *args, **kwargs) for channel in self.channels]
+        )
+
+    def stream_stream(self, method, *args, **kwargs) -> GRPCChannelPoolMultiCallable:
+        return GRPCChannelPoolMultiCallable(
+            [channel.stream_stream(method, *args, **kwargs) for channel in self.channels]
+        )
+
+    def close(self) -> None:
+        # Пул общий для всех клиентов процесса: закрытие канала одним клиентом
+        # не должно ломать остальные. Пулы закрывает close_shared_grpc_channel_pools
+        pass
+
+    def force_close(self) -> None:
+        """
+        Закрывает все каналы пула.
+        """
+        for channel in self.channels:
+            channel.close()
+
+
+_pools: dict[GRPCChannelPoolKey, GRPCChannelPool] = {}
+_pools_lock = Lock()
+
+# Окружения Locust, при завершении которых их пулы уже закрываются
+_closing_environments: "WeakSet[Environment]" = WeakSet()
+
+
+def build_grpc_channel_pool_options(
+    options: GRPCChannelOptions, index: int
+) -> GRPCChannelOptions:
+    """
+    Возвращает опции канала пула с заданным индексом.
+
+    По умолчанию gRPC переиспользует подканалы (соединения) между каналами с одинаковыми
+    опциями через глобальный пул подканалов. Локальный пул подканалов и уникальный
+    индекс канала гарантируют, что каждый канал пула откроет своё соединение.
+
+    :param options: Общие опции каналов.
+    :param index: Индекс канала в пуле.
+    :return: Опции конкретного канала.
+    """
+    return [
+        *options,
+        ("grpc.use_local_subchannel_pool", 1),
+        ("grpc.channel_pool_index", index),
+    ]
+
+
+def get_shared_grpc_channel_pool(
+    name: str,
+    size: int,
+    build_channel: Callable[[GRPCChannelOptions], Channel],
+    options: GRPCChannelOptions | None = None,
+    environment: "Environment | None" = None,
+) -> GRPCChannelPool:
+    """
+    Возвращает общий пул gRPC-каналов для указанного имени и окружения Locust.
+
+    Все клиенты, созданные в одном процессе (воркере) для одного имени пула
+    и окружения, получают один и тот же пул. Это позволяет UsersGatewayGRPCClient,
+    AccountsGatewayGRPCClient, OperationsGatewayGRPCClient и другим клиентам
+    использовать общие соединения вместо собственного канала на каждый билд.
+
+    Размер и опции применяются только при первом создании пула для ключа.
+
+    :param name: Имя пула, например адрес сервиса. Пулы с разной конфигурацией
+                 каналов (например, с разными интерцепторами) должны иметь разные имена.
+    :param size: Число каналов (соединений) в пуле.
+    :param build_channel: Функция, создающая канал по его опциям.
+    :param options: Общие опции каналов.
+    :param environment: Окружение Locust. None — пул вне нагрузочного теста.
+    :return: Экземпляр GRPCChannelPool.
+    """
+    key: GRPCChannelPoolKey = (
+        os.getpid(),
+        name,
+        id(environment) if environment is not None else None,
+    )
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = GRPCChannelPool(
+                [
+                    build_channel(build_grpc_channel_pool_options(options or [], index))
+                    for index in range(max(size, 1))
+                ]
+            )
+            _pools[key] = pool
+
+            # Закрываем каналы вместе с окружением Locust (один слушатель на окружение)
+            if environment is not None and environment not in _closing_environments:
+                _closing_environments.add(environment)
+                environment.events.quitting.add_listener(
+                    lambda **_: close_shared_grpc_channel_pools(environment)
+                )
+
+    return pool
+
+
+def close_shared_grpc_channel_pools(environment: "Environment | None" = None) -> None:
+    """
+    Закрывает общие пулы gRPC-каналов текущего процесса.
+
+    :param environment: Если передан — закрываются только пулы этого окружения,
+                        иначе закрываются все пулы процесса.
+    """
+    environment_id = id(environment) if environment is not None else None
+
+    with _pools_lock:
+        keys = [
+            key for key in _pools if environment is None or key[2] == environment_id
+        ]
+        pools = [_pools.pop(key) for key in keys]
+
+    for pool in pools:
+        pool.force_close()
@@ -1,6 +1,6 @@
 from typing import Any, TypedDict
 
-from httpx import URL, Client, QueryParams, Response
+from httpx import URL, AsyncClient, Client, QueryParams, Response
 
 
 class HTTPClientExtensions(TypedDict, total=False):
@@ -46,3 +46,46 @@ class HTTPClient:
         :return: Объект Response с данными ответа.
         """
         return self.client.post(url=url, json=json, extensions=extensions)
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    Асинхронный аналог HTTPClient для генераторов нагрузки на asyncio.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    """
+
+    def __init__(self, client: AsyncClient) -> None:
+        self.client = client
+
+    async def get(
+        self,
+        url: URL | str,
+        params: QueryParams | None = None,
+        extensions: HTTPClientExtensions | None = None,
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url, params=params, extensions=extensions)
+
+    async def post(
+        self,
+        url: str,
+        json: Any | None = None,
+        extensions: HTTPClientExtensions | None = None,
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.post(url=url, json=json, extensions=extensions)
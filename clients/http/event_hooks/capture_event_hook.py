@@ -0,0 +1,90 @@
+import json
+from typing import Any
+
+from httpx import Request, Response
+
+from replay.writer import TrafficEntry, TrafficWriter
+
+
+def get_request_body(request: Request) -> Any | None:
+    """
+    Возвращает тело запроса в виде JSON, если оно есть и является JSON.
+    """
+    if not request.content:
+        return None
+
+    try:
+        return json.loads(request.content)
+    except ValueError:
+        return None
+
+
+def capture_request_event_hook(writer: TrafficWriter):
+    """
+    Возвращает HTTPX event hook, ставящий запрос в очередь записи трафика
+    (формат replay.schema.TrafficRecord) в момент его отправки.
+
+    Решение о выборке (sampling) принимается здесь: невыбранные запросы
+    дальше не стоят ничего, кроме проверки одного ключа в extensions.
+    Тело запроса разбирается и сериализуется в фоновом потоке TrafficWriter.
+
+    :param writer: Фоновая запись журнала трафика.
+    :return: Функция-хук для HTTPX request event hook.
+    """
+
+    def inner(request: Request) -> None:
+        entry = writer.start(
+            lambda: {
+                "method": request.method,
+                "route": request.url.raw_path.decode(),
+                "name": request.extensions.get("route"),
+                "body": get_request_body(request),
+            }
+        )
+        if entry is not None:
+            request.extensions["capture"] = entry
+
+    return inner
+
+
+def capture_response_event_hook(writer: TrafficWriter):
+    """
+    Возвращает HTTPX event hook, дописывающий статус ответа в запись журнала трафика,
+    поставленную в очередь capture_request_event_hook.
+
+    Тело ответа не читается, чтобы не мешать потоковому чтению ответа клиентом.
+
+    :param writer: Фоновая запись журнала трафика.
+    :return: Функция-хук для HTTPX response event hook.
+    """
+
+    def inner(response: Response) -> None:
+        entry: TrafficEntry | None = response.request.extensions.get("capture")
+        if entry is not None:
+            entry.complete(response.status_code)
+
+    return inner
+
+
+def capture_async_request_event_hook(writer: TrafficWriter):
+    """
+    Асинхронный вариант capture_request_event_hook для httpx.AsyncClient.
+    """
+    hook = capture_request_event_hook(writer)
+
+    async def async_inner(request: Request) -> None:
+        hook(request)
+
+    return async_inner
+
+
+def capture_async_response_event_hook(writer: TrafficWriter):
+    """
+    Асинхронный вариант capture_response_event_hook для httpx.AsyncClient.
+    """
+    hook = capture_response_event_hook(writer)
+
+    async def async_inner(response: Response) -> None:
+        hook(response)
+
+    return async_inner
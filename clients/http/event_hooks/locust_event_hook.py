@@ -1,60 +1,406 @@
 import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
-from locust.env import Environment
+from httpx import (
+    AsyncByteStream,
+    HTTPError,
+    HTTPStatusError,
+    Request,
+    Response,
+    SyncByteStream,
+)
+
+if TYPE_CHECKING:
+    # Импорт locust выполняет gevent monkey-patching, несовместимый с asyncio,
+    # поэтому окружение Locust импортируется только для аннотаций типов
+    from locust.env import Environment
+
+
+class HTTPRequestTimings:
+    """
+    Монотонные отметки времени фаз HTTP-запроса в наносекундах (time.perf_counter_ns).
+
+    В отличие от time.time(), perf_counter_ns не зависит от перевода системных часов
+    (например, NTP), поэтому подходит для измерения длительностей.
+
+    Фазы:
+    - queued — запрос передан клиенту (request event hook);
+    - connect_started — начато открытие нового TCP-соединения (если пул не дал готового);
+    - connection_acquired — соединение получено, начата отправка заголовков;
+    - request_sent — запрос полностью отправлен;
+    - first_byte — получены заголовки ответа (первый байт ответа);
+    - body_complete — тело ответа получено полностью.
+
+    Промежуточные отметки заполняются через httpx trace extension (см. trace/atrace).
+    """
+
+    __slots__ = (
+        "queued",
+        "connect_started",
+        "connection_acquired",
+        "request_sent",
+        "first_byte",
+        "body_complete",
+    )
+
+    def __init__(self) -> None:
+        self.queued: int = time.perf_counter_ns()
+        self.connect_started: int | None = None
+        self.connection_acquired: int | None = None
+        self.request_sent: int | None = None
+        self.first_byte: int | None = None
+        self.body_complete: int | None = None
+
+    def trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """
+        Callback для httpx trace extension.
+
+        :param event_name: Имя события httpcore, например "http11.send_request_headers.started".
+        :param info: Дополнительные данные события (не используются).
+        """
+        now = time.perf_counter_ns()
+
+        if event_name.endswith("connect_tcp.started"):
+            self.connect_started = self.connect_started or now
+        elif event_name.endswith("send_request_headers.started"):
+            self.connection_acquired = now
+        elif event_name.endswith("send_request_body.complete"):
+            self.request_sent = now
+        elif event_name.endswith("receive_response_headers.complete"):
+            self.first_byte = now
+
+    async def atrace(self, event_name: str, info: dict[str, Any]) -> None:
+        """
+        Асинхронный вариант trace: httpx.AsyncClient требует корутину.
+        """
+        self.trace(event_name, info)
+
+    def complete(self) -> None:
+        """
+        Фиксирует момент полного получения тела ответа.
+        """
+        self.body_complete = time.perf_counter_ns()
+
+    @property
+    def total(self) -> float:
+        """
+        Полное время запроса в миллисекундах: от постановки в очередь до получения тела.
+        """
+        end = self.body_complete or time.perf_counter_ns()
+        return (end - self.queued) / 1_000_000
+
+    def get_phases(self) -> dict[str, float]:
+        """
+        Возвращает длительности фаз в миллисекундах.
+
+        - pool_wait — ожидание свободного соединения в пуле;
+        - connect — открытие нового соединения (только если оно открывалось);
+        - send — отправка запроса;
+        - server — ожидание ответа после отправки (сеть + обработка на сервере);
+        - download — получение тела ответа.
+
+        Фазы, для которых нет обеих отметок, не возвращаются.
+        """
+        bounds = {
+            "pool_wait": (self.queued, self.connect_started or self.connection_acquired),
+            "connect": (self.connect_started, self.connection_acquired),
+            "send": (self.connection_acquired, self.request_sent),
+            "server": (self.request_sent, self.first_byte),
+            "download": (self.first_byte, self.body_complete),
+        }
+
+        return {
+            phase: (end - start) / 1_000_000
+            for phase, (start, end) in bounds.items()
+            if start is not None and end is not None
+        }
+
+
+class LocustResponseByteStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа, вызывающая callback после его закрытия.
+
+    httpx закрывает поток сразу после того, как тело ответа дочитано клиентом,
+    поэтому момент закрытия — это момент получения последнего байта. Сам поток
+    не буферизуется: байты проходят насквозь, тело материализуется один раз.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[], None]) -> None:
+        self.stream = stream
+        self.on_close = on_close
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self.stream
+
+    def close(self) -> None:
+        self.stream.close()
+
+        if not self.closed:
+            self.closed = True
+            self.on_close()
+
+
+class LocustAsyncResponseByteStream(AsyncByteStream):
+    """
+    Асинхронный вариант LocustResponseByteStream для httpx.AsyncClient.
+    """
+
+    def __init__(self, stream: AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self.stream = stream
+        self.on_close = on_close
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self.stream.aclose()
+
+        if not self.closed:
+            self.closed = True
+            self.on_close()
+
+
+def get_response_exception(response: Response) -> HTTPError | None:
+    """
+    Возвращает исключение для ответа с ошибочным статусом (4xx, 5xx) или None.
+
+    Исключение создаётся только для ошибочных ответов, успешные ответы
+    проверяются одним сравнением статуса.
+    """
+    if not response.is_error:
+        return None
+
+    try:
+        response.raise_for_status()
+    except HTTPStatusError as error:
+        return error
+
+    return None
+
+
+def get_response_length(response: Response) -> int:
+    """
+    Возвращает размер тела ответа без повторного чтения тела.
+
+    Используется счётчик байт, реально полученных из сетевого потока.
+    Если тело ещё не читалось, берётся значение заголовка Content-Length.
+    """
+    if response.num_bytes_downloaded:
+        return response.num_bytes_downloaded
+
+    try:
+        return int(response.headers.get("Content-Length", 0))
+    except ValueError:
+        return 0
+
+
+def get_request_length(request: Request) -> int:
+    """
+    Возвращает размер тела запроса по заголовку Content-Length, который httpx
+    выставляет для всех тел, кроме потоковых. Запрос без тела — 0.
+    """
+    try:
+        return int(request.headers.get("Content-Length", 0))
+    except ValueError:
+        return 0
+
+
+def fire_locust_request_event(
+    environment: "Environment",
+    response: Response,
+    exception: HTTPError | None,
+    response_length: int,
+    report_phases: bool = False,
+) -> None:
+    """
+    Отправляет метрики завершённого HTTP-запроса в `environment.events.request`.
+
+    При report_phases=True дополнительно отправляет длительности фаз запроса
+    отдельными метриками с типом "HTTP:<фаза>" (например, "HTTP:pool_wait")
+    и тем же именем, что и у основного запроса.
+
+    В context передаются версия HTTP и размер тела запроса (request_length),
+    как у gRPC-вызовов в LocustInterceptor.
+
+    Если запрос прошёл через общий транспорт (SharedHTTPTransport), в context
+    попадает число одновременных потоков на момент отправки (streams). Отдельным
+    запросом в статистику Locust оно не отправляется, чтобы не искажать число
+    запросов и RPS: сводку конкурентности транспорт пишет в лог при закрытии.
+    """
+    request = response.request
+
+    # Получаем route, если он был передан через extensions, иначе используем raw path
+    route = request.extensions.get("route", request.url.path)
+    name = f"{request.method} {route}"
+
+    # Отметки времени, установленные в request event hook
+    timings: HTTPRequestTimings = request.extensions.get("timings") or HTTPRequestTimings()
+    timings.complete()
+
+    # Снимок конкурентности, сохранённый общим транспортом
+    concurrency: dict[str, int] | None = request.extensions.get("concurrency")
+
+    # Отправляем событие в Locust
+    environment.events.request.fire(
+        name=name,  # Имя запроса (метод + логическое имя маршрута)
+        context={
+            "http_version": response.http_version,
+            "request_length": get_request_length(request),  # Размер тела запроса в байтах
+            **(concurrency or {}),
+        },
+        response=response,  # Объект ответа (опционально)
+        exception=exception,  # Исключение, если оно произошло
+        request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
+        response_time=timings.total,  # Время выполнения запроса в мс
+        response_length=response_length,  # Размер тела ответа
+    )
+
+    if not report_phases:
+        return
+
+    for phase, phase_time in timings.get_phases().items():
+        environment.events.request.fire(
+            name=name,
+            context=None,
+            response=response,
+            exception=None,
+            request_type=f"HTTP:{phase}",
+            response_time=phase_time,
+            response_length=0,
+        )
 
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет монотонные отметки времени в `request.extensions["timings"]`,
+    чтобы потом использовать их для расчёта времени ответа.
     """
-    request.extensions["start_time"] = time.time()
+    request.extensions["timings"] = HTTPRequestTimings()
 
 
-def locust_response_event_hook(environment: Environment):
+def locust_trace_request_event_hook(request: Request) -> None:
+    """
+    Вариант locust_request_event_hook, дополнительно подключающий httpx trace extension.
+
+    Трассировка фиксирует промежуточные фазы запроса (ожидание пула, отправка,
+    первый байт ответа) и нужна только при отправке фазовых метрик в Locust.
+    """
+    timings = HTTPRequestTimings()
+    request.extensions["timings"] = timings
+    request.extensions["trace"] = timings.trace
+
+
+def locust_response_event_hook(
+    environment: "Environment", read_body: bool = True, report_phases: bool = False
+):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
 
-    Использует `request.extensions["start_time"]` для вычисления времени отклика.
+    Время отклика считается по монотонным отметкам HTTPRequestTimings из
+    `request.extensions["timings"]` (их сохраняет locust_request_event_hook): от передачи
+    запроса клиенту до полного получения тела ответа. Промежуточные фазы заполняет
+    httpx trace extension, если подключён locust_trace_request_event_hook.
     Извлекает route из `request.extensions["route"]`, если задан.
     Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
 
+    Режимы работы:
+    - read_body=True — тело ответа дочитывается прямо в хуке, размер ответа равен длине тела;
+    - read_body=False — хук не трогает тело ответа. Поток ответа оборачивается, и метрики
+      отправляются в момент его закрытия, то есть когда клиент сам дочитал тело.
+      Размер берётся из счётчика полученных байт (или Content-Length), время отклика
+      по-прежнему включает загрузку тела.
+
+    Если report_phases=True, в Locust дополнительно отправляются длительности фаз
+    запроса. Для этого вместе с хуком нужно использовать locust_trace_request_event_hook.
+
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param read_body: Дочитывать ли тело ответа внутри хука.
+    :param report_phases: Отправлять ли фазы запроса отдельными метриками.
     :return: Функция-хук для HTTPX response event hook.
     """
 
     def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
-
-        try:
-            # Проверка на статус ошибки (например, 500, 404 и т.д.)
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
-            exception = error
-
-        request = response.request
-
-        # Получаем route, если он был передан через extensions, иначе используем raw path
-        route = request.extensions.get("route", request.url.path)
-        # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
-
-        # Отправляем событие в Locust
-        environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
-            response=response,  # Объект ответа (опционально)
-            exception=exception,  # Исключение, если оно произошло
-            request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
-            response_length=response_length,  # Размер тела ответа
+        # Проверка на статус ошибки (например, 500, 404 и т.д.)
+        exception = get_response_exception(response)
+
+        if read_body:
+            response_length = len(response.read())
+            fire_locust_request_event(
+                environment, response, exception, response_length, report_phases
+            )
+            return
+
+        response.stream = LocustResponseByteStream(
+            response.stream,
+            on_close=lambda: fire_locust_request_event(
+                environment,
+                response,
+                exception,
+                get_response_length(response),
+                report_phases,
+            ),
+        )
+
+    return inner
+
+
+async def locust_async_request_event_hook(request: Request) -> None:
+    """
+    Асинхронный вариант locust_request_event_hook для httpx.AsyncClient.
+
+    httpx.AsyncClient требует, чтобы все event hooks были корутинами.
+    """
+    locust_request_event_hook(request)
+
+
+async def locust_async_trace_request_event_hook(request: Request) -> None:
+    """
+    Асинхронный вариант locust_trace_request_event_hook для httpx.AsyncClient.
+    """
+    timings = HTTPRequestTimings()
+    request.extensions["timings"] = timings
+    request.extensions["trace"] = timings.atrace
+
+
+def locust_async_response_event_hook(
+    environment: "Environment", read_body: bool = True, report_phases: bool = False
+):
+    """
+    Возвращает асинхронный HTTPX event hook для httpx.AsyncClient.
+
+    Поведение аналогично locust_response_event_hook, но тело ответа читается
+    через `await response.aread()`, не блокируя event loop.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param read_body: Дочитывать ли тело ответа внутри хука.
+    :param report_phases: Отправлять ли фазы запроса отдельными метриками.
+    :return: Корутина-хук для HTTPX response event hook.
+    """
+
+    async def async_inner(response: Response) -> None:
+        exception = get_response_exception(response)
+
+        if read_body:
+            response_length = len(await response.aread())
+            fire_locust_request_event(
+                environment, response, exception, response_length, report_phases
+            )
+            return
+
+        response.stream = LocustAsyncResponseByteStream(
+            response.stream,
+            on_close=lambda: fire_locust_request_event(
+                environment,
+                response,
+                exception,
+                get_response_length(response),
+                report_phases,
+            ),
         )
 
-    return inner
\ No newline at end of file
+    return async_inner
@@ -0,0 +1,160 @@
+from typing import TYPE_CHECKING
+
+from httpx import QueryParams, Response
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.accounts.schema import (
+    GetAccountsQuerySchema,
+    GetAccountsResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema,
+)
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client,
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AccountsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Словарь с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get(
+            "/api/v1/accounts",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route="/api/v1/accounts"),
+        )
+
+    async def open_deposit_account_api(
+        self, request: OpenDepositAccountRequestSchema
+    ) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-deposit-account",
+            json=request.model_dump(by_alias=True),
+        )
+
+    async def open_savings_account_api(
+        self, request: OpenSavingsAccountRequestSchema
+    ) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-savings-account",
+            json=request.model_dump(by_alias=True),
+        )
+
+    async def open_debit_card_account_api(
+        self, request: OpenDebitCardAccountRequestSchema
+    ) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-debit-card-account",
+            json=request.model_dump(by_alias=True),
+        )
+
+    async def open_credit_card_account_api(
+        self, request: OpenCreditCardAccountRequestSchema
+    ) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-credit-card-account",
+            json=request.model_dump(by_alias=True),
+        )
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+        query = GetAccountsQuerySchema(userId=user_id)
+        response = await self.get_accounts_api(query)
+        return GetAccountsResponseSchema.model_validate_json(response.content)
+
+    async def open_deposit_account(
+        self, user_id: str
+    ) -> OpenDepositAccountResponseSchema:
+        request = OpenDepositAccountRequestSchema(userId=user_id)
+        response = await self.open_deposit_account_api(request)
+        return OpenDepositAccountResponseSchema.model_validate_json(response.content)
+
+    async def open_savings_account(
+        self, user_id: str
+    ) -> OpenSavingsAccountResponseSchema:
+        request = OpenSavingsAccountRequestSchema(userId=user_id)
+        response = await self.open_savings_account_api(request)
+        return OpenSavingsAccountResponseSchema.model_validate_json(response.content)
+
+    async def open_debit_card_account(
+        self, user_id: str
+    ) -> OpenDebitCardAccountResponseSchema:
+        request = OpenDebitCardAccountRequestSchema(userId=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return OpenDebitCardAccountResponseSchema.model_validate_json(response.content)
+
+    async def open_credit_card_account(
+        self, user_id: str
+    ) -> OpenCreditCardAccountResponseSchema:
+        request = OpenCreditCardAccountRequestSchema(userId=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return OpenCreditCardAccountResponseSchema.model_validate_json(response.content)
+
+
+def build_accounts_gateway_async_http_client() -> AccountsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayAsyncHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AccountsGatewayAsyncHTTPClient.
+    """
+    return AccountsGatewayAsyncHTTPClient(
+        client=build_gateway_async_http_client(service="accounts")
+    )
+
+
+def build_accounts_gateway_locust_async_http_client(
+    environment: "Environment",
+) -> AccountsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AccountsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return AccountsGatewayAsyncHTTPClient(
+        client=build_gateway_locust_async_http_client(environment, service="accounts")
+    )
@@ -34,10 +34,8 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.get(
             "/api/v1/accounts",
-            params=QueryParams(
-                **query.model_dump(by_alias=True),
-                extensions=HTTPClientExtensions(route="/api/v1/accounts")
-            ),
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route="/api/v1/accounts"),
         )
 
     def open_deposit_account_api(
@@ -99,19 +97,19 @@ class AccountsGatewayHTTPClient(HTTPClient):
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
         query = GetAccountsQuerySchema(userId=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return GetAccountsResponseSchema.model_validate_json(response.content)
 
     # Добавили новый метод
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
         request = OpenDepositAccountRequestSchema(userId=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return OpenDepositAccountResponseSchema.model_validate_json(response.content)
 
     # Добавили новый метод
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
         request = OpenSavingsAccountRequestSchema(userId=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return OpenSavingsAccountResponseSchema.model_validate_json(response.content)
 
     # Добавили новый метод
     def open_debit_card_account(
@@ -119,7 +117,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
     ) -> OpenDebitCardAccountResponseSchema:
         request = OpenDebitCardAccountRequestSchema(userId=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return OpenDebitCardAccountResponseSchema.model_validate_json(response.content)
 
     # Добавили новый метод
     def open_credit_card_account(
@@ -127,7 +125,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
     ) -> OpenCreditCardAccountResponseSchema:
         request = OpenCreditCardAccountRequestSchema(userId=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return OpenCreditCardAccountResponseSchema.model_validate_json(response.content)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
@@ -136,7 +134,9 @@ def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
 
     :return: Готовый к использованию AccountsGatewayHTTPClient.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_http_client())
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_http_client(service="accounts")
+    )
 
 
 def build_accounts_gateway_locust_http_client(
@@ -152,5 +152,5 @@ def build_accounts_gateway_locust_http_client(
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
     return AccountsGatewayHTTPClient(
-        client=build_gateway_locust_http_client(environment)
+        client=build_gateway_locust_http_client(environment, service="accounts")
     )
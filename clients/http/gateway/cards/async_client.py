@@ -0,0 +1,92 @@
+from typing import TYPE_CHECKING
+
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient
+from clients.http.gateway.cards.schema import (
+    IssuePhysicalCardRequestSchema,
+    IssuePhysicalCardResponseSchema,
+    IssueVirtualCardRequestSchema,
+    IssueVirtualCardResponseSchema,
+)
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client,
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class CardsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(
+        self, request: IssueVirtualCardRequestSchema
+    ) -> Response:
+        """
+        Создание новой виртуальной карты.
+
+        :param request: Данные с идентификаторами пользователя и счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/cards/issue-virtual-card", json=request.model_dump(by_alias=True)
+        )
+
+    async def issue_physical_card_api(
+        self, request: IssuePhysicalCardRequestSchema
+    ) -> Response:
+        """
+        Создание новой физической карты.
+
+        :param request: Данные с идентификаторами пользователя и счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/cards/issue-physical-card", json=request.model_dump(by_alias=True)
+        )
+
+    async def issue_virtual_card(
+        self, user_id: str, account_id: str
+    ) -> IssueVirtualCardResponseSchema:
+        request = IssueVirtualCardRequestSchema(userId=user_id, accountId=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return IssueVirtualCardResponseSchema.model_validate_json(response.content)
+
+    async def issue_physical_card(
+        self, user_id: str, account_id: str
+    ) -> IssuePhysicalCardResponseSchema:
+        request = IssuePhysicalCardRequestSchema(userId=user_id, accountId=account_id)
+        response = await self.issue_physical_card_api(request)
+        return IssuePhysicalCardResponseSchema.model_validate_json(response.content)
+
+
+def build_cards_gateway_async_http_client() -> CardsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию CardsGatewayAsyncHTTPClient.
+    """
+    return CardsGatewayAsyncHTTPClient(
+        client=build_gateway_async_http_client(service="cards")
+    )
+
+
+def build_cards_gateway_locust_async_http_client(
+    environment: "Environment",
+) -> CardsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр CardsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return CardsGatewayAsyncHTTPClient(
+        client=build_gateway_locust_async_http_client(environment, service="cards")
+    )
@@ -54,7 +54,7 @@ class CardsGatewayHTTPClient(HTTPClient):
     ) -> IssueVirtualCardResponseSchema:
         request = IssueVirtualCardRequestSchema(userId=user_id, accountId=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return IssueVirtualCardResponseSchema.model_validate_json(response.content)
 
     # Добавили новый метод
     def issue_physical_card(
@@ -62,7 +62,7 @@ class CardsGatewayHTTPClient(HTTPClient):
     ) -> IssuePhysicalCardResponseSchema:
         request = IssuePhysicalCardRequestSchema(userId=user_id, accountId=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return IssuePhysicalCardResponseSchema.model_validate_json(response.content)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -71,7 +71,7 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
 
     :return: Готовый к использованию CardsGatewayHTTPClient.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_http_client())
+    return CardsGatewayHTTPClient(client=build_gateway_http_client(service="cards"))
 
 
 def build_cards_gateway_locust_http_client(
@@ -86,4 +86,6 @@ def build_cards_gateway_locust_http_client(
     :param environment: объект окружения Locust.
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return CardsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, service="cards")
+    )
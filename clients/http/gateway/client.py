@@ -1,24 +1,77 @@
 import logging
+from typing import TYPE_CHECKING
 
-from httpx import Client
-from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
+from httpx import AsyncClient, AsyncHTTPTransport, Client, Limits
 
+from clients.http.event_hooks.capture_event_hook import (
+    capture_async_request_event_hook,  # Асинхронный хук выборки запроса для записи трафика
+    capture_async_response_event_hook,  # Асинхронный хук записи трафика
+    capture_request_event_hook,  # Хук выборки запроса для записи трафика
+    capture_response_event_hook,  # Хук записи пары запрос/ответ в журнал трафика
+)
 from clients.http.event_hooks.locust_event_hook import (
+    locust_async_request_event_hook,  # Асинхронный хук начала запроса
+    locust_async_response_event_hook,  # Асинхронный хук сбора метрик
+    locust_async_trace_request_event_hook,  # Асинхронный хук начала запроса с трассировкой фаз
     locust_request_event_hook,  # Хук для отслеживания начала запроса
     locust_response_event_hook,  # Хук для сбора метрик по завершении запроса
+    locust_trace_request_event_hook,  # Хук начала запроса с трассировкой фаз
+)
+from clients.http.transport import (
+    build_http_transport_limits,
+    get_http_versions,
+    get_shared_http_transport,
 )
+from config import HTTPClientConfig, settings
+from replay.writer import get_traffic_writer
+
+if TYPE_CHECKING:
+    # Импорт locust выполняет gevent monkey-patching, несовместимый с asyncio,
+    # поэтому окружение Locust импортируется только для аннотаций типов
+    from locust.env import Environment
 
+def build_gateway_http_transport_limits(config: HTTPClientConfig) -> Limits:
+    """
+    Создаёт лимиты пула соединений из настроек HTTP-клиента.
 
-def build_gateway_http_client() -> Client:
+    :param config: Настройки HTTP-клиента.
+    :return: Объект httpx.Limits.
+    """
+    return build_http_transport_limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+
+def build_gateway_http_client(service: str | None = None) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
+    Клиент использует общий для процесса пул соединений к http-gateway.
+    Адрес, таймаут и размер пула берутся из настроек (config.settings).
+
+    :param service: Имя сервиса (users, accounts и т.д.) для применения его переопределений.
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    config = settings.get_gateway_http_client_config(service)
+
+    return Client(
+        timeout=config.timeout,
+        base_url=config.client_url,
+        transport=get_shared_http_transport(
+            config.client_url,
+            limits=build_gateway_http_transport_limits(config),
+            http2=config.http2,
+        ),
+    )
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_locust_http_client(
+    environment: "Environment",
+    report_phases: bool | None = None,
+    service: str | None = None,
+) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -30,20 +83,139 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Хук не дочитывает тело ответа сам: метрики отправляются, когда тело уже
+    прочитано клиентом, поэтому ответ материализуется в памяти ровно один раз.
+
+    Все клиенты, собранные для одного окружения Locust в рамках воркера, используют
+    общий пул соединений (см. clients.http.transport), поэтому, например,
+    UsersGatewayHTTPClient и AccountsGatewayHTTPClient переиспользуют одни и те же сокеты.
+
+    С http2=True в настройках клиент работает по HTTP/2: сессии всех виртуальных
+    пользователей воркера мультиплексируются поверх нескольких соединений вместо
+    отдельного HTTP/1.1 соединения на каждого пользователя.
+
+    С report_phases=True в Locust дополнительно уходят фазы каждого запроса
+    (HTTP:pool_wait, HTTP:connect, HTTP:send, HTTP:server, HTTP:download), что позволяет
+    отделить ожидание соединения в пуле от задержки самого сервера.
+
+    С CAPTURE.ENABLED=true запросы дополнительно записываются в журнал трафика
+    для последующего проигрывания (см. replay.writer.TrafficWriter).
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param report_phases: Отправлять ли фазы запросов отдельными метриками.
+                          None — значение из настроек (report_phases).
+    :param service: Имя сервиса (users, accounts и т.д.) для применения его переопределений.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
+    config = settings.get_gateway_http_client_config(service)
+    if report_phases is None:
+        report_phases = config.report_phases
+
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
+    # Отмечаем время начала запроса
+    request_hooks = [
+        locust_trace_request_event_hook if report_phases else locust_request_event_hook
+    ]
+    # Собираем метрики и передаём их в Locust
+    response_hooks = [
+        locust_response_event_hook(environment, read_body=False, report_phases=report_phases)
+    ]
+
+    if settings.capture.enabled:
+        # Хуки записи трафика стоят снаружи хуков Locust, чтобы не попадать в замер времени
+        writer = get_traffic_writer()
+        request_hooks.insert(0, capture_request_event_hook(writer))
+        response_hooks.append(capture_response_event_hook(writer))
+
     return Client(
-        timeout=100,
-        base_url="http://localhost:8003",
+        timeout=config.timeout,
+        base_url=config.client_url,
+        transport=get_shared_http_transport(
+            config.client_url,
+            environment,
+            limits=build_gateway_http_transport_limits(config),
+            http2=config.http2,
+        ),
+        event_hooks={
+            "request": request_hooks,
+            "response": response_hooks,
+        },
+    )
+
+
+def build_gateway_async_http_client(service: str | None = None) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    Асинхронный транспорт привязан к event loop, поэтому не разделяется через
+    реестр общих транспортов: один AsyncClient рассчитан на переиспользование
+    множеством корутин внутри одного event loop.
+
+    :param service: Имя сервиса (users, accounts и т.д.) для применения его переопределений.
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    config = settings.get_gateway_http_client_config(service)
+
+    return AsyncClient(
+        timeout=config.timeout,
+        base_url=config.client_url,
+        transport=AsyncHTTPTransport(
+            limits=build_gateway_http_transport_limits(config),
+            **get_http_versions(config.client_url, config.http2),
+        ),
+    )
+
+
+def build_gateway_locust_async_http_client(
+    environment: "Environment",
+    report_phases: bool | None = None,
+    service: str | None = None,
+) -> AsyncClient:
+    """
+    Асинхронный HTTP-клиент для нагрузочного тестирования с отправкой метрик в Locust.
+
+    Аналог build_gateway_locust_http_client для генераторов нагрузки на asyncio.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param report_phases: Отправлять ли фазы запросов отдельными метриками.
+                          None — значение из настроек (report_phases).
+    :param service: Имя сервиса (users, accounts и т.д.) для применения его переопределений.
+    :return: httpx.AsyncClient с подключёнными хуками под нагрузочное тестирование.
+    """
+    config = settings.get_gateway_http_client_config(service)
+    if report_phases is None:
+        report_phases = config.report_phases
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    request_hooks = [
+        locust_async_trace_request_event_hook
+        if report_phases
+        else locust_async_request_event_hook
+    ]
+    response_hooks = [
+        locust_async_response_event_hook(
+            environment, read_body=False, report_phases=report_phases
+        )
+    ]
+
+    if settings.capture.enabled:
+        writer = get_traffic_writer()
+        request_hooks.insert(0, capture_async_request_event_hook(writer))
+        response_hooks.append(capture_async_response_event_hook(writer))
+
+    return AsyncClient(
+        timeout=config.timeout,
+        base_url=config.client_url,
+        transport=AsyncHTTPTransport(
+            limits=build_gateway_http_transport_limits(config),
+            **get_http_versions(config.client_url, config.http2),
+        ),
         event_hooks={
-            "request": [locust_request_event_hook],  # Отмечаем время начала запроса
-            "response": [
-                locust_response_event_hook(environment)
-            ],  # Собираем метрики и передаём их в Locust
+            "request": request_hooks,
+            "response": response_hooks,
         },
     )
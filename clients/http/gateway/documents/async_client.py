@@ -0,0 +1,90 @@
+from typing import TYPE_CHECKING
+
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client,
+)
+from clients.http.gateway.documents.schema import (
+    GetContractDocumentResponseSchema,
+    GetTariffDocumentResponseSchema,
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class DocumentsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить тарифа по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/tariff-document/{account_id}",
+            extensions=HTTPClientExtensions(
+                route="/api/v1/documents/tariff-document/{account_id}"
+            ),
+        )
+
+    async def get_tariff_document(
+        self, account_id: str
+    ) -> GetTariffDocumentResponseSchema:
+        response = await self.get_tariff_document_api(account_id)
+        return GetTariffDocumentResponseSchema.model_validate_json(response.content)
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить контракта по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/contract-document/{account_id}",
+            extensions=HTTPClientExtensions(
+                route="/api/v1/documents/contract-document/{account_id}"
+            ),
+        )
+
+    async def get_contract_document(
+        self, account_id: str
+    ) -> GetContractDocumentResponseSchema:
+        response = await self.get_contract_document_api(account_id)
+        return GetContractDocumentResponseSchema.model_validate_json(response.content)
+
+
+def build_documents_gateway_async_http_client() -> DocumentsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр DocumentsGatewayAsyncHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию DocumentsGatewayAsyncHTTPClient.
+    """
+    return DocumentsGatewayAsyncHTTPClient(
+        client=build_gateway_async_http_client(service="documents")
+    )
+
+
+def build_documents_gateway_locust_async_http_client(
+    environment: "Environment",
+) -> DocumentsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр DocumentsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр DocumentsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return DocumentsGatewayAsyncHTTPClient(
+        client=build_gateway_locust_async_http_client(environment, service="documents")
+    )
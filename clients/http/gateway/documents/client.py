@@ -34,7 +34,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
 
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return GetTariffDocumentResponseSchema.model_validate_json(response.content)
 
     def get_contract_document_api(self, account_id: str) -> Response:
         """
@@ -54,7 +54,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         self, account_id: str
     ) -> GetContractDocumentResponseSchema:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return GetContractDocumentResponseSchema.model_validate_json(response.content)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -63,7 +63,9 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
 
     :return: Готовый к использованию DocumentsGatewayHTTPClient.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_http_client(service="documents")
+    )
 
 
 def build_documents_gateway_locust_http_client(
@@ -79,5 +81,5 @@ def build_documents_gateway_locust_http_client(
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
     return DocumentsGatewayHTTPClient(
-        client=build_gateway_locust_http_client(environment)
+        client=build_gateway_locust_http_client(environment, service="documents")
     )
@@ -48,8 +48,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         )
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
-        response = self.get_operations_api(account_id)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        query = GetOperationQuerySchema(accountId=account_id)
+        response = self.get_operations_api(query)
+        return GetOperationsResponseSchema.model_validate_json(response.content)
 
     def get_operation_api(self, operation_id: str) -> Response:
         """
@@ -65,7 +66,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
 
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return GetOperationResponseSchema.model_validate_json(response.content)
 
     def get_operation_receipt_api(self, operation_id: str) -> Response:
         """
@@ -85,7 +86,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         self, operation_id: str
     ) -> GetOperationReceiptResponseSchema:
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return GetOperationReceiptResponseSchema.model_validate_json(response.content)
 
     def get_operation_summary_api(self, query: GetOperationQuerySchema) -> Response:
         """
@@ -105,8 +106,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
     def get_operation_summary(
         self, account_id: str
     ) -> GetOperationSummaryResponseSchema:
-        response = self.get_operation_summary_api(account_id)
-        return GetOperationSummaryResponseSchema.model_validate_json(response.text)
+        query = GetOperationQuerySchema(accountId=account_id)
+        response = self.get_operation_summary_api(query)
+        return GetOperationSummaryResponseSchema.model_validate_json(response.content)
 
     def make_fee_operation_api(
         self, request: MakeFeeOperationRequestSchema
@@ -127,7 +129,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
     ) -> MakeFeeOperationResponseSchema:
         request = MakeFeeOperationRequestSchema(cardId=card_id, accountId=account_id)
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return MakeFeeOperationResponseSchema.model_validate_json(response.content)
 
     def make_top_up_operation_api(
         self, request: MakeTopUpOperationRequestSchema
@@ -150,7 +152,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             card_id=card_id, account_id=account_id
         )
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return MakeTopUpOperationResponseSchema.model_validate_json(response.content)
 
     def make_cashback_operation_api(
         self, request: MakeCashbackOperationRequestSchema
@@ -173,7 +175,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             cardId=card_id, accountId=account_id
         )
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return MakeCashbackOperationResponseSchema.model_validate_json(response.content)
 
     def make_transfer_operation_api(
         self, request: MakeTransferOperationRequestSchema
@@ -196,7 +198,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             cardId=card_id, accountId=account_id
         )
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return MakeTransferOperationResponseSchema.model_validate_json(response.content)
 
     def make_purchase_operation_api(
         self, request: MakePurchaseOperationRequestSchema
@@ -220,7 +222,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             accountId=account_id,
         )
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return MakePurchaseOperationResponseSchema.model_validate_json(response.content)
 
     def make_bill_payment_operation_api(
         self, request: MakeBillPaymentOperationRequestSchema
@@ -243,7 +245,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             cardId=card_id, accountId=account_id
         )
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.content)
 
     def make_cash_withdrawal_operation_api(
         self, request: MakeCashWithdrawalOperationRequestSchema
@@ -267,7 +269,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         )
         response = self.make_cash_withdrawal_operation_api(request)
         return MakeCashWithdrawalOperationResponseSchema.model_validate_json(
-            response.text
+            response.content
         )
 
 
@@ -277,7 +279,9 @@ def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
 
     :return: Готовый к использованию UsersGatewayHTTPClient.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_http_client())
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_http_client(service="operations")
+    )
 
 
 def build_operations_gateway_locust_http_client(
@@ -293,5 +297,5 @@ def build_operations_gateway_locust_http_client(
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
     return OperationsGatewayHTTPClient(
-        client=build_gateway_locust_http_client(environment)
+        client=build_gateway_locust_http_client(environment, service="operations")
     )
@@ -0,0 +1,81 @@
+from typing import TYPE_CHECKING
+
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client,
+)
+from clients.http.gateway.users.schema import (
+    CreateUserRequestSchema,
+    CreateUserResponseSchema,
+    GetUserResponseSchema,
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class UsersGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/users/{user_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/users/{user_id}"),
+        )
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Словарь с данными нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/users", json=request.model_dump(by_alias=True))
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return GetUserResponseSchema.model_validate_json(response.content)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return CreateUserResponseSchema.model_validate_json(response.content)
+
+
+def build_users_gateway_async_http_client() -> UsersGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр UsersGatewayAsyncHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию UsersGatewayAsyncHTTPClient.
+    """
+    return UsersGatewayAsyncHTTPClient(
+        client=build_gateway_async_http_client(service="users")
+    )
+
+
+def build_users_gateway_locust_async_http_client(
+    environment: "Environment",
+) -> UsersGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр UsersGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр UsersGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return UsersGatewayAsyncHTTPClient(
+        client=build_gateway_locust_async_http_client(environment, service="users")
+    )
@@ -39,12 +39,12 @@ class UsersGatewayHTTPClient(HTTPClient):
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        return response.json()
+        return GetUserResponseSchema.model_validate_json(response.content)
 
     def create_user(self) -> CreateUserResponseSchema:
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return CreateUserResponseSchema.model_validate_json(response.content)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -53,7 +53,7 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
 
     :return: Готовый к использованию UsersGatewayHTTPClient.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_http_client())
+    return UsersGatewayHTTPClient(client=build_gateway_http_client(service="users"))
 
 def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
     """
@@ -65,4 +65,6 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     :param environment: объект окружения Locust.
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return UsersGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, service="users")
+    )
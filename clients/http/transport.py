@@ -0,0 +1,255 @@
+import logging
+import os
+from threading import Lock
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from httpx import HTTPTransport, Limits, Request, Response
+
+from clients.http.event_hooks.locust_event_hook import LocustResponseByteStream
+
+if TYPE_CHECKING:
+    # Импорт locust выполняет gevent monkey-patching, несовместимый с asyncio,
+    # поэтому окружение Locust импортируется только для аннотаций типов
+    from locust.env import Environment
+
+# Ключ реестра: (PID процесса, base URL, идентификатор окружения Locust, HTTP/2).
+# PID нужен, чтобы форкнутые воркеры Locust не унаследовали сокеты родителя.
+SharedHTTPTransportKey = tuple[int, str, int | None, bool]
+
+logger = logging.getLogger(__name__)
+
+
+class SharedHTTPTransport(HTTPTransport):
+    """
+    HTTP-транспорт (пул соединений), разделяемый между несколькими httpx.Client.
+
+    Обычный httpx.Client при закрытии закрывает и свой транспорт. Для общего
+    транспорта это недопустимо: закрытие одного клиента оборвало бы соединения
+    остальных. Поэтому close() и __exit__ здесь ничего не делают, а реальное
+    закрытие пула выполняется только через реестр (close_shared_http_transports).
+
+    Транспорт также считает запросы, которые выполняются в данный момент (потоки):
+    запрос занимает поток от отправки до закрытия тела ответа. В режиме HTTP/2
+    потоки мультиплексируются поверх нескольких соединений, поэтому отношение
+    потоков к соединениям показывает, насколько плотно используются сокеты.
+
+    Число потоков на момент отправки сохраняется в `request.extensions["concurrency"]`,
+    сводка (среднее и максимум потоков, максимум соединений) пишется в лог
+    при закрытии транспорта (см. get_concurrency_stats). Соединения пула считаются
+    не на каждом запросе, а только при новом максимуме потоков.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.streams_lock = Lock()
+        self.active_streams = 0
+        self.max_active_streams = 0
+        self.max_connections = 0
+        self.requests = 0
+        self.total_streams = 0
+
+    def get_connections(self) -> int:
+        """
+        Возвращает число открытых соединений пула httpcore.
+
+        У httpx.HTTPTransport нет публичного доступа к пулу, поэтому атрибут
+        читается защищённо: при другой внутренней структуре httpx вернётся 0.
+        """
+        pool = getattr(self, "_pool", None)
+        return len(getattr(pool, "connections", ()))
+
+    def handle_request(self, request: Request) -> Response:
+        with self.streams_lock:
+            self.active_streams += 1
+            self.requests += 1
+            self.total_streams += self.active_streams
+            streams = self.active_streams
+            is_peak = streams > self.max_active_streams
+            if is_peak:
+                self.max_active_streams = streams
+
+        request.extensions["concurrency"] = {"streams": streams}
+
+        try:
+            response = super().handle_request(request)
+        except BaseException:
+            self.release_stream()
+            raise
+
+        # Пул расширяется под нагрузкой: соединения считаются уже после того,
+        # как запрос получил своё, и только на пиках потоков — не на каждом запросе
+        if is_peak:
+            connections = self.get_connections()
+            with self.streams_lock:
+                self.max_connections = max(self.max_connections, connections)
+
+        # Поток освобождается, когда клиент дочитал и закрыл тело ответа
+        response.stream = LocustResponseByteStream(
+            response.stream, on_close=self.release_stream
+        )
+        return response
+
+    def release_stream(self) -> None:
+        with self.streams_lock:
+            self.active_streams -= 1
+
+    def close(self) -> None:
+        # Закрытие клиента не должно закрывать общий пул соединений
+        pass
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        pass
+
+    def get_concurrency_stats(self) -> dict[str, float]:
+        """
+        Возвращает сводку конкурентности потоков за время жизни транспорта.
+
+        :return: Словарь: requests — число запросов, mean_streams — среднее число
+                 одновременных потоков на момент отправки, max_streams — максимум потоков,
+                 max_connections — максимум соединений, connections — открыто сейчас.
+        """
+        with self.streams_lock:
+            return {
+                "requests": self.requests,
+                "mean_streams": self.total_streams / self.requests if self.requests else 0,
+                "max_streams": self.max_active_streams,
+                "max_connections": max(self.max_connections, self.get_connections()),
+                "connections": self.get_connections(),
+            }
+
+    def force_close(self) -> None:
+        """
+        Принудительно закрывает пул соединений транспорта.
+        """
+        stats = self.get_concurrency_stats()
+        logger.info(
+            "Shared HTTP transport closed: %s requests, mean streams %.1f, "
+            "max streams %s, max connections %s",
+            stats["requests"],
+            stats["mean_streams"],
+            stats["max_streams"],
+            stats["max_connections"],
+        )
+        super().close()
+
+
+_transports: dict[SharedHTTPTransportKey, SharedHTTPTransport] = {}
+_transports_lock = Lock()
+
+
+def build_http_transport_limits(
+    max_connections: int | None = 1000,
+    max_keepalive_connections: int | None = 1000,
+    keepalive_expiry: float | None = 30,
+) -> Limits:
+    """
+    Создаёт лимиты пула соединений для общего HTTP-транспорта.
+
+    Значения по умолчанию рассчитаны на тысячи виртуальных пользователей в одном
+    воркере: соединения не закрываются между запросами и переиспользуются.
+
+    :param max_connections: Максимальное число одновременно открытых соединений.
+    :param max_keepalive_connections: Сколько простаивающих соединений держать открытыми.
+    :param keepalive_expiry: Через сколько секунд простоя закрывать keep-alive соединение.
+    :return: Объект httpx.Limits.
+    """
+    return Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def get_http_versions(base_url: str, http2: bool = False) -> dict[str, bool]:
+    """
+    Возвращает параметры http1/http2 для транспорта httpx.
+
+    По TLS версия протокола согласуется через ALPN. Для открытого http://
+    согласования нет, поэтому в режиме HTTP/2 HTTP/1.1 отключается и используется
+    HTTP/2 с предварительным знанием (h2c prior knowledge): сервер должен его поддерживать.
+
+    :param base_url: Базовый URL сервиса.
+    :param http2: Использовать ли HTTP/2.
+    :return: Словарь с ключами http1 и http2 для HTTPTransport/AsyncHTTPTransport.
+    """
+    return {"http1": not (http2 and base_url.startswith("http://")), "http2": http2}
+
+
+def get_shared_http_transport(
+    base_url: str,
+    environment: "Environment | None" = None,
+    limits: Limits | None = None,
+    http2: bool = False,
+) -> SharedHTTPTransport:
+    """
+    Возвращает общий HTTP-транспорт для указанного base URL и окружения Locust.
+
+    Все клиенты, созданные в одном процессе (воркере) для одного и того же base URL
+    и окружения, получают один и тот же пул соединений. Это позволяет
+    UsersGatewayHTTPClient, AccountsGatewayHTTPClient и другим клиентам
+    переиспользовать сокеты вместо открытия собственного пула на каждый билд.
+
+    Лимиты применяются только при первом создании транспорта для ключа.
+
+    С http2=True транспорт работает по HTTP/2: запросы всех клиентов процесса
+    мультиплексируются потоками поверх нескольких соединений, новое соединение
+    открывается, только когда сервер исчерпал лимит одновременных потоков
+    (SETTINGS_MAX_CONCURRENT_STREAMS). Для HTTP/2 нужен пакет httpx[http2].
+
+    :param base_url: Базовый URL сервиса, например http://localhost:8003.
+    :param environment: Окружение Locust. None — транспорт вне нагрузочного теста.
+    :param limits: Лимиты пула соединений. По умолчанию build_http_transport_limits().
+    :param http2: Использовать ли HTTP/2.
+    :return: Экземпляр SharedHTTPTransport.
+    """
+    key: SharedHTTPTransportKey = (
+        os.getpid(),
+        base_url,
+        id(environment) if environment is not None else None,
+        http2,
+    )
+
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = SharedHTTPTransport(
+                limits=limits or build_http_transport_limits(),
+                **get_http_versions(base_url, http2),
+            )
+            _transports[key] = transport
+
+            # Закрываем пул вместе с окружением Locust, чтобы не оставлять висящих сокетов
+            if environment is not None:
+                environment.events.quitting.add_listener(
+                    lambda **_: close_shared_http_transports(environment)
+                )
+
+    return transport
+
+
+def close_shared_http_transports(environment: "Environment | None" = None) -> None:
+    """
+    Закрывает общие HTTP-транспорты текущего процесса.
+
+    :param environment: Если передан — закрываются только транспорты этого окружения,
+                        иначе закрываются все транспорты процесса.
+    """
+    environment_id = id(environment) if environment is not None else None
+
+    with _transports_lock:
+        keys = [
+            key
+            for key in _transports
+            if environment is None or key[2] == environment_id
+        ]
+        transports = [_transports.pop(key) for key in keys]
+
+    for transport in transports:
+        transport.force_close()
@@ -0,0 +1,90 @@
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from locust.log import setup_logging
+
+from compare.harness import TRANSPORTS, run_transport
+from compare.report import format_comparison_report, write_comparison_report
+from config import override_config, settings
+from tools.fakers import fake
+
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m compare",
+        description=(
+            "Прогоняет один и тот же смешанный сценарий поверх http-gateway и grpc-gateway "
+            "и сравнивает время ответа, пропускную способность, размер сообщений "
+            "и процессорное время клиента на запрос"
+        ),
+    )
+    parser.add_argument(
+        "--transports",
+        nargs="+",
+        choices=list(TRANSPORTS),
+        default=list(TRANSPORTS),
+        help="Транспорты в порядке прогона. Первый — база для отношения в отчёте",
+    )
+    parser.add_argument("--users", type=int, default=50, help="Число виртуальных пользователей")
+    parser.add_argument(
+        "--spawn-rate", type=float, default=10, help="Сколько пользователей запускать в секунду"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60, help="Окно измерения каждого транспорта, с"
+    )
+    parser.add_argument(
+        "--warmup",
+        type=float,
+        default=15,
+        help="Прогрев перед окном измерения, с (не меньше времени запуска пользователей)",
+    )
+    parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        help="Частота итераций сценария в секунду (открытая модель нагрузки, ARRIVAL_RATE.RATE)",
+    )
+    parser.add_argument("--csv", type=Path, help="Сохранить результаты в CSV")
+    return parser.parse_args()
+
+
+def main() -> None:
+    arguments = parse_arguments()
+    setup_logging("INFO")
+
+    settings.arrival_rate = override_config(settings.arrival_rate, rate=arguments.arrival_rate)
+
+    if settings.fake.seed is None:
+        logger.warning("FAKE.SEED is not set: transports will generate different test data")
+
+    # Общий идентификатор запуска: у каждого транспорта к нему добавляется своё имя
+    run_id = fake.run_id
+    results = [
+        run_transport(
+            transport,
+            users=arguments.users,
+            spawn_rate=arguments.spawn_rate,
+            duration=arguments.duration,
+            warmup=arguments.warmup,
+            run_id=run_id,
+            significant_figures=settings.histograms.significant_figures,
+        )
+        for transport in arguments.transports
+    ]
+
+    print(format_comparison_report(results))
+
+    if arguments.csv is not None:
+        write_comparison_report(results, arguments.csv)
+
+    invalid = [result.transport for result in results if not result.valid]
+    if invalid:
+        logger.error("Invalid results (no requests or users crashed): %s", invalid)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+import logging
+import time
+from typing import Any, NamedTuple
+
+import gevent
+from locust import User
+from locust.env import Environment
+from locust.event import Events
+from pydantic import BaseModel
+
+from locust_mixed_grpc import MixedGRPCScenarioUser
+from locust_mixed_http import MixedHTTPScenarioUser
+from metrics.histogram import LatencyHistogram
+from tools.locust_arrival_rate import reset_arrival_rate_schedulers
+from tools.locust_fakers import reset_user_fakes
+
+logger = logging.getLogger(__name__)
+
+# Перцентили времени ответа в сравнительном отчёте
+COMPARISON_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class ComparedTransport(NamedTuple):
+    """
+    Транспорт в сравнении: сценарий Locust и тип запросов, которые отправляют его клиенты.
+    """
+
+    user_class: type[User]
+    request_type: str
+
+
+# Сравниваемые транспорты: один и тот же смешанный сценарий (веса задач из
+# MIXED.WEIGHTS_PATH, одинаковое состояние пользователя) на клиентах http-gateway и grpc-gateway
+TRANSPORTS: dict[str, ComparedTransport] = {
+    "http": ComparedTransport(MixedHTTPScenarioUser, "HTTP"),
+    "grpc": ComparedTransport(MixedGRPCScenarioUser, "gRPC"),
+}
+
+
+class TransportComparisonResult(BaseModel):
+    """
+    Результат прогона сценария на одном транспорте за окно измерения.
+
+    :param transport: Имя транспорта, например "http".
+    :param requests: Число запросов.
+    :param failures: Число ошибочных запросов.
+    :param duration: Длительность окна измерения, с.
+    :param cpu_time: Процессорное время клиента (процесса Locust) за окно, с.
+    :param request_bytes: Суммарный размер тел запросов (сообщений gRPC), байт.
+    :param response_bytes: Суммарный размер тел ответов (сообщений gRPC), байт.
+    :param mean: Среднее время ответа, мс.
+    :param percentiles: Перцентили времени ответа {перцентиль: мс}.
+    :param max: Максимальное время ответа, мс.
+    :param errors: Число исключений в задачах пользователей (runner.exceptions)
+                   и упавших пользователей.
+    """
+
+    transport: str
+    requests: int
+    failures: int
+    duration: float
+    cpu_time: float
+    request_bytes: int
+    response_bytes: int
+    mean: float
+    percentiles: dict[float, float]
+    max: float
+    errors: int = 0
+
+    @property
+    def valid(self) -> bool:
+        """
+        Пригоден ли результат для сравнения: запросы были, а задачи пользователей
+        не падали. Если пользователи упали, результат описывает не сценарий,
+        а его обрывки (или пуст), и отношения метрик бессмысленны.
+        """
+        return self.requests > 0 and self.errors == 0
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.duration if self.duration else 0
+
+    def per_request(self, value: float) -> float:
+        return value / self.requests if self.requests else 0
+
+    @property
+    def cpu_per_request(self) -> float:
+        """
+        Процессорное время клиента на запрос, мкс.
+        """
+        return self.per_request(self.cpu_time) * 1_000_000
+
+
+class TransportStatsCollector:
+    """
+    Слушатель events.request, собирающий метрики запросов одного транспорта:
+    HDR-гистограмму времени ответа, число ошибок и размеры запросов и ответов.
+
+    Учитываются только основные метрики клиентов gateway (тип "HTTP" или "gRPC"),
+    фазы запросов ("HTTP:<фаза>") и служебные метрики сценария пропускаются.
+    """
+
+    def __init__(self, request_type: str, significant_figures: int = 3):
+        """
+        :param request_type: Тип запросов транспорта, например "HTTP".
+        :param significant_figures: Точность гистограммы времени ответа.
+        """
+        self.request_type = request_type
+        self.histogram = LatencyHistogram(significant_figures=significant_figures)
+        self.failures = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def on_request(
+        self,
+        request_type: str,
+        response_time: float,
+        response_length: int,
+        exception: Exception | None = None,
+        context: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> None:
+        if request_type != self.request_type:
+            return
+
+        # Время ответа хранится в микросекундах, как в metrics.sink
+        self.histogram.record_value(round(response_time * 1000))
+        self.response_bytes += response_length or 0
+        self.request_bytes += (context or {}).get("request_length", 0)
+        if exception is not None:
+            self.failures += 1
+
+    def reset(self) -> None:
+        self.histogram.reset()
+        self.failures = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def get_result(
+        self, transport: str, duration: float, cpu_time: float
+    ) -> TransportComparisonResult:
+        """
+        Возвращает результат прогона по собранным метрикам.
+
+        :param transport: Имя транспорта.
+        :param duration: Длительность окна измерения, с.
+        :param cpu_time: Процессорное время клиента за окно, с.
+        """
+        percentiles = self.histogram.get_percentiles(COMPARISON_PERCENTILES)
+        return TransportComparisonResult(
+            transport=transport,
+            requests=self.histogram.total_count,
+            failures=self.failures,
+            duration=duration,
+            cpu_time=cpu_time,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            mean=self.histogram.get_mean() / 1000,
+            percentiles={
+                percentile: value / 1000 for percentile, value in percentiles.items()
+            },
+            max=self.histogram.max_value / 1000,
+        )
+
+
+def run_transport(
+    transport: str,
+    users: int,
+    spawn_rate: float,
+    duration: float,
+    warmup: float,
+    run_id: str,
+    significant_figures: int = 3,
+) -> TransportComparisonResult:
+    """
+    Прогоняет сценарий транспорта в текущем процессе (Locust как библиотека).
+
+    Перед прогоном нумерация разделов тестовых данных начинается заново: с заданным
+    FAKE.SEED пользователи каждого транспорта генерируют те же данные, отличаются
+    только уникальные значения (email и телефоны), чтобы не создавать тех же
+    пользователей повторно.
+    Открытая модель нагрузки (ARRIVAL_RATE) начинает расписание заново.
+
+    Окружение получает собственный набор событий: слушатели прошлых прогонов
+    (статистика прежнего runner'а) не тратят процессорное время следующего.
+
+    :param transport: Имя транспорта из TRANSPORTS.
+    :param users: Число виртуальных пользователей.
+    :param spawn_rate: Сколько пользователей запускать в секунду.
+    :param duration: Длительность окна измерения, с.
+    :param warmup: Прогрев перед окном измерения, с: запуск пользователей, открытие
+                   соединений. Метрики прогрева в результат не входят. Если пользователи
+                   не успели запуститься, прогрев продлевается до конца их запуска.
+    :param run_id: Общий идентификатор запуска сравнения.
+    :param significant_figures: Точность гистограммы времени ответа.
+    :return: Результат прогона.
+    """
+    compared = TRANSPORTS[transport]
+
+    reset_user_fakes(run_id=f"{run_id}.{transport}")
+    reset_arrival_rate_schedulers()
+
+    environment = Environment(user_classes=[compared.user_class], events=Events())
+    collector = TransportStatsCollector(compared.request_type, significant_figures)
+    environment.events.request.add_listener(collector.on_request)
+
+    runner = environment.create_local_runner()
+    try:
+        logger.info(
+            "Running %s: %d users, warmup %ss, duration %ss", transport, users, warmup, duration
+        )
+        runner.start(users, spawn_rate)
+        gevent.sleep(warmup)
+
+        # Окно измерения начинается только после запуска всех пользователей: иначе
+        # транспорты сравниваются при разном числе пользователей, а ещё не запущенные
+        # пользователи неотличимы от упавших
+        if runner.spawning_greenlet is not None and not runner.spawning_greenlet.ready():
+            logger.warning(
+                "Users of %s are still spawning after %ss warmup, waiting for them",
+                transport,
+                warmup,
+            )
+            runner.spawning_greenlet.join()
+
+        collector.reset()
+        started, cpu_started = time.perf_counter(), time.process_time()
+        gevent.sleep(duration)
+        result = collector.get_result(
+            transport,
+            duration=time.perf_counter() - started,
+            cpu_time=time.process_time() - cpu_started,
+        )
+        # Пользователи, упавшие вне задач (например, в on_start), в runner.exceptions
+        # не попадают: их greenlet'ы просто завершаются
+        crashed_users = max(users - runner.user_count, 0)
+    finally:
+        runner.quit()
+
+    result.errors = crashed_users + sum(error["count"] for error in runner.exceptions.values())
+    if result.errors:
+        logger.error("Scenario %s: %d users crashed or raised errors", transport, result.errors)
+    if not result.requests:
+        logger.error("Scenario %s sent no requests in the measurement window", transport)
+
+    return result
@@ -0,0 +1,94 @@
+import csv
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from compare.harness import COMPARISON_PERCENTILES, TransportComparisonResult
+
+# Строки сравнительного отчёта: подпись и значение из результата прогона
+ComparisonMetric = tuple[str, Callable[[TransportComparisonResult], float]]
+
+
+def get_percentile_metric(percentile: float) -> ComparisonMetric:
+    return f"p{percentile:g}, ms", lambda result: result.percentiles[percentile]
+
+
+COMPARISON_METRICS: list[ComparisonMetric] = [
+    ("Requests", lambda result: result.requests),
+    ("Failures", lambda result: result.failures),
+    ("Task errors", lambda result: result.errors),
+    ("Throughput, req/s", lambda result: result.throughput),
+    ("Mean, ms", lambda result: result.mean),
+    *(get_percentile_metric(percentile) for percentile in COMPARISON_PERCENTILES),
+    ("Max, ms", lambda result: result.max),
+    ("Request bytes/req", lambda result: result.per_request(result.request_bytes)),
+    ("Response bytes/req", lambda result: result.per_request(result.response_bytes)),
+    ("Client CPU/req, us", lambda result: result.cpu_per_request),
+]
+
+
+def get_comparison_rows(results: Sequence[TransportComparisonResult]) -> list[dict[str, Any]]:
+    """
+    Возвращает строки отчёта для CSV: по строке на транспорт.
+    """
+    return [
+        {
+            "Transport": result.transport,
+            "Valid": result.valid,
+            **{label: round(metric(result), 3) for label, metric in COMPARISON_METRICS},
+        }
+        for result in results
+    ]
+
+
+def write_comparison_report(results: Sequence[TransportComparisonResult], path: Path) -> None:
+    """
+    Сохраняет результаты сравнения транспортов в CSV.
+
+    :param results: Результаты прогонов.
+    :param path: Путь к CSV-файлу, например reports/transport_comparison.csv.
+    """
+    rows = get_comparison_rows(results)
+    if not rows:
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def format_comparison_report(results: Sequence[TransportComparisonResult]) -> str:
+    """
+    Форматирует результаты таблицей: метрики по строкам, транспорты по столбцам.
+    Последний столбец — отношение метрики второго транспорта к первому.
+
+    Непригодные результаты (см. TransportComparisonResult.valid) отмечаются
+    в заголовке звёздочкой, отношение для них, как и при нулевой базе, выводится как n/a.
+    """
+    if not results:
+        return ""
+
+    baseline, *others = results
+    with_ratio = len(results) == 2
+    valid = all(result.valid for result in results)
+
+    header = f"{'Metric':<22}" + "".join(
+        f" {result.transport + ('' if result.valid else '*'):>12}" for result in results
+    )
+    if with_ratio:
+        header += f" {others[0].transport + '/' + baseline.transport:>12}"
+
+    lines = [header]
+    for label, metric in COMPARISON_METRICS:
+        values = [metric(result) for result in results]
+        line = f"{label:<22}" + "".join(f" {value:>12.3f}" for value in values)
+        if with_ratio:
+            ratio = f"{values[1] / values[0]:.2f}" if valid and values[0] else "n/a"
+            line += f" {ratio:>12}"
+        lines.append(line)
+
+    if not valid:
+        lines.append("* invalid: no requests or users crashed")
+
+    return "\n".join(lines)
@@ -0,0 +1,397 @@
+from pathlib import Path
+from typing import Any, Literal, TypeVar
+
+from grpc import Compression
+from pydantic import BaseModel, Field, HttpUrl, PositiveFloat
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+ConfigModel = TypeVar("ConfigModel", bound=BaseModel)
+
+
+def override_config(config: ConfigModel, **values: Any) -> ConfigModel:
+    """
+    Возвращает копию настроек с заменёнными полями, проверенную так же, как при загрузке.
+
+    Значения None пропускаются: так передаются, например, аргументы командной строки,
+    которые не были заданы.
+
+    :param config: Исходные настройки, например settings.replay.
+    :param values: Новые значения полей.
+    :return: Настройки того же класса. Без изменений — исходный объект.
+    """
+    overrides = {key: value for key, value in values.items() if value is not None}
+    if not overrides:
+        return config
+
+    return config.model_validate({**config.model_dump(), **overrides})
+
+
+class HTTPClientConfig(BaseModel):
+    """
+    Настройки HTTP-клиента сервиса.
+
+    :param url: Базовый URL сервиса.
+    :param timeout: Таймаут запроса в секундах.
+    :param http2: Использовать ли HTTP/2 (мультиплексирование запросов поверх нескольких соединений).
+    :param max_connections: Максимальное число одновременно открытых соединений в пуле.
+    :param max_keepalive_connections: Сколько простаивающих соединений держать открытыми.
+    :param keepalive_expiry: Через сколько секунд простоя закрывать keep-alive соединение.
+    :param report_phases: Отправлять ли в Locust фазы запросов отдельными метриками.
+    """
+
+    url: HttpUrl = HttpUrl("http://localhost:8003")
+    timeout: float = 100
+    http2: bool = False
+    max_connections: int | None = 1000
+    max_keepalive_connections: int | None = 1000
+    keepalive_expiry: float | None = 30
+    report_phases: bool = False
+
+    @property
+    def client_url(self) -> str:
+        # HttpUrl добавляет завершающий слэш, httpx ожидает base_url без него
+        return str(self.url).rstrip("/")
+
+
+class GRPCClientConfig(BaseModel):
+    """
+    Настройки gRPC-канала сервиса.
+
+    :param host: Хост сервиса.
+    :param port: Порт сервиса.
+    :param channels: Число каналов (соединений) в общем пуле каналов воркера.
+    :param keepalive_time_ms: Период отправки keepalive ping (мс). None — по умолчанию gRPC.
+    :param keepalive_timeout_ms: Сколько ждать ответа на keepalive ping (мс).
+    :param max_send_message_length: Максимальный размер исходящего сообщения в байтах.
+    :param max_receive_message_length: Максимальный размер входящего сообщения в байтах.
+    :param compression: Алгоритм сжатия сообщений канала.
+    :param report_phases: Отправлять ли в Locust фазы вызовов отдельными метриками.
+    """
+
+    host: str = "localhost"
+    port: int = 9003
+    channels: int = 1
+    keepalive_time_ms: int | None = None
+    keepalive_timeout_ms: int | None = None
+    max_send_message_length: int | None = None
+    max_receive_message_length: int | None = None
+    compression: Literal["none", "deflate", "gzip"] = "none"
+    report_phases: bool = False
+
+    @property
+    def client_url(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    @property
+    def channel_options(self) -> list[tuple[str, Any]]:
+        """
+        Опции канала (channel arguments) в формате grpc: заданы только явно указанные.
+        """
+        options = {
+            "grpc.keepalive_time_ms": self.keepalive_time_ms,
+            "grpc.keepalive_timeout_ms": self.keepalive_timeout_ms,
+            "grpc.max_send_message_length": self.max_send_message_length,
+            "grpc.max_receive_message_length": self.max_receive_message_length,
+        }
+        return [(key, value) for key, value in options.items() if value is not None]
+
+    @property
+    def channel_compression(self) -> Compression:
+        return {
+            "none": Compression.NoCompression,
+            "deflate": Compression.Deflate,
+            "gzip": Compression.Gzip,
+        }[self.compression]
+
+
+class FakeConfig(BaseModel):
+    """
+    Настройки генерации тестовых данных (tools.fakers).
+
+    :param pool_size: Размер пулов заранее сгенерированных значений. Пулы строятся
+                      при создании генератора (импорт tools.fakers), до старта пользователей.
+                      0 — пулы отключены, каждое значение генерируется Faker при вызове.
+    :param seed: Зерно генераторов для воспроизводимых данных. None — случайные данные.
+    :param run_id: Идентификатор запуска, входящий в уникальные email. По умолчанию
+                   выводится из seed (повтор запуска даёт те же email), без seed — случайный.
+    """
+
+    pool_size: int = 0
+    seed: int | None = None
+    run_id: str | None = None
+
+
+class SeedsConfig(BaseModel):
+    """
+    Настройки заранее созданных тестовых данных (пакет seeds).
+
+    :param path: Путь к файлу результата сидинга (python -m seeds). None — сценарии
+                 создают пользователей сами в on_start.
+    :param distribution: Распределение обращений к сущностям пула: uniform — равномерное,
+                         zipf — с горячим множеством, как у реального трафика.
+    :param zipf_exponent: Показатель распределения Ципфа.
+    :param shared: Общий для всех воркеров машины пул: занятость сущностей,
+                   захваченных через checkout, видна всем процессам.
+    :param checkout_attempts: Сколько раз выбрать сущность из распределения при захвате,
+                              прежде чем перейти к равномерному выбору и поиску
+                              свободной сущности по всему пулу.
+    """
+
+    path: Path | None = None
+    distribution: Literal["uniform", "zipf"] = "uniform"
+    zipf_exponent: float = 1.1
+    shared: bool = False
+    checkout_attempts: int = 64
+
+
+class ReplayConfig(BaseModel):
+    """
+    Настройки проигрывания журнала трафика (пакет replay).
+
+    :param path: JSONL-файл журнала (или .jsonl.gz).
+    :param speed: Ускорение проигрывания: 2 — интервалы между запросами вдвое короче.
+    :param loop: Проигрывать журнал по кругу до окончания теста.
+    """
+
+    path: Path = Path("traffic/requests.jsonl")
+    speed: PositiveFloat = 1.0
+    loop: bool = False
+
+
+class CaptureConfig(BaseModel):
+    """
+    Настройки записи трафика клиентов gateway в журнал для проигрывания (replay.writer).
+
+    :param enabled: Записывать ли трафик Locust-клиентов gateway.
+    :param path: Базовый путь журнала. Файлы получают суффикс <pid>.<номер>.
+    :param sample_rate: Доля записываемых запросов от 0 до 1.
+    :param max_bytes: Размер файла журнала, после которого начинается следующий.
+    :param max_buffer: Максимум записей в очереди фоновой записи.
+    :param flush_interval: Период сброса очереди на диск, с.
+    :param max_pending: Сколько секунд ждать ответа на запрос, прежде чем записать его
+                        в журнал без статуса. Записи пишутся в порядке отправки запросов.
+    """
+
+    enabled: bool = False
+    path: Path = Path("traffic/requests.jsonl")
+    sample_rate: float = 1.0
+    max_bytes: int = 100 * 1024 * 1024
+    max_buffer: int = 100_000
+    flush_interval: float = 0.5
+    max_pending: float = 60.0
+
+
+class ArrivalRateConfig(BaseModel):
+    """
+    Настройки открытой модели нагрузки (tools.locust_arrival_rate).
+
+    :param rate: Начальная частота итераций сценария в секунду на воркер. 0 и без ступеней —
+                 открытая модель выключена, сценарии используют свой wait_time.
+    :param stages: Ступени [длительность в секундах, целевая частота]: частота линейно
+                   меняется до целевой за длительность ступени, например [[60, 100], [300, 100]].
+    """
+
+    rate: float = 0
+    stages: list[tuple[float, float]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0 or bool(self.stages)
+
+
+class HistogramsConfig(BaseModel):
+    """
+    Настройки HDR-гистограмм задержек (metrics.sink, tools.locust_histograms).
+
+    :param enabled: Вести ли гистограммы задержек рядом со статистикой Locust.
+    :param path: CSV-файл с перцентилями, который сохраняется по завершении теста.
+    :param expected_interval: Ожидаемый интервал между запросами одного пользователя, мс,
+                              для поправки на coordinated omission. 0 — без поправки.
+    :param significant_figures: Точность гистограмм (число значащих цифр, от 1 до 5).
+    :param request_types: Типы запросов, для которых ведутся гистограммы.
+    :param runs_path: Каталог, в который сохраняются гистограммы каждого запуска
+                      (<время начала>.hist). None — не сохранять.
+    """
+
+    enabled: bool = False
+    path: Path = Path("reports/latency_histograms.csv")
+    expected_interval: float = 0
+    significant_figures: int = 3
+    request_types: list[str] = ["HTTP", "gRPC"]
+    runs_path: Path | None = Path("reports/histograms")
+
+
+class MixedConfig(BaseModel):
+    """
+    Настройки смешанной нагрузки (locust_mixed_http.py, locust_mixed_grpc.py).
+
+    :param weights_path: TOML-файл с весами задач (см. tools.weights.MixedTaskWeights).
+    """
+
+    weights_path: Path = Path("mixed_weights.toml")
+
+
+class StubProfileConfig(BaseModel):
+    """
+    Профиль ответов заглушки gateway (пакет stubs): задержка и доля ошибок.
+
+    :param latency: Распределение задержки ответа: none — без задержки, constant — всегда
+                    latency_mean, uniform — равномерно от latency_min до latency_max,
+                    exponential и lognormal — со средним latency_mean.
+    :param latency_mean: Средняя задержка, мс.
+    :param latency_min: Нижняя граница равномерного распределения, мс.
+    :param latency_max: Верхняя граница задержки, мс. Для exponential и lognormal
+                        ограничивает хвост распределения, 0 — без ограничения.
+    :param latency_sigma: Параметр формы логнормального распределения: чем больше,
+                          тем тяжелее хвост при том же среднем.
+    :param error_rate: Доля ответов с ошибкой от 0 до 1.
+    """
+
+    latency: Literal["none", "constant", "uniform", "exponential", "lognormal"] = "none"
+    latency_mean: float = Field(default=0, ge=0)
+    latency_min: float = Field(default=0, ge=0)
+    latency_max: float = Field(default=0, ge=0)
+    latency_sigma: float = 0.5
+    error_rate: float = Field(default=0, ge=0, le=1)
+
+
+class HTTPStubConfig(BaseModel):
+    """
+    Настройки заглушки http-gateway (stubs.http_gateway).
+
+    :param host: Адрес, на котором заглушка принимает соединения.
+    :param port: Порт заглушки.
+    :param profile: Профиль задержек и ошибок для всех маршрутов.
+    :param routes: Переопределения профиля для отдельных маршрутов, например
+                   {"GET /api/v1/users/{user_id}": {"latency_mean": 50}}.
+    :param error_statuses: HTTP-статусы внедрённых ошибок, выбираются случайно.
+                           Должен быть задан хотя бы один.
+    :param strict: Отвечать 404 на неизвестные идентификаторы, как gateway. По умолчанию
+                   заглушка отвечает выдуманной сущностью: так её можно нагружать
+                   и с заранее созданными (SEEDS.PATH) на настоящем gateway данными.
+    :param max_entities: Сколько сущностей каждого вида хранить в памяти: самые
+                         старые вытесняются, чтобы память не росла весь тест.
+    """
+
+    host: str = "localhost"
+    port: int = 8003
+    profile: StubProfileConfig = StubProfileConfig()
+    routes: dict[str, dict[str, Any]] = {}
+    error_statuses: list[int] = Field(default=[500, 503], min_length=1)
+    strict: bool = False
+    max_entities: int = 100_000
+
+    def get_profile(self, route: str) -> StubProfileConfig:
+        """
+        Возвращает профиль маршрута с учётом переопределений.
+
+        :param route: Маршрут, например "GET /api/v1/users/{user_id}".
+        :return: Объект StubProfileConfig.
+        """
+        return override_config(self.profile, **self.routes.get(route, {}))
+
+
+class GRPCStubConfig(BaseModel):
+    """
+    Настройки заглушки gRPC-сервисов (stubs.grpc_server): gateway и внутренних
+    сервисов (пользователи, счета, карты, операции, платежи, документы) на одном порту.
+
+    :param host: Адрес, на котором заглушка принимает соединения.
+    :param port: Порт заглушки (по умолчанию — порт grpc-gateway из GATEWAY_GRPC_CLIENT).
+    :param profile: Профиль задержек и ошибок для всех методов.
+    :param methods: Переопределения профиля для отдельных методов по полному имени, например
+                    {"/contracts.services.gateway.users.UsersGatewayService/GetUser":
+                    {"latency_mean": 50}}.
+    :param error_codes: Коды внедрённых ошибок (имена grpc.StatusCode), выбираются случайно.
+                        Должен быть задан хотя бы один.
+    :param strict: Отвечать NOT_FOUND на неизвестные идентификаторы, как сервисы.
+                   По умолчанию заглушка отвечает выдуманной сущностью.
+    :param max_entities: Сколько сущностей каждого вида хранить в памяти.
+    """
+
+    host: str = "localhost"
+    port: int = 9003
+    profile: StubProfileConfig = StubProfileConfig()
+    methods: dict[str, dict[str, Any]] = {}
+    error_codes: list[str] = Field(default=["UNAVAILABLE"], min_length=1)
+    strict: bool = False
+    max_entities: int = 100_000
+
+    def get_profile(self, method: str) -> StubProfileConfig:
+        """
+        Возвращает профиль метода с учётом переопределений.
+
+        :param method: Полное имя метода, например "/contracts.services.users.UsersService/GetUser".
+        :return: Объект StubProfileConfig.
+        """
+        return override_config(self.profile, **self.methods.get(method, {}))
+
+
+class Settings(BaseSettings):
+    """
+    Настройки нагрузочных тестов.
+
+    Значения читаются из переменных окружения и файла .env (необязательного),
+    вложенные поля разделяются точкой, например:
+
+        GATEWAY_HTTP_CLIENT.URL=http://staging-gateway:8003
+        GATEWAY_GRPC_CLIENT.HOST=staging-gateway
+        GATEWAY_HTTP_SERVICES.users.timeout=5
+        FAKE.POOL_SIZE=100000
+        SEEDS.PATH=dumps/seeds.json.gz
+        REPLAY.SPEED=2
+        CAPTURE.ENABLED=true
+        ARRIVAL_RATE.STAGES=[[60, 100], [300, 100]]
+        HISTOGRAMS.EXPECTED_INTERVAL=2000
+        MIXED.WEIGHTS_PATH=weights/staging.toml
+        HTTP_STUB.PROFILE.LATENCY=lognormal
+        GRPC_STUB.PROFILE.ERROR_RATE=0.01
+
+    gateway_http_services и gateway_grpc_services задают переопределения
+    для отдельных сервисов (users, accounts, cards, documents, operations):
+    указанные поля заменяют значения из gateway_http_client / gateway_grpc_client.
+    """
+
+    model_config = SettingsConfigDict(
+        extra="allow",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_nested_delimiter=".",
+    )
+
+    gateway_http_client: HTTPClientConfig = HTTPClientConfig()
+    gateway_grpc_client: GRPCClientConfig = GRPCClientConfig()
+    gateway_http_services: dict[str, dict[str, Any]] = {}
+    gateway_grpc_services: dict[str, dict[str, Any]] = {}
+    fake: FakeConfig = FakeConfig()
+    seeds: SeedsConfig = SeedsConfig()
+    replay: ReplayConfig = ReplayConfig()
+    capture: CaptureConfig = CaptureConfig()
+    arrival_rate: ArrivalRateConfig = ArrivalRateConfig()
+    histograms: HistogramsConfig = HistogramsConfig()
+    mixed: MixedConfig = MixedConfig()
+    http_stub: HTTPStubConfig = HTTPStubConfig()
+    grpc_stub: GRPCStubConfig = GRPCStubConfig()
+
+    def get_gateway_http_client_config(self, service: str | None = None) -> HTTPClientConfig:
+        """
+        Возвращает настройки HTTP-клиента gateway с учётом переопределений сервиса.
+
+        :param service: Имя сервиса, например "users". None — общие настройки gateway.
+        :return: Объект HTTPClientConfig.
+        """
+        overrides = self.gateway_http_services.get(service, {}) if service else {}
+        return override_config(self.gateway_http_client, **overrides)
+
+    def get_gateway_grpc_client_config(self, service: str | None = None) -> GRPCClientConfig:
+        """
+        Возвращает настройки gRPC-канала gateway с учётом переопределений сервиса.
+
+        :param service: Имя сервиса, например "users". None — общие настройки gateway.
+        :return: Объект GRPCClientConfig.
+        """
+        overrides = self.gateway_grpc_services.get(service, {}) if service else {}
+        return override_config(self.gateway_grpc_client, **overrides)
+
+
+settings = Settings()
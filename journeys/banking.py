@@ -0,0 +1,320 @@
+import random
+from typing import Callable
+
+from locust.env import Environment
+
+from clients.http.gateway.accounts.client import (
+    AccountsGatewayHTTPClient,
+    build_accounts_gateway_locust_http_client,
+)
+from clients.http.gateway.accounts.schema import AccountType
+from clients.http.gateway.cards.client import (
+    CardsGatewayHTTPClient,
+    build_cards_gateway_locust_http_client,
+)
+from clients.http.gateway.documents.client import (
+    DocumentsGatewayHTTPClient,
+    build_documents_gateway_locust_http_client,
+)
+from clients.http.gateway.operations.client import (
+    OperationsGatewayHTTPClient,
+    build_operations_gateway_locust_http_client,
+)
+from clients.http.gateway.users.client import (
+    UsersGatewayHTTPClient,
+    build_users_gateway_locust_http_client,
+)
+from journeys.engine import JOURNEY_END, Journey, JourneyStep
+from journeys.state import CARD_ACCOUNT_TYPES, AccountState, CustomerState
+
+
+class BankingClients:
+    """
+    HTTP-клиенты gateway, из которых складывается путь клиента банка.
+    """
+
+    def __init__(
+        self,
+        users: UsersGatewayHTTPClient,
+        accounts: AccountsGatewayHTTPClient,
+        cards: CardsGatewayHTTPClient,
+        operations: OperationsGatewayHTTPClient,
+        documents: DocumentsGatewayHTTPClient,
+    ):
+        self.users = users
+        self.accounts = accounts
+        self.cards = cards
+        self.operations = operations
+        self.documents = documents
+
+
+def build_banking_locust_clients(environment: Environment) -> BankingClients:
+    """
+    Создаёт клиенты gateway, адаптированные под Locust, для пути клиента банка.
+
+    :param environment: Объект окружения Locust.
+    :return: Экземпляр BankingClients.
+    """
+    return BankingClients(
+        users=build_users_gateway_locust_http_client(environment),
+        accounts=build_accounts_gateway_locust_http_client(environment),
+        cards=build_cards_gateway_locust_http_client(environment),
+        operations=build_operations_gateway_locust_http_client(environment),
+        documents=build_documents_gateway_locust_http_client(environment),
+    )
+
+
+class BankingJourneyContext:
+    """
+    Контекст одного прохождения пути: клиенты gateway, генератор случайных чисел
+    и состояние клиента банка, которое шаги передают друг другу.
+    """
+
+    def __init__(self, clients: BankingClients, generator: random.Random):
+        self.clients = clients
+        self.generator = generator
+        self.state = CustomerState()
+
+
+BankingAction = Callable[[BankingJourneyContext], None]
+
+
+def create_user(context: BankingJourneyContext) -> None:
+    context.state.user_id = context.clients.users.create_user().user.id
+
+
+def open_account(account_type: AccountType) -> BankingAction:
+    """
+    Возвращает шаг открытия счёта заданного типа. Карты, выпущенные вместе
+    со счётом (для карточных счетов), сохраняются в состоянии.
+    """
+
+    def action(context: BankingJourneyContext) -> None:
+        accounts = context.clients.accounts
+        open_methods = {
+            AccountType.DEPOSIT: accounts.open_deposit_account,
+            AccountType.SAVINGS: accounts.open_savings_account,
+            AccountType.DEBIT_CARD: accounts.open_debit_card_account,
+            AccountType.CREDIT_CARD: accounts.open_credit_card_account,
+        }
+        response = open_methods[account_type](context.state.user_id)
+        context.state.add_account(AccountState.from_schema(response.account))
+
+    return action
+
+
+def issue_card(physical: bool) -> BankingAction:
+    """
+    Возвращает шаг выпуска физической или виртуальной карты к карточному счёту клиента.
+    """
+
+    def action(context: BankingJourneyContext) -> None:
+        cards = context.clients.cards
+        issue = cards.issue_physical_card if physical else cards.issue_virtual_card
+
+        account = context.state.choose_account(context.generator, CARD_ACCOUNT_TYPES)
+        response = issue(context.state.user_id, account.id)
+        context.state.add_card(account, response.card.id)
+
+    return action
+
+
+def make_operation(operation: str) -> BankingAction:
+    """
+    Возвращает шаг карточной операции (top_up, purchase, transfer, bill_payment,
+    cash_withdrawal) по случайной карте клиента. Идентификатор операции сохраняется
+    для последующих запросов квитанции.
+    """
+
+    def action(context: BankingJourneyContext) -> None:
+        make = getattr(context.clients.operations, f"make_{operation}_operation")
+
+        account, card_id = context.state.choose_card(context.generator)
+        response = make(account.id, card_id)
+        context.state.add_operation(response.operation.id)
+
+    return action
+
+
+def get_operations(context: BankingJourneyContext) -> None:
+    account = context.state.choose_account(context.generator)
+    context.clients.operations.get_operations(account.id)
+
+
+def get_operation_summary(context: BankingJourneyContext) -> None:
+    account = context.state.choose_account(context.generator)
+    context.clients.operations.get_operation_summary(account.id)
+
+
+def get_operation_receipt(context: BankingJourneyContext) -> None:
+    operation_id = context.generator.choice(context.state.operation_ids)
+    context.clients.operations.get_operation_receipt(operation_id)
+
+
+def get_tariff_document(context: BankingJourneyContext) -> None:
+    account = context.state.choose_account(context.generator)
+    context.clients.documents.get_tariff_document(account.id)
+
+
+def get_contract_document(context: BankingJourneyContext) -> None:
+    account = context.state.choose_account(context.generator)
+    context.clients.documents.get_contract_document(account.id)
+
+
+def has_account(context: BankingJourneyContext) -> bool:
+    return bool(context.state.accounts)
+
+
+def has_card_account(context: BankingJourneyContext) -> bool:
+    return bool(context.state.get_accounts(CARD_ACCOUNT_TYPES))
+
+
+def has_card(context: BankingJourneyContext) -> bool:
+    return bool(context.state.get_card_accounts())
+
+
+def has_operation(context: BankingJourneyContext) -> bool:
+    return bool(context.state.operation_ids)
+
+
+# Переходы после карточных операций: клиент продолжает тратить или проверяет историю
+AFTER_OPERATION = {
+    "make_purchase": 30,
+    "make_transfer": 10,
+    "make_bill_payment": 10,
+    "get_operations": 15,
+    "get_operation_receipt": 10,
+    "get_operation_summary": 10,
+    JOURNEY_END: 15,
+}
+
+# Переходы после запросов на чтение: клиент чаще уходит, реже продолжает
+AFTER_READ = {
+    "make_purchase": 20,
+    "get_operations": 10,
+    JOURNEY_END: 70,
+}
+
+# Путь клиента банка: регистрация → открытие счёта → выпуск карты → пополнение →
+# покупки, переводы и платежи → история операций, сводка, квитанции и документы.
+# Веса переходов задают доли клиентов, выбирающих следующий шаг.
+BANKING_JOURNEY: Journey[BankingJourneyContext] = Journey(
+    name="banking",
+    start="create_user",
+    steps=[
+        JourneyStep(
+            "create_user",
+            create_user,
+            think_time=(1, 3),
+            transitions={
+                "open_debit_card_account": 50,
+                "open_credit_card_account": 20,
+                "open_deposit_account": 15,
+                "open_savings_account": 10,
+                JOURNEY_END: 5,
+            },
+        ),
+        *(
+            JourneyStep(
+                f"open_{account_type.lower()}_account",
+                open_account(account_type),
+                think_time=(2, 5),
+                transitions={
+                    "issue_virtual_card": 30,
+                    "issue_physical_card": 10,
+                    "make_top_up": 40,
+                    "get_contract_document": 10,
+                    JOURNEY_END: 10,
+                },
+            )
+            for account_type in CARD_ACCOUNT_TYPES
+        ),
+        *(
+            JourneyStep(
+                f"open_{account_type.lower()}_account",
+                open_account(account_type),
+                think_time=(2, 5),
+                transitions={
+                    "get_tariff_document": 30,
+                    "get_contract_document": 20,
+                    "open_debit_card_account": 30,
+                    JOURNEY_END: 20,
+                },
+            )
+            for account_type in (AccountType.DEPOSIT, AccountType.SAVINGS)
+        ),
+        *(
+            JourneyStep(
+                f"issue_{kind}_card",
+                issue_card(physical=kind == "physical"),
+                think_time=(1, 3),
+                available=has_card_account,
+                transitions={"make_top_up": 50, "make_purchase": 30, JOURNEY_END: 20},
+            )
+            for kind in ("virtual", "physical")
+        ),
+        JourneyStep(
+            "make_top_up",
+            make_operation("top_up"),
+            think_time=(1, 3),
+            available=has_card,
+            transitions={
+                "make_purchase": 40,
+                "make_transfer": 15,
+                "make_bill_payment": 15,
+                "make_cash_withdrawal": 5,
+                "get_operations": 15,
+                JOURNEY_END: 10,
+            },
+        ),
+        *(
+            JourneyStep(
+                f"make_{operation}",
+                make_operation(operation),
+                think_time=(1, 5),
+                available=has_card,
+                transitions=AFTER_OPERATION,
+            )
+            for operation in ("purchase", "transfer", "bill_payment", "cash_withdrawal")
+        ),
+        JourneyStep(
+            "get_operations",
+            get_operations,
+            think_time=(1, 3),
+            available=has_account,
+            transitions={
+                "get_operation_receipt": 30,
+                "get_operation_summary": 30,
+                "make_purchase": 20,
+                JOURNEY_END: 20,
+            },
+        ),
+        JourneyStep(
+            "get_operation_summary",
+            get_operation_summary,
+            think_time=(1, 3),
+            available=has_account,
+            transitions=AFTER_READ,
+        ),
+        JourneyStep(
+            "get_operation_receipt",
+            get_operation_receipt,
+            think_time=(1, 3),
+            available=has_operation,
+            transitions=AFTER_READ,
+        ),
+        *(
+            JourneyStep(
+                f"get_{document}_document",
+                action,
+                think_time=(2, 5),
+                available=has_account,
+                transitions={"open_debit_card_account": 20, **AFTER_READ},
+            )
+            for document, action in (
+                ("tariff", get_tariff_document),
+                ("contract", get_contract_document),
+            )
+        ),
+    ],
+)
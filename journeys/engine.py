@@ -0,0 +1,181 @@
+import logging
+import random
+import time
+from typing import Callable, Generic, Sequence, TypeVar
+
+import gevent
+from httpx import HTTPError
+from locust.env import Environment
+from pydantic import ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Имя перехода, завершающего путь клиента
+JOURNEY_END = "end"
+
+Context = TypeVar("Context")
+
+
+class JourneyStep(Generic[Context]):
+    """
+    Шаг пути клиента: действие и взвешенные переходы к следующим шагам.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        action: Callable[[Context], None],
+        transitions: dict[str, float] | None = None,
+        think_time: tuple[float, float] = (0, 0),
+        available: Callable[[Context], bool] | None = None,
+    ):
+        """
+        :param name: Имя шага.
+        :param action: Действие шага. Получает контекст пути (клиенты и состояние)
+                       и сохраняет в состояние всё, что нужно следующим шагам.
+        :param transitions: Веса переходов {имя следующего шага: вес}. Переход JOURNEY_END
+                            завершает путь. Без переходов путь после шага завершается.
+        :param think_time: Пауза клиента после шага, с: случайная в диапазоне (min, max).
+        :param available: Условие, при котором в шаг можно перейти, например
+                          «у клиента есть карта». None — шаг доступен всегда.
+        """
+        self.name = name
+        self.action = action
+        self.transitions = transitions or {}
+        self.think_time = think_time
+        self.available = available
+
+    def is_available(self, context: Context) -> bool:
+        return self.available is None or self.available(context)
+
+
+class Journey(Generic[Context]):
+    """
+    Путь клиента — взвешенный конечный автомат из шагов (JourneyStep).
+
+    После каждого шага следующий выбирается случайно по весам переходов среди
+    доступных в текущем состоянии шагов. Так один декларативный граф порождает
+    смесь реалистичных последовательностей запросов, а веса задают доли переходов
+    (например, сколько клиентов после открытия счёта выпускают карту).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        steps: Sequence[JourneyStep[Context]],
+        start: str,
+        max_steps: int = 100,
+    ):
+        """
+        :param name: Имя пути в статистике Locust.
+        :param steps: Шаги пути.
+        :param start: Имя первого шага.
+        :param max_steps: Сколько шагов выполнить самое большее, если путь не завершился сам.
+        :raises ValueError: Переход или первый шаг ссылается на несуществующий шаг.
+        """
+        self.name = name
+        self.steps = {step.name: step for step in steps}
+        self.start = start
+        self.max_steps = max_steps
+
+        targets = [
+            target for step in steps for target in step.transitions if target != JOURNEY_END
+        ]
+        for target in (start, *targets):
+            if target not in self.steps:
+                raise ValueError(f"Journey {name} refers to unknown step {target}")
+
+    def get_next_step(
+        self, step: JourneyStep[Context], context: Context, generator: random.Random
+    ) -> JourneyStep[Context] | None:
+        """
+        Выбирает следующий шаг по весам переходов среди доступных шагов.
+
+        :return: Следующий шаг или None, если путь завершён.
+        """
+        candidates: list[JourneyStep[Context] | None] = []
+        weights: list[float] = []
+
+        for target, weight in step.transitions.items():
+            if weight <= 0:
+                continue
+
+            if target == JOURNEY_END:
+                candidates.append(None)
+                weights.append(weight)
+            elif self.steps[target].is_available(context):
+                candidates.append(self.steps[target])
+                weights.append(weight)
+
+        if not candidates:
+            return None
+
+        return generator.choices(candidates, weights)[0]
+
+
+class JourneyRunner(Generic[Context]):
+    """
+    Проходит путь клиента от первого шага до завершения.
+
+    Запросы шагов отправляются в Locust клиентами gateway, как обычно.
+    Сам путь отправляет метрику с типом "JOURNEY": полное время пути (вместе
+    с паузами клиента) и число шагов в context. Если шаг упал (ошибка транспорта
+    или неожиданный ответ gateway), путь прерывается — как клиент, который бросил
+    начатое, — и метрика пути отправляется с этой ошибкой.
+    """
+
+    def __init__(
+        self,
+        environment: Environment,
+        journey: Journey[Context],
+        generator: random.Random | None = None,
+    ):
+        """
+        :param environment: Окружение Locust.
+        :param journey: Путь клиента.
+        :param generator: Генератор случайных чисел для переходов и пауз.
+        """
+        self.environment = environment
+        self.journey = journey
+        self.generator = generator or random.Random()
+
+    def think(self, step: JourneyStep[Context]) -> None:
+        low, high = step.think_time
+        if high > 0:
+            gevent.sleep(self.generator.uniform(low, high))
+
+    def run(self, context: Context) -> None:
+        """
+        Проходит путь с заданным контекстом.
+
+        :param context: Контекст пути: клиенты gateway и состояние, которое шаги передают друг другу.
+        """
+        started = time.perf_counter()
+        exception: Exception | None = None
+        steps = 0
+
+        step: JourneyStep[Context] | None = self.journey.steps[self.journey.start]
+        while step is not None and steps < self.journey.max_steps:
+            try:
+                step.action(context)
+            except (HTTPError, ValidationError) as error:
+                # Ошибочный ответ уже отправлен в Locust хуками клиента
+                logger.debug(
+                    "Journey %s aborted at step %s: %s", self.journey.name, step.name, error
+                )
+                exception = error
+                break
+
+            steps += 1
+            self.think(step)
+            step = self.journey.get_next_step(step, context, self.generator)
+
+        self.environment.events.request.fire(
+            name=self.journey.name,
+            context={"steps": steps},
+            response=None,
+            exception=exception,
+            request_type="JOURNEY",
+            response_time=(time.perf_counter() - started) * 1000,
+            response_length=0,
+        )
@@ -0,0 +1,109 @@
+import random
+
+from pydantic import BaseModel
+
+from clients.http.gateway.accounts.schema import AccountSchema, AccountType
+from contracts.services.accounts.account_pb2 import AccountType as ProtoAccountType
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+
+# Счета, к которым выпускаются карты и по которым проводятся карточные операции
+CARD_ACCOUNT_TYPES = (AccountType.DEBIT_CARD, AccountType.CREDIT_CARD)
+
+
+class AccountState(BaseModel):
+    """
+    Счёт клиента, открытый в ходе сценария, и выпущенные к нему карты.
+    """
+
+    id: str
+    type: AccountType
+    card_ids: list[str] = []
+
+    @classmethod
+    def from_schema(cls, account: AccountSchema) -> "AccountState":
+        return cls(id=account.id, type=account.type, card_ids=[card.id for card in account.cards])
+
+    @classmethod
+    def from_view(cls, account: AccountView) -> "AccountState":
+        """
+        Создаёт состояние счёта из ответа gRPC gateway.
+        """
+        account_type = ProtoAccountType.Name(account.type).removeprefix("ACCOUNT_TYPE_")
+        return cls(
+            id=account.id,
+            type=AccountType(account_type),
+            card_ids=[card.id for card in account.cards],
+        )
+
+
+class CustomerState(BaseModel):
+    """
+    Состояние клиента, которое шаги сценария передают друг другу:
+    созданный пользователь, его счета, карты и проведённые операции.
+    """
+
+    user_id: str | None = None
+    accounts: list[AccountState] = []
+    operation_ids: list[str] = []
+    max_accounts: int = 20
+    max_card_ids: int = 20
+    max_operation_ids: int = 100
+
+    def add_account(self, account: AccountState) -> AccountState:
+        """
+        Сохраняет счёт. Хранятся только последние max_accounts счетов каждого типа:
+        так у клиента остаются счета всех уже открытых типов, а состояние
+        долгоживущего пользователя не растёт весь тест.
+        """
+        self.accounts.append(account)
+
+        same_type = self.get_accounts((account.type,))
+        if len(same_type) > self.max_accounts:
+            self.accounts.remove(same_type[0])
+
+        return account
+
+    def add_card(self, account: AccountState, card_id: str) -> None:
+        """
+        Сохраняет карту счёта. Хранятся только последние max_card_ids карт счёта.
+        """
+        account.card_ids.append(card_id)
+        if len(account.card_ids) > self.max_card_ids:
+            del account.card_ids[0]
+
+    def add_operation(self, operation_id: str) -> None:
+        """
+        Сохраняет идентификатор операции. Хранятся только последние max_operation_ids,
+        чтобы состояние долгоживущего пользователя не росло весь тест.
+        """
+        self.operation_ids.append(operation_id)
+        if len(self.operation_ids) > self.max_operation_ids:
+            del self.operation_ids[0]
+
+    def get_accounts(self, types: tuple[AccountType, ...] | None = None) -> list[AccountState]:
+        return [account for account in self.accounts if types is None or account.type in types]
+
+    def get_card_accounts(self) -> list[AccountState]:
+        """
+        Возвращает карточные счета, к которым уже выпущена хотя бы одна карта.
+        """
+        return [account for account in self.get_accounts(CARD_ACCOUNT_TYPES) if account.card_ids]
+
+    def choose_account(
+        self, generator: random.Random, types: tuple[AccountType, ...] | None = None
+    ) -> AccountState:
+        """
+        Выбирает случайный счёт клиента.
+
+        :raises IndexError: Подходящих счетов нет.
+        """
+        return generator.choice(self.get_accounts(types))
+
+    def choose_card(self, generator: random.Random) -> tuple[AccountState, str]:
+        """
+        Выбирает случайную карту клиента вместе с её счётом.
+
+        :raises IndexError: Карт нет.
+        """
+        account = generator.choice(self.get_card_accounts())
+        return account, generator.choice(account.card_ids)
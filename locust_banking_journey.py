@@ -0,0 +1,45 @@
+from locust import User, between, task
+
+import tools.locust_histograms  # noqa: F401 — HDR-гистограммы задержек (HISTOGRAMS.ENABLED)
+import tools.locust_settings  # noqa: F401 — аргументы командной строки для настроек gateway
+from journeys.banking import (
+    BANKING_JOURNEY,
+    BankingClients,
+    BankingJourneyContext,
+    build_banking_locust_clients,
+)
+from journeys.engine import JourneyRunner
+from tools.fakers import fake
+from tools.locust_arrival_rate import arrival_rate
+from tools.locust_fakers import activate_user_fake
+
+
+class BankingJourneyScenarioUser(User):
+    host = "localhost"
+    wait_time = arrival_rate(between(1, 3))
+
+    clients: BankingClients
+    runner: JourneyRunner[BankingJourneyContext]
+
+    def on_start(self) -> None:
+        """
+        Метод on_start вызывается один раз при запуске каждой сессии виртуального пользователя.
+        Здесь мы создаем клиенты gateway и проигрыватель пути клиента банка.
+        """
+        # Шаг 0: переключаемся на собственный раздел тестовых данных пользователя
+        activate_user_fake(self.environment)
+
+        # Шаг 1: создаем API клиенты, встроенные в экосистему Locust (с хуками и поддержкой сбора метрик)
+        self.clients = build_banking_locust_clients(self.environment)
+
+        # Шаг 2: переходы и паузы выбираются генератором раздела данных пользователя,
+        # поэтому с заданным FAKE.SEED пути повторяются от запуска к запуску
+        self.runner = JourneyRunner(self.environment, BANKING_JOURNEY, fake.stream.random)
+
+    @task
+    def banking_journey(self):
+        """
+        Основная нагрузочная задача: путь нового клиента банка от регистрации
+        до операций и документов (см. journeys.banking.BANKING_JOURNEY).
+        """
+        self.runner.run(BankingJourneyContext(self.clients, self.runner.generator))
@@ -1,31 +1,46 @@
 from locust import User, between, task
 
+import tools.locust_histograms  # noqa: F401 — HDR-гистограммы задержек (HISTOGRAMS.ENABLED)
+import tools.locust_settings  # noqa: F401 — аргументы командной строки для настроек gateway
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
-from clients.http.gateway.users.schema import CreateUserResponseSchema
+from seeds.pool import EntityPool
+from tools.locust_arrival_rate import arrival_rate
+from tools.locust_fakers import activate_user_fake
+from tools.locust_seeds import get_seeds_pool
 
 
 class GetUserScenarioUser(User):
     host = "localhost"
-    wait_time = between(1, 3)
+    wait_time = arrival_rate(between(1, 3))
 
     users_gateway_client: UsersGatewayHTTPClient
-    create_user_response: CreateUserResponseSchema
+    users_pool: EntityPool | None
+    user_id: str
 
     def on_start(self) -> None:
         """
         Метод on_start вызывается один раз при запуске каждой сессии виртуального пользователя.
-        Здесь мы создаем нового пользователя, отправляя POST-запрос к /api/v1/users.
+        Если задан файл сидинга (SEEDS.PATH), пользователи берутся из пула заранее созданных,
+        иначе мы создаем нового пользователя, отправляя POST-запрос к /api/v1/users.
         """
+        # Шаг 0: переключаемся на собственный раздел тестовых данных пользователя
+        activate_user_fake(self.environment)
+
         # Шаг 1: создаем API клиент, встроенный в экосистему Locust (с хуками и поддержкой сбора метрик)
         self.users_gateway_client = build_users_gateway_locust_http_client(self.environment)
 
-        # Шаг 2: создаем пользователя через API
-        self.create_user_response = self.users_gateway_client.create_user()
+        # Шаг 2: берём пул пользователей из сидинга или создаем пользователя через API
+        self.users_pool = get_seeds_pool(self.environment, "users")
+        if self.users_pool is None:
+            self.user_id = self.users_gateway_client.create_user().user.id
 
     @task
     def get_user(self):
         """
         Основная нагрузочная задача: получение информации о пользователе.
         Здесь мы выполняем GET-запрос к /api/v1/users/{user_id}.
+        С пулом сидинга пользователь выбирается на каждый запрос согласно распределению
+        (SEEDS.DISTRIBUTION), что воспроизводит попадания в кеши реального трафика.
         """
-        self.users_gateway_client.get_user(self.create_user_response.user.id)
\ No newline at end of file
+        user_id = self.users_pool.sample() if self.users_pool else self.user_id
+        self.users_gateway_client.get_user(user_id)
\ No newline at end of file
@@ -0,0 +1,176 @@
+from locust import User, between, task
+
+import tools.locust_histograms  # noqa: F401 — HDR-гистограммы задержек (HISTOGRAMS.ENABLED)
+import tools.locust_settings  # noqa: F401 — аргументы командной строки для настроек gateway
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient, build_documents_gateway_locust_http_client
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient, build_operations_gateway_locust_http_client
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from config import settings
+from journeys.state import CARD_ACCOUNT_TYPES, AccountState, CustomerState
+from tools.fakers import fake
+from tools.locust_arrival_rate import arrival_rate
+from tools.locust_fakers import activate_user_fake
+from tools.weights import load_mixed_task_weights
+
+# Веса задач читаются при загрузке locustfile (MIXED.WEIGHTS_PATH)
+weights = load_mixed_task_weights(settings.mixed.weights_path)
+
+
+class MixedHTTPScenarioUser(User):
+    """
+    Смешанная нагрузка на http-gateway: каждый метод gateway — отдельная задача,
+    доли задач задаются файлом весов (mixed_weights.toml).
+
+    Пользователь держит собственное состояние (CustomerState): задачи записи
+    добавляют в него счета, карты и операции, задачи чтения выбирают из него
+    случайные идентификаторы. Так запросы на чтение обращаются к реально
+    существующим сущностям пользователя, как в продакшене.
+    """
+
+    host = "localhost"
+    wait_time = arrival_rate(between(1, 3))
+
+    users_gateway_client: UsersGatewayHTTPClient
+    accounts_gateway_client: AccountsGatewayHTTPClient
+    cards_gateway_client: CardsGatewayHTTPClient
+    documents_gateway_client: DocumentsGatewayHTTPClient
+    operations_gateway_client: OperationsGatewayHTTPClient
+    state: CustomerState
+
+    def on_start(self) -> None:
+        """
+        Метод on_start вызывается один раз при запуске каждой сессии виртуального пользователя.
+        Здесь мы создаем пользователя с дебетовым счётом, картой и первой операцией,
+        чтобы задачам чтения с самого начала было к чему обращаться.
+        """
+        # Шаг 0: переключаемся на собственный раздел тестовых данных пользователя
+        activate_user_fake(self.environment)
+        self.generator = fake.stream.random
+
+        # Шаг 1: создаем API клиенты, встроенные в экосистему Locust (с хуками и поддержкой сбора метрик)
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.environment)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.environment)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.environment)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.environment)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.environment)
+
+        # Шаг 2: создаем пользователя, дебетовый счёт с картой и операцию пополнения
+        self.state = CustomerState(user_id=self.users_gateway_client.create_user().user.id)
+        self.open_debit_card_account()
+        self.make_top_up_operation()
+
+    @task(weights.get_user)
+    def get_user(self):
+        self.users_gateway_client.get_user(self.state.user_id)
+
+    @task(weights.create_user)
+    def create_user(self):
+        self.users_gateway_client.create_user()
+
+    @task(weights.get_accounts)
+    def get_accounts(self):
+        self.accounts_gateway_client.get_accounts(self.state.user_id)
+
+    @task(weights.open_deposit_account)
+    def open_deposit_account(self):
+        response = self.accounts_gateway_client.open_deposit_account(self.state.user_id)
+        self.state.add_account(AccountState.from_schema(response.account))
+
+    @task(weights.open_savings_account)
+    def open_savings_account(self):
+        response = self.accounts_gateway_client.open_savings_account(self.state.user_id)
+        self.state.add_account(AccountState.from_schema(response.account))
+
+    @task(weights.open_debit_card_account)
+    def open_debit_card_account(self):
+        response = self.accounts_gateway_client.open_debit_card_account(self.state.user_id)
+        self.state.add_account(AccountState.from_schema(response.account))
+
+    @task(weights.open_credit_card_account)
+    def open_credit_card_account(self):
+        response = self.accounts_gateway_client.open_credit_card_account(self.state.user_id)
+        self.state.add_account(AccountState.from_schema(response.account))
+
+    @task(weights.issue_virtual_card)
+    def issue_virtual_card(self):
+        account = self.state.choose_account(self.generator, CARD_ACCOUNT_TYPES)
+        response = self.cards_gateway_client.issue_virtual_card(self.state.user_id, account.id)
+        self.state.add_card(account, response.card.id)
+
+    @task(weights.issue_physical_card)
+    def issue_physical_card(self):
+        account = self.state.choose_account(self.generator, CARD_ACCOUNT_TYPES)
+        response = self.cards_gateway_client.issue_physical_card(self.state.user_id, account.id)
+        self.state.add_card(account, response.card.id)
+
+    @task(weights.get_tariff_document)
+    def get_tariff_document(self):
+        account = self.state.choose_account(self.generator)
+        self.documents_gateway_client.get_tariff_document(account.id)
+
+    @task(weights.get_contract_document)
+    def get_contract_document(self):
+        account = self.state.choose_account(self.generator)
+        self.documents_gateway_client.get_contract_document(account.id)
+
+    @task(weights.get_operation)
+    def get_operation(self):
+        operation_id = self.generator.choice(self.state.operation_ids)
+        self.operations_gateway_client.get_operation(operation_id)
+
+    @task(weights.get_operation_receipt)
+    def get_operation_receipt(self):
+        operation_id = self.generator.choice(self.state.operation_ids)
+        self.operations_gateway_client.get_operation_receipt(operation_id)
+
+    @task(weights.get_operations)
+    def get_operations(self):
+        account = self.state.choose_account(self.generator)
+        self.operations_gateway_client.get_operations(account.id)
+
+    @task(weights.get_operations_summary)
+    def get_operations_summary(self):
+        account = self.state.choose_account(self.generator)
+        self.operations_gateway_client.get_operation_summary(account.id)
+
+    def make_operation(self, operation: str) -> None:
+        """
+        Проводит карточную операцию по случайной карте пользователя и запоминает её.
+
+        :param operation: Вид операции, например "purchase".
+        """
+        make = getattr(self.operations_gateway_client, f"make_{operation}_operation")
+
+        account, card_id = self.state.choose_card(self.generator)
+        response = make(account_id=account.id, card_id=card_id)
+        self.state.add_operation(response.operation.id)
+
+    @task(weights.make_fee_operation)
+    def make_fee_operation(self):
+        self.make_operation("fee")
+
+    @task(weights.make_top_up_operation)
+    def make_top_up_operation(self):
+        self.make_operation("top_up")
+
+    @task(weights.make_cashback_operation)
+    def make_cashback_operation(self):
+        self.make_operation("cashback")
+
+    @task(weights.make_transfer_operation)
+    def make_transfer_operation(self):
+        self.make_operation("transfer")
+
+    @task(weights.make_purchase_operation)
+    def make_purchase_operation(self):
+        self.make_operation("purchase")
+
+    @task(weights.make_bill_payment_operation)
+    def make_bill_payment_operation(self):
+        self.make_operation("bill_payment")
+
+    @task(weights.make_cash_withdrawal_operation)
+    def make_cash_withdrawal_operation(self):
+        self.make_operation("cash_withdrawal")
@@ -1,37 +1,59 @@
 from locust import User, between, task
 
+import tools.locust_histograms  # noqa: F401 — HDR-гистограммы задержек (HISTOGRAMS.ENABLED)
+import tools.locust_settings  # noqa: F401 — аргументы командной строки для настроек gateway
 from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
 from clients.http.gateway.accounts.schema import OpenDebitCardAccountRequestSchema
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
-from clients.http.gateway.users.schema import CreateUserResponseSchema
+from seeds.pool import EntityPool
+from tools.locust_arrival_rate import arrival_rate
+from tools.locust_fakers import activate_user_fake
+from tools.locust_seeds import get_seeds_pool
 
 
 class OpenDebitCardAccountScenarioUser(User):
     host = "localhost"
-    wait_time = between(1, 3)
+    wait_time = arrival_rate(between(1, 3))
 
     users_gateway_client: UsersGatewayHTTPClient
-    create_user_response: CreateUserResponseSchema
+    users_pool: EntityPool | None
+    user_id: str
     accounts_gateway_client: AccountsGatewayHTTPClient
 
     def on_start(self) -> None:
         """
         Метод on_start вызывается один раз при запуске каждой сессии виртуального пользователя.
-        Здесь мы создаем нового пользователя, отправляя POST-запрос к /api/v1/users.
+        Здесь мы захватываем заранее созданного пользователя из пула сидинга (SEEDS.PATH),
+        а если файл не задан — создаем нового, отправляя POST-запрос к /api/v1/users.
         """
+        # Шаг 0: переключаемся на собственный раздел тестовых данных пользователя
+        activate_user_fake(self.environment)
+
         # Шаг 1: создаем API клиент, встроенный в экосистему Locust (с хуками и поддержкой сбора метрик)
         self.users_gateway_client = build_users_gateway_locust_http_client(self.environment)
 
-        # Шаг 2: создаем пользователя через API
-        self.create_user_response = self.users_gateway_client.create_user()
+        # Шаг 2: захватываем пользователя из пула сидинга (до on_stop он не достанется
+        # другим виртуальным пользователям) или создаем его через API
+        self.users_pool = get_seeds_pool(self.environment, "users")
+        if self.users_pool is not None:
+            self.user_id = self.users_pool.checkout()
+        else:
+            self.user_id = self.users_gateway_client.create_user().user.id
 
         self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.environment)
 
+    def on_stop(self) -> None:
+        """
+        Возвращает захваченного пользователя в пул сидинга.
+        """
+        if self.users_pool is not None:
+            self.users_pool.release(self.user_id)
+
     @task
     def open_debit_card(self):
         """
         Основная нагрузочная задача: создание дебетовой карты.
         Здесь мы выполняем POST-запрос к /api/v1/accounts/open-debit-card-account.
         """
-        request = OpenDebitCardAccountRequestSchema(userId= self.create_user_response.user.id)
+        request = OpenDebitCardAccountRequestSchema(userId=self.user_id)
         self.accounts_gateway_client.open_debit_card_account_api(request)
\ No newline at end of file
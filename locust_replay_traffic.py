@@ -0,0 +1,40 @@
+from locust import User, constant, task
+from locust.exception import StopUser
+
+import tools.locust_histograms  # noqa: F401 — HDR-гистограммы задержек (HISTOGRAMS.ENABLED)
+import tools.locust_settings  # noqa: F401 — аргументы командной строки для настроек gateway
+from config import settings
+from replay.player import TrafficPlayer, build_traffic_player
+from replay.reader import read_traffic_records
+
+
+class ReplayTrafficUser(User):
+    """
+    Проигрывает записанный журнал трафика (REPLAY.PATH) против gateway.
+
+    Частоту запросов задаёт журнал, а не число пользователей: в тесте работает
+    ровно один проигрыватель (fixed_count = 1), который отправляет каждый запрос
+    в отдельном greenlet'е в момент, записанный в журнале (с учётом REPLAY.SPEED).
+    """
+
+    host = "localhost"
+    fixed_count = 1
+    wait_time = constant(0)
+
+    player: TrafficPlayer
+
+    def on_start(self) -> None:
+        """
+        Создаем проигрыватель с клиентами gateway, встроенными в экосистему Locust.
+        """
+        self.player = build_traffic_player(self.environment, speed=settings.replay.speed)
+
+    @task
+    def replay(self):
+        """
+        Проигрываем журнал целиком. Без REPLAY.LOOP пользователь после этого останавливается.
+        """
+        self.player.play(read_traffic_records(settings.replay.path))
+
+        if not settings.replay.loop:
+            raise StopUser()
@@ -0,0 +1,38 @@
+import argparse
+from pathlib import Path
+
+from metrics.encoding import add_encoded_histograms, decode_histograms
+from metrics.sink import format_histograms_report, write_histograms_report
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m metrics",
+        description="Выводит перцентили сохранённых гистограмм задержек, складывая несколько запусков",
+    )
+    parser.add_argument(
+        "paths",
+        type=Path,
+        nargs="+",
+        help="Файлы гистограмм запусков, например reports/histograms/20250101-120000.hist",
+    )
+    parser.add_argument("--csv", type=Path, help="Сохранить перцентили в CSV")
+    return parser.parse_args()
+
+
+def main() -> None:
+    arguments = parse_arguments()
+
+    first, *others = arguments.paths
+    sink = decode_histograms(first.read_bytes())
+    for path in others:
+        add_encoded_histograms(sink, path.read_bytes())
+
+    print(format_histograms_report(sink))
+
+    if arguments.csv is not None:
+        write_histograms_report(sink, arguments.csv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterator
+
+from metrics.histogram import LatencyHistogram
+from metrics.sink import LatencyHistogramSink
+
+# Гистограмма: сигнатура, версия, параметры (lowest, highest, significant_figures),
+# min (-1 для пустой), max, clamped, размер сжатых счётчиков
+HISTOGRAM_HEADER = struct.Struct("<4sHQQBqQQI")
+HISTOGRAM_MAGIC = b"LHST"
+HISTOGRAM_VERSION = 1
+
+# Набор гистограмм: сигнатура, версия, параметры приёмника (expected_interval,
+# significant_figures, highest_value в мкс), число строк
+SINK_HEADER = struct.Struct("<4sHQBQI")
+SINK_MAGIC = b"LHSS"
+SINK_VERSION = 1
+
+# Строка набора: длины типа запроса и имени (UTF-8), размеры гистограмм raw и corrected
+# (0 — исправленной гистограммы нет)
+SINK_ENTRY_HEADER = struct.Struct("<HHII")
+
+
+def encode_varint(value: int, buffer: bytearray) -> None:
+    """
+    Дописывает неотрицательное число в буфер в формате LEB128 (7 бит на байт).
+    """
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def iter_varints(data: bytes) -> Iterator[int]:
+    """
+    Читает последовательность чисел LEB128.
+    """
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+
+        yield value
+        value = 0
+        shift = 0
+
+
+def encode_counts(histogram: LatencyHistogram) -> bytes:
+    """
+    Кодирует счётчики гистограммы так же, как HdrHistogram (V2): ненулевой счётчик
+    записывается своим значением, серия нулевых — отрицательной длиной серии.
+    Числа кодируются zigzag + LEB128, результат сжимается zlib.
+
+    Гистограмма задержек почти целиком состоит из нулей вокруг нескольких сотен
+    заполненных счётчиков, поэтому блоб занимает единицы килобайт при любом числе
+    записанных значений.
+    """
+    buffer = bytearray()
+
+    zeros = 0
+    for index in range(max(histogram.get_counts_index(histogram.max_value) + 1, 0)):
+        count = histogram.counts[index]
+        if not count:
+            zeros += 1
+            continue
+
+        if zeros:
+            encode_varint(2 * zeros - 1, buffer)  # zigzag(-zeros)
+            zeros = 0
+        encode_varint(2 * count, buffer)  # zigzag(count)
+
+    return zlib.compress(bytes(buffer), 1)
+
+
+def decode_counts(data: bytes) -> Iterator[tuple[int, int]]:
+    """
+    Декодирует счётчики, закодированные encode_counts.
+
+    :return: Пары (индекс, число значений) для ненулевых счётчиков.
+    """
+    index = 0
+    for value in iter_varints(zlib.decompress(data)):
+        if value & 1:
+            index += (value + 1) // 2  # серия нулей
+            continue
+
+        yield index, value // 2
+        index += 1
+
+
+def encode_histogram(histogram: LatencyHistogram) -> bytes:
+    """
+    Сериализует гистограмму в компактный бинарный блоб.
+
+    :param histogram: Гистограмма.
+    :return: Заголовок (HISTOGRAM_HEADER) и сжатые счётчики.
+    """
+    counts = encode_counts(histogram) if histogram.total_count else b""
+
+    return (
+        HISTOGRAM_HEADER.pack(
+            HISTOGRAM_MAGIC,
+            HISTOGRAM_VERSION,
+            histogram.lowest_value,
+            histogram.highest_value,
+            histogram.significant_figures,
+            -1 if histogram.min_value is None else histogram.min_value,
+            histogram.max_value,
+            histogram.clamped,
+            len(counts),
+        )
+        + counts
+    )
+
+
+def decode_histogram(data: bytes | memoryview) -> LatencyHistogram:
+    """
+    Восстанавливает гистограмму из блоба encode_histogram.
+
+    :raises ValueError: Блоб не является гистограммой поддерживаемой версии.
+    """
+    (
+        magic,
+        version,
+        lowest_value,
+        highest_value,
+        significant_figures,
+        min_value,
+        max_value,
+        clamped,
+        counts_size,
+    ) = HISTOGRAM_HEADER.unpack_from(data)
+    if magic != HISTOGRAM_MAGIC or version != HISTOGRAM_VERSION:
+        raise ValueError(f"Unsupported histogram blob {magic!r} version {version}")
+
+    histogram = LatencyHistogram(lowest_value, highest_value, significant_figures)
+    if counts_size:
+        counts = bytes(data[HISTOGRAM_HEADER.size : HISTOGRAM_HEADER.size + counts_size])
+        histogram.add_counts(
+            decode_counts(counts),
+            min_value=None if min_value < 0 else min_value,
+            max_value=max_value,
+            clamped=clamped,
+        )
+
+    return histogram
+
+
+def encode_histograms(sink: LatencyHistogramSink) -> bytes:
+    """
+    Сериализует все гистограммы приёмника в один блоб: так воркер отправляет
+    их мастеру и так они сохраняются по завершении запуска.
+
+    :param sink: Приёмник гистограмм.
+    :return: Блоб с заголовком SINK_HEADER и строками SINK_ENTRY_HEADER.
+    """
+    buffer = bytearray(
+        SINK_HEADER.pack(
+            SINK_MAGIC,
+            SINK_VERSION,
+            sink.expected_interval,
+            sink.significant_figures,
+            sink.highest_value,
+            len(sink.histograms),
+        )
+    )
+
+    for (request_type, name), histograms in sink.histograms.items():
+        request_type_data = request_type.encode()
+        name_data = name.encode()
+        raw = encode_histogram(histograms.raw)
+        corrected = encode_histogram(histograms.corrected) if histograms.corrected else b""
+
+        buffer += SINK_ENTRY_HEADER.pack(
+            len(request_type_data), len(name_data), len(raw), len(corrected)
+        )
+        buffer += request_type_data + name_data + raw + corrected
+
+    return bytes(buffer)
+
+
+def add_encoded_histograms(sink: LatencyHistogramSink, data: bytes) -> None:
+    """
+    Добавляет к приёмнику гистограммы из блоба encode_histograms.
+
+    :raises ValueError: Блоб не является набором гистограмм поддерживаемой версии.
+    """
+    magic, version, _, _, _, entries = SINK_HEADER.unpack_from(data)
+    if magic != SINK_MAGIC or version != SINK_VERSION:
+        raise ValueError(f"Unsupported histograms blob {magic!r} version {version}")
+
+    view = memoryview(data)
+    offset = SINK_HEADER.size
+    for _ in range(entries):
+        request_type_size, name_size, raw_size, corrected_size = (
+            SINK_ENTRY_HEADER.unpack_from(view, offset)
+        )
+        offset += SINK_ENTRY_HEADER.size
+
+        request_type = bytes(view[offset : offset + request_type_size]).decode()
+        offset += request_type_size
+        name = bytes(view[offset : offset + name_size]).decode()
+        offset += name_size
+
+        histograms = sink.get_histograms(request_type, name)
+        histograms.raw.merge(decode_histogram(view[offset : offset + raw_size]))
+        offset += raw_size
+
+        if corrected_size and histograms.corrected is not None:
+            histograms.corrected.merge(decode_histogram(view[offset : offset + corrected_size]))
+        offset += corrected_size
+
+
+def decode_histograms(data: bytes) -> LatencyHistogramSink:
+    """
+    Восстанавливает приёмник гистограмм (с его параметрами) из блоба encode_histograms.
+    """
+    _, _, expected_interval, significant_figures, highest_value, _ = SINK_HEADER.unpack_from(
+        data
+    )
+
+    sink = LatencyHistogramSink(
+        expected_interval=expected_interval / 1000,
+        significant_figures=significant_figures,
+        highest_value=highest_value / 1000,
+    )
+    add_encoded_histograms(sink, data)
+
+    return sink
+
+
+def save_histograms(sink: LatencyHistogramSink, path: Path) -> None:
+    """
+    Сохраняет гистограммы запуска в файл, например reports/histograms/20250101-120000.hist.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_histograms(sink))
+
+
+def load_histograms(path: Path) -> LatencyHistogramSink:
+    """
+    Загружает гистограммы, сохранённые save_histograms.
+    """
+    return decode_histograms(path.read_bytes())
@@ -0,0 +1,284 @@
+import math
+from array import array
+from typing import Iterable, Iterator
+
+# Перцентили, которые выводятся в отчётах: от медианы до «пяти девяток»
+REPORT_PERCENTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9, 99.99, 99.999)
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек с постоянной относительной точностью (HDR Histogram).
+
+    Значения — целые числа (микросекунды). Диапазон значений делится на корзины
+    по степеням двойки, каждая корзина — на равные подкорзины. Поэтому относительная
+    погрешность любого значения не превышает 10^-significant_figures, а память
+    не зависит от числа записанных значений: только от диапазона и точности.
+
+    Гистограммы с одинаковыми параметрами складываются без потерь (merge):
+    перцентили объединённой гистограммы точно такие же, как если бы все значения
+    записывались в одну гистограмму. В отличие от усреднения перцентилей воркеров.
+
+    Раскладка счётчиков совпадает с HdrHistogram, поэтому индексы счётчиков
+    можно передавать между процессами как есть.
+    """
+
+    def __init__(
+        self,
+        lowest_value: int = 1,
+        highest_value: int = 3_600_000_000,
+        significant_figures: int = 3,
+    ):
+        """
+        :param lowest_value: Наименьшее различимое значение (>= 1).
+        :param highest_value: Наибольшее записываемое значение. Большие значения
+                              записываются как highest_value и учитываются в clamped.
+        :param significant_figures: Число значащих цифр точности, от 1 до 5.
+        """
+        if lowest_value < 1:
+            raise ValueError("lowest_value must be at least 1")
+        if highest_value < 2 * lowest_value:
+            raise ValueError("highest_value must be at least twice the lowest_value")
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+
+        self.lowest_value = lowest_value
+        self.highest_value = highest_value
+        self.significant_figures = significant_figures
+
+        single_unit_resolution = 2 * 10**significant_figures
+        sub_bucket_count_magnitude = math.ceil(math.log2(single_unit_resolution))
+
+        self.unit_magnitude = int(math.floor(math.log2(lowest_value)))
+        self.sub_bucket_half_count_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        self.sub_bucket_count = 1 << (self.sub_bucket_half_count_magnitude + 1)
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = (self.sub_bucket_count - 1) << self.unit_magnitude
+
+        # Число корзин, чтобы highest_value попадало в последнюю
+        smallest_untrackable_value = self.sub_bucket_count << self.unit_magnitude
+        self.bucket_count = 1
+        while smallest_untrackable_value <= highest_value:
+            smallest_untrackable_value <<= 1
+            self.bucket_count += 1
+
+        self.counts = array("q", bytes(8 * self.counts_length))
+        self.total_count = 0
+        self.min_value: int | None = None
+        self.max_value = 0
+        self.clamped = 0
+
+    @property
+    def counts_length(self) -> int:
+        return (self.bucket_count + 1) * self.sub_bucket_half_count
+
+    def get_layout(self) -> tuple[int, int, int]:
+        """
+        Параметры гистограммы: гистограммы с одинаковыми параметрами складываются поэлементно.
+        """
+        return self.lowest_value, self.highest_value, self.significant_figures
+
+    def get_counts_index(self, value: int) -> int:
+        """
+        Возвращает индекс счётчика, в который попадает значение.
+        """
+        bucket_index = (
+            (value | self.sub_bucket_mask).bit_length()
+            - self.unit_magnitude
+            - (self.sub_bucket_half_count_magnitude + 1)
+        )
+        sub_bucket_index = value >> (bucket_index + self.unit_magnitude)
+
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + (
+            sub_bucket_index - self.sub_bucket_half_count
+        )
+
+    def get_value_range(self, index: int) -> tuple[int, int]:
+        """
+        Возвращает диапазон значений [наименьшее, наибольшее], попадающих в счётчик index.
+        """
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+
+        lowest = sub_bucket_index << (bucket_index + self.unit_magnitude)
+        size = 1 << (bucket_index + self.unit_magnitude)
+
+        return lowest, lowest + size - 1
+
+    def record_value(self, value: int, count: int = 1) -> None:
+        """
+        Записывает значение count раз.
+
+        :param value: Значение (например, время ответа в микросекундах), >= 0.
+        :param count: Сколько раз записать значение.
+        """
+        value = max(value, 0)
+        if value > self.highest_value:
+            value = self.highest_value
+            self.clamped += count
+
+        self.counts[self.get_counts_index(value)] += count
+        self.total_count += count
+
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+    def record_corrected_value(self, value: int, expected_interval: int) -> None:
+        """
+        Записывает значение с поправкой на coordinated omission.
+
+        Если клиент ждал ответ дольше ожидаемого интервала между запросами, за это время
+        он не отправил запросы, которые по плану должен был отправить. Их задержки
+        восстанавливаются так же, как в HdrHistogram (recordValueWithExpectedInterval):
+        дополнительно записываются значения value - k * expected_interval, пока они
+        не меньше expected_interval.
+
+        Поправочные значения одного счётчика записываются одним сложением, поэтому
+        долгая пауза при маленьком интервале не превращается в миллионы записей.
+
+        :param value: Значение, >= 0.
+        :param expected_interval: Ожидаемый интервал между запросами в тех же единицах.
+                                  0 — без поправки.
+        """
+        self.record_value(value)
+
+        if expected_interval <= 0 or value <= expected_interval:
+            return
+
+        missing_value = min(value, self.highest_value) - expected_interval
+        while missing_value >= expected_interval:
+            lowest, _ = self.get_value_range(self.get_counts_index(missing_value))
+
+            # Сколько членов прогрессии missing_value, missing_value - interval, ...
+            # попадает в тот же счётчик (и не меньше expected_interval)
+            count = (missing_value - max(lowest, expected_interval)) // expected_interval + 1
+            self.record_value(missing_value, count)
+
+            missing_value -= count * expected_interval
+
+    def iter_counts(self) -> Iterator[tuple[int, int]]:
+        """
+        Возвращает непустые счётчики: пары (индекс, число значений).
+        """
+        for index, count in enumerate(self.counts):
+            if count:
+                yield index, count
+
+    def add_counts(
+        self,
+        counts: Iterable[tuple[int, int]],
+        min_value: int | None = None,
+        max_value: int = 0,
+        clamped: int = 0,
+    ) -> None:
+        """
+        Добавляет счётчики гистограммы с такими же параметрами (см. iter_counts).
+
+        :param counts: Пары (индекс, число значений).
+        :param min_value: Наименьшее значение добавляемой гистограммы.
+        :param max_value: Наибольшее значение добавляемой гистограммы.
+        :param clamped: Число обрезанных значений добавляемой гистограммы.
+        """
+        for index, count in counts:
+            self.counts[index] += count
+            self.total_count += count
+
+        if min_value is not None and (self.min_value is None or min_value < self.min_value):
+            self.min_value = min_value
+        self.max_value = max(self.max_value, max_value)
+        self.clamped += clamped
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Добавляет значения другой гистограммы.
+
+        Гистограммы с одинаковыми параметрами складываются поэлементно без потерь.
+        Иначе значения другой гистограммы перезаписываются с точностью этой.
+        """
+        if other.get_layout() == self.get_layout():
+            self.add_counts(other.iter_counts(), other.min_value, other.max_value, other.clamped)
+            return
+
+        for index, count in other.iter_counts():
+            _, highest = other.get_value_range(index)
+            self.record_value(highest, count)
+
+    def reset(self) -> None:
+        self.counts = array("q", bytes(8 * self.counts_length))
+        self.total_count = 0
+        self.min_value = None
+        self.max_value = 0
+        self.clamped = 0
+
+    def get_value_at_percentile(self, percentile: float) -> int:
+        """
+        Возвращает значение перцентиля: наибольшее значение, эквивалентное (в пределах
+        точности) значению, ниже или равным которому записано percentile% значений.
+
+        :param percentile: Перцентиль от 0 до 100, например 99.9.
+        :return: Значение или 0 для пустой гистограммы.
+        """
+        if not self.total_count:
+            return 0
+
+        count_at_percentile = max(int(min(percentile, 100.0) / 100 * self.total_count + 0.5), 1)
+
+        total = 0
+        for index, count in self.iter_counts():
+            total += count
+            if total >= count_at_percentile:
+                _, highest = self.get_value_range(index)
+                return min(highest, self.max_value)
+
+        return self.max_value
+
+    def get_percentiles(
+        self, percentiles: Iterable[float] = REPORT_PERCENTILES
+    ) -> dict[float, int]:
+        """
+        Возвращает значения нескольких перцентилей за один проход по счётчикам.
+
+        :param percentiles: Перцентили от 0 до 100.
+        :return: Словарь {перцентиль: значение}.
+        """
+        targets = sorted(percentiles)
+        values = {percentile: 0 for percentile in targets}
+        if not self.total_count:
+            return values
+
+        pending = iter(targets)
+        percentile = next(pending, None)
+
+        total = 0
+        for index, count in self.iter_counts():
+            total += count
+            while percentile is not None and total >= max(
+                int(min(percentile, 100.0) / 100 * self.total_count + 0.5), 1
+            ):
+                _, highest = self.get_value_range(index)
+                values[percentile] = min(highest, self.max_value)
+                percentile = next(pending, None)
+
+            if percentile is None:
+                break
+
+        return values
+
+    def get_mean(self) -> float:
+        """
+        Среднее значение (по серединам диапазонов счётчиков).
+        """
+        if not self.total_count:
+            return 0.0
+
+        total = 0
+        for index, count in self.iter_counts():
+            lowest, highest = self.get_value_range(index)
+            total += (lowest + highest) // 2 * count
+
+        return total / self.total_count
@@ -0,0 +1,182 @@
+import csv
+from pathlib import Path
+from typing import Any, Collection
+
+from metrics.histogram import REPORT_PERCENTILES, LatencyHistogram
+
+# Ключ гистограммы — как у строки статистики Locust: (тип запроса, имя)
+HistogramKey = tuple[str, str]
+
+
+class LatencyHistograms:
+    """
+    Гистограммы одной строки статистики.
+
+    - raw — время ответа как оно измерено;
+    - corrected — то же с поправкой на coordinated omission (только если задан
+      ожидаемый интервал между запросами, см. LatencyHistogram.record_corrected_value).
+    """
+
+    __slots__ = ("raw", "corrected")
+
+    def __init__(self, raw: LatencyHistogram, corrected: LatencyHistogram | None):
+        self.raw = raw
+        self.corrected = corrected
+
+
+class LatencyHistogramSink:
+    """
+    Приёмник метрик запросов Locust, который ведёт HDR-гистограммы задержек
+    по строкам статистики (тип запроса + имя).
+
+    Статистика Locust хранит время ответа с округлением до двух значащих цифр
+    и не учитывает запросы, которые не были отправлены, пока пользователь ждал
+    медленный ответ (coordinated omission). Здесь значения хранятся в микросекундах
+    с заданной точностью, а при заданном ожидаемом интервале между запросами
+    рядом с измеренной ведётся исправленная гистограмма.
+
+    Гистограммы воркеров складываются на мастере без потерь: они передаются
+    компактным бинарным блобом (см. metrics.encoding).
+    """
+
+    def __init__(
+        self,
+        expected_interval: float = 0,
+        significant_figures: int = 3,
+        highest_value: float = 3_600_000,
+        request_types: Collection[str] | None = None,
+    ):
+        """
+        :param expected_interval: Ожидаемый интервал между запросами одного пользователя, мс.
+                                  0 — без поправки на coordinated omission.
+        :param significant_figures: Точность гистограмм (число значащих цифр).
+        :param highest_value: Наибольшее записываемое время ответа, мс.
+        :param request_types: Типы запросов, для которых ведутся гистограммы,
+                              например ("HTTP", "gRPC"). None — все.
+        """
+        self.expected_interval = round(expected_interval * 1000)
+        self.significant_figures = significant_figures
+        self.highest_value = round(highest_value * 1000)
+        self.request_types = set(request_types) if request_types is not None else None
+        self.histograms: dict[HistogramKey, LatencyHistograms] = {}
+
+    def build_histogram(self) -> LatencyHistogram:
+        return LatencyHistogram(
+            highest_value=self.highest_value,
+            significant_figures=self.significant_figures,
+        )
+
+    def get_histograms(self, request_type: str, name: str) -> LatencyHistograms:
+        key = (request_type, name)
+
+        histograms = self.histograms.get(key)
+        if histograms is None:
+            histograms = self.histograms[key] = LatencyHistograms(
+                raw=self.build_histogram(),
+                corrected=self.build_histogram() if self.expected_interval else None,
+            )
+
+        return histograms
+
+    def record(self, request_type: str, name: str, response_time: float) -> None:
+        """
+        Записывает время ответа запроса.
+
+        :param request_type: Тип запроса, например "HTTP".
+        :param name: Имя запроса, например "GET /api/v1/users/{user_id}".
+        :param response_time: Время ответа, мс.
+        """
+        if self.request_types is not None and request_type not in self.request_types:
+            return
+
+        value = round(response_time * 1000)
+        histograms = self.get_histograms(request_type, name)
+
+        histograms.raw.record_value(value)
+        if histograms.corrected is not None:
+            histograms.corrected.record_corrected_value(value, self.expected_interval)
+
+    def merge(self, other: "LatencyHistogramSink") -> None:
+        """
+        Добавляет гистограммы другого приёмника.
+        """
+        for (request_type, name), other_histograms in other.histograms.items():
+            histograms = self.get_histograms(request_type, name)
+            histograms.raw.merge(other_histograms.raw)
+            if histograms.corrected is not None and other_histograms.corrected is not None:
+                histograms.corrected.merge(other_histograms.corrected)
+
+    def reset(self) -> None:
+        self.histograms.clear()
+
+    def get_report_rows(self) -> list[dict[str, Any]]:
+        """
+        Возвращает строки отчёта: число запросов, среднее, перцентили и максимум в мс
+        для измеренных и (если включена поправка) исправленных значений.
+        """
+        rows = []
+        for (request_type, name), histograms in sorted(self.histograms.items()):
+            variants = [("raw", histograms.raw)]
+            if histograms.corrected is not None:
+                variants.append(("corrected", histograms.corrected))
+
+            for variant, histogram in variants:
+                percentiles = histogram.get_percentiles(REPORT_PERCENTILES)
+                rows.append(
+                    {
+                        "Type": request_type,
+                        "Name": name,
+                        "Histogram": variant,
+                        "Count": histogram.total_count,
+                        "Mean": round(histogram.get_mean() / 1000, 3),
+                        **{
+                            f"p{percentile:g}": value / 1000
+                            for percentile, value in percentiles.items()
+                        },
+                        "Max": histogram.max_value / 1000,
+                    }
+                )
+
+        return rows
+
+
+def write_histograms_report(sink: LatencyHistogramSink, path: Path) -> None:
+    """
+    Сохраняет перцентили гистограмм в CSV (время в мс).
+
+    :param sink: Приёмник с гистограммами.
+    :param path: Путь к CSV-файлу, например reports/latency_histograms.csv.
+    """
+    rows = sink.get_report_rows()
+    if not rows:
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def format_histograms_report(sink: LatencyHistogramSink) -> str:
+    """
+    Форматирует перцентили гистограмм таблицей для вывода в лог.
+    """
+    rows = sink.get_report_rows()
+    if not rows:
+        return ""
+
+    columns = [f"p{percentile:g}" for percentile in REPORT_PERCENTILES]
+    lines = [
+        f"{'Type':<10} {'Name':<50} {'':<9} {'# reqs':>8} "
+        + " ".join(f"{column:>9}" for column in columns)
+        + f" {'Max':>9}"
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['Type']:<10} {row['Name'][:50]:<50} {row['Histogram']:<9} {row['Count']:>8} "
+            + " ".join(f"{row[column]:>9.3f}" for column in columns)
+            + f" {row['Max']:>9.3f}"
+        )
+
+    return "\n".join(lines)
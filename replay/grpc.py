@@ -0,0 +1,80 @@
+import importlib
+import pkgutil
+from functools import lru_cache
+from typing import Any, Callable
+
+from google.protobuf import descriptor_pool, json_format, message_factory
+from google.protobuf.message import Message
+from grpc import Channel
+
+import contracts.services.gateway
+
+MessageClass = type[Message]
+
+
+@lru_cache(maxsize=None)
+def import_gateway_contracts() -> None:
+    """
+    Импортирует сгенерированные модули контрактов gateway, регистрируя их
+    описания (дескрипторы) в пуле дескрипторов protobuf по умолчанию.
+    """
+    for module in pkgutil.walk_packages(
+        contracts.services.gateway.__path__, f"{contracts.services.gateway.__name__}."
+    ):
+        if module.name.endswith("_pb2"):
+            importlib.import_module(module.name)
+
+
+@lru_cache(maxsize=None)
+def get_grpc_method_messages(method: str) -> tuple[MessageClass, MessageClass]:
+    """
+    Находит классы сообщений запроса и ответа gRPC-метода по его имени.
+
+    :param method: Полное имя метода, например
+                   "/contracts.services.gateway.users.UsersGatewayService/GetUser".
+    :return: Классы сообщений (запрос, ответ).
+    :raises KeyError: Метод не найден в контрактах.
+    """
+    import_gateway_contracts()
+
+    descriptor = descriptor_pool.Default().FindMethodByName(
+        method.lstrip("/").replace("/", ".")
+    )
+    return (
+        message_factory.GetMessageClass(descriptor.input_type),
+        message_factory.GetMessageClass(descriptor.output_type),
+    )
+
+
+def build_grpc_request(method: str, body: Any | None) -> Message:
+    """
+    Собирает protobuf-сообщение запроса из его JSON-представления.
+
+    :param method: Полное имя gRPC-метода.
+    :param body: JSON-представление запроса (как в json_format.MessageToDict).
+    :return: Сообщение запроса.
+    """
+    request_class, _ = get_grpc_method_messages(method)
+    return json_format.ParseDict(body or {}, request_class())
+
+
+class GRPCMethodCallables:
+    """
+    Multi-callable'ы gRPC-методов канала, создаваемые по имени метода при первом вызове.
+    """
+
+    def __init__(self, channel: Channel):
+        self.channel = channel
+        self.callables: dict[str, Callable[..., Message]] = {}
+
+    def get(self, method: str) -> Callable[..., Message]:
+        callable_ = self.callables.get(method)
+        if callable_ is None:
+            request_class, response_class = get_grpc_method_messages(method)
+            callable_ = self.callables[method] = self.channel.unary_unary(
+                method,
+                request_serializer=request_class.SerializeToString,
+                response_deserializer=response_class.FromString,
+            )
+
+        return callable_
@@ -0,0 +1,138 @@
+import logging
+import time
+from typing import Iterable
+
+import gevent
+from gevent.pool import Group
+from google.protobuf.json_format import ParseError
+from grpc import Channel, RpcError
+from httpx import Client, HTTPError
+from locust.env import Environment
+
+import clients.grpc.client  # noqa: F401 — инициализация поддержки gevent в gRPC
+from clients.grpc.gateway.client import build_gateway_locust_grpc_client
+from clients.http.gateway.client import build_gateway_locust_http_client
+from replay.grpc import GRPCMethodCallables, build_grpc_request
+from replay.schema import TrafficRecord
+
+logger = logging.getLogger(__name__)
+
+
+class TrafficPlayer:
+    """
+    Проигрыватель журнала трафика: отправляет записанные запросы в gateway
+    с теми же интервалами между ними, что и в журнале.
+
+    Каждый запрос отправляется в отдельном greenlet'е в момент, вычисленный
+    от начала проигрывания, а не после завершения предыдущего запроса.
+    Поэтому замедление сервера не снижает частоту запросов (открытая модель нагрузки),
+    как это происходит с циклом @task.
+
+    Метрики отправляют клиенты gateway (event hooks и LocustInterceptor);
+    проигрыватель сам отправляет только ошибки транспорта, до которых хуки не доходят.
+    """
+
+    def __init__(
+        self,
+        environment: Environment,
+        http_client: Client,
+        grpc_channel: Channel,
+        speed: float = 1.0,
+    ):
+        """
+        :param environment: Окружение Locust.
+        :param http_client: HTTP-клиент gateway с хуками Locust.
+        :param grpc_channel: gRPC-канал gateway с LocustInterceptor.
+        :param speed: Ускорение проигрывания: 2 — интервалы между запросами вдвое короче.
+        """
+        self.environment = environment
+        self.http_client = http_client
+        self.grpc_callables = GRPCMethodCallables(grpc_channel)
+        self.speed = speed
+        self.group = Group()
+
+    def play(self, records: Iterable[TrafficRecord]) -> None:
+        """
+        Проигрывает записи и ждёт завершения всех отправленных запросов.
+        Если проигрывание прервано (остановка пользователя), незавершённые запросы отменяются.
+
+        :param records: Записи журнала в порядке времени (например, из read_traffic_records).
+        """
+        started = time.monotonic()
+        first_timestamp: float | None = None
+
+        try:
+            for record in records:
+                if first_timestamp is None:
+                    first_timestamp = record.timestamp
+
+                delay = (record.timestamp - first_timestamp) / self.speed
+                wait = started + delay - time.monotonic()
+                if wait > 0:
+                    gevent.sleep(wait)
+
+                self.group.spawn(self.send, record)
+
+            self.group.join()
+        finally:
+            # Пользователь остановлен посреди журнала (конец теста): отправленные
+            # запросы не должны выполняться после его остановки
+            self.group.kill()
+
+    def send(self, record: TrafficRecord) -> None:
+        """
+        Отправляет одну запись журнала по HTTP или gRPC.
+        """
+        if record.grpc_method:
+            self.send_grpc(record)
+        else:
+            self.send_http(record)
+
+    def send_http(self, record: TrafficRecord) -> None:
+        started = time.perf_counter()
+        route = record.name or record.route
+
+        try:
+            self.http_client.request(
+                record.method,
+                record.route,
+                json=record.body,
+                extensions={"route": route},
+            )
+        except HTTPError as error:
+            # Ответа нет, поэтому response event hook не вызывался
+            self.environment.events.request.fire(
+                name=f"{record.method} {route}",
+                context=None,
+                response=None,
+                exception=error,
+                request_type="HTTP",
+                response_time=(time.perf_counter() - started) * 1000,
+                response_length=0,
+            )
+
+    def send_grpc(self, record: TrafficRecord) -> None:
+        try:
+            request = build_grpc_request(record.grpc_method, record.body)
+            self.grpc_callables.get(record.grpc_method)(request)
+        except RpcError:
+            # Ошибка вызова уже отправлена в Locust интерцептором
+            pass
+        except (KeyError, ParseError) as error:
+            logger.warning("Skipping record of %s: %s", record.grpc_method, error)
+
+
+def build_traffic_player(environment: Environment, speed: float = 1.0) -> TrafficPlayer:
+    """
+    Создаёт проигрыватель журнала трафика с клиентами gateway, адаптированными под Locust.
+
+    :param environment: Окружение Locust.
+    :param speed: Ускорение проигрывания.
+    :return: Экземпляр TrafficPlayer.
+    """
+    return TrafficPlayer(
+        environment=environment,
+        http_client=build_gateway_locust_http_client(environment),
+        grpc_channel=build_gateway_locust_grpc_client(environment),
+        speed=speed,
+    )
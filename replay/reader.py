@@ -0,0 +1,60 @@
+import gzip
+import heapq
+from pathlib import Path
+from typing import IO, Iterator
+
+from replay.schema import TrafficRecord
+
+
+def open_traffic_file(path: Path) -> IO[str]:
+    """
+    Открывает журнал трафика на чтение. Файлы с расширением .gz читаются как gzip.
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+
+    return open(path, encoding="utf-8")
+
+
+def get_traffic_files(path: Path) -> list[Path]:
+    """
+    Возвращает файлы журнала трафика.
+
+    Если файла path нет, ищутся файлы, записанные TrafficWriter с ротацией:
+    для traffic/requests.jsonl это traffic/requests.<pid>.<номер>.jsonl.
+
+    :param path: Путь к журналу.
+    :return: Список файлов журнала.
+    :raises FileNotFoundError: Журнал не найден.
+    """
+    if path.exists():
+        return [path]
+
+    files = sorted(path.parent.glob(f"{path.stem}.*{path.suffix}"))
+    if not files:
+        raise FileNotFoundError(f"Traffic log {path} not found")
+
+    return files
+
+
+def read_traffic_file(path: Path) -> Iterator[TrafficRecord]:
+    with open_traffic_file(path) as file:
+        for line in file:
+            if line.strip():
+                yield TrafficRecord.model_validate_json(line)
+
+
+def read_traffic_records(path: Path) -> Iterator[TrafficRecord]:
+    """
+    Читает журнал трафика построчно, не загружая файлы в память целиком.
+
+    Если журнал состоит из нескольких файлов (например, записанных разными
+    воркерами), записи сливаются по времени.
+
+    :param path: Путь к JSONL-файлу (или .jsonl.gz).
+    :return: Итератор записей в порядке времени.
+    """
+    return heapq.merge(
+        *(read_traffic_file(file) for file in get_traffic_files(path)),
+        key=lambda record: record.timestamp,
+    )
@@ -0,0 +1,42 @@
+from typing import Any
+
+from pydantic import BaseModel, model_validator
+
+
+class TrafficRecord(BaseModel):
+    """
+    Запись журнала трафика (одна строка JSONL).
+
+    HTTP-запрос:
+        {"timestamp": 1718000000.125, "method": "GET", "route": "/api/v1/users/42",
+         "name": "/api/v1/users/{user_id}"}
+
+    gRPC-вызов (тело — JSON-представление protobuf-сообщения):
+        {"timestamp": 1718000000.250, "grpc_method":
+         "/contracts.services.gateway.users.UsersGatewayService/GetUser", "body": {"id": "42"}}
+
+    :param timestamp: Момент отправки запроса (Unix-время в секундах).
+    :param method: HTTP-метод.
+    :param route: Путь HTTP-запроса (с query-параметрами, если они были).
+    :param name: Логическое имя маршрута для статистики Locust, например
+                 "/api/v1/users/{user_id}". По умолчанию — route (или имя gRPC-метода).
+    :param body: Тело запроса: JSON для HTTP, JSON-представление сообщения для gRPC.
+    :param grpc_method: Полное имя gRPC-метода. Если задано, запись воспроизводится по gRPC.
+    :param status: Статус записанного ответа: HTTP-код или имя кода gRPC.
+                   При проигрывании не используется.
+    """
+
+    timestamp: float
+    method: str = "GET"
+    route: str | None = None
+    name: str | None = None
+    body: Any | None = None
+    grpc_method: str | None = None
+    status: int | str | None = None
+
+    @model_validator(mode="after")
+    def check_target(self) -> "TrafficRecord":
+        if self.route is None and self.grpc_method is None:
+            raise ValueError("Traffic record must have either route or grpc_method")
+
+        return self
@@ -0,0 +1,284 @@
+import atexit
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+from config import CaptureConfig, settings
+
+logger = logging.getLogger(__name__)
+
+
+def is_module_patched(name: str) -> bool:
+    """
+    Проверяет, пропатчен ли модуль gevent.
+
+    Модуль импортируется и клиентами gateway для asyncio, поэтому gevent здесь
+    не импортируется: если gevent.monkey ещё не загружен, патчей точно нет.
+    """
+    monkey = sys.modules.get("gevent.monkey")
+    return monkey is not None and monkey.is_module_patched(name)
+
+
+def get_native_sleep() -> Callable[[float], None]:
+    """
+    Возвращает обычный (блокирующий) sleep для потока ОС.
+
+    Под Locust модуль time пропатчен gevent, а фоновая запись работает в потоке ОС.
+    """
+    if is_module_patched("time"):
+        from gevent.monkey import get_original
+
+        return get_original("time", "sleep")
+
+    return time.sleep
+
+
+class TrafficEntry:
+    """
+    Запись журнала в очереди TrafficWriter до сериализации.
+
+    Запись ставится в очередь в момент отправки запроса, поэтому очередь, а с ней
+    и файлы журнала упорядочены по timestamp. Статус ответа дописывается
+    по завершении запроса (complete). Словарь TrafficRecord собирается функцией build
+    в фоновом потоке, чтобы не нагружать горячий путь запроса.
+    """
+
+    __slots__ = ("timestamp", "build", "status", "completed")
+
+    def __init__(self, timestamp: float, build: Callable[[], dict[str, Any]]):
+        """
+        :param timestamp: Момент отправки запроса (Unix-время в секундах).
+        :param build: Функция, возвращающая поля запроса TrafficRecord
+                      (без timestamp и status).
+        """
+        self.timestamp = timestamp
+        self.build = build
+        self.status: int | str | None = None
+        self.completed = False
+
+    def complete(self, status: int | str | None) -> None:
+        """
+        Отмечает запрос завершённым.
+
+        :param status: HTTP-код или имя кода gRPC ответа.
+        """
+        self.status = status
+        self.completed = True
+
+    def dump(self) -> dict[str, Any]:
+        return {"timestamp": self.timestamp, **self.build(), "status": self.status}
+
+
+def start_native_thread(target: Callable[[], None]) -> Callable[[], Any]:
+    """
+    Запускает функцию в настоящем потоке ОС.
+
+    Под Locust модуль threading пропатчен gevent, и threading.Thread стал бы greenlet'ом:
+    сериализация и запись в файл блокировали бы event loop воркера. В этом случае
+    функция запускается в пуле потоков ОС gevent, иначе — в обычном threading.Thread.
+
+    :param target: Функция потока.
+    :return: Функция ожидания завершения потока.
+    """
+    if is_module_patched("threading"):
+        import gevent
+
+        return gevent.get_hub().threadpool.spawn(target).get
+
+    thread = threading.Thread(target=target, name="traffic-writer", daemon=True)
+    thread.start()
+    return thread.join
+
+
+class TrafficWriter:
+    """
+    Буферизованная фоновая запись журнала трафика в JSONL (формат replay.schema.TrafficRecord).
+
+    На горячем пути запроса выполняется только решение о выборке (sampling)
+    и добавление отложенной записи в очередь (deque.append атомарен и не берёт блокировок).
+    Сериализация в JSON и запись на диск выполняются фоновым потоком пачками.
+
+    Записи ставятся в очередь при отправке запроса (start), а на диск уходят в том же
+    порядке и только после завершения запроса: фоновый поток не обгоняет первую
+    незавершённую запись. Запись, не завершённая за max_pending секунд (например,
+    запрос упал с ошибкой транспорта и ответа не было), записывается без статуса.
+
+    Файлы ротируются по размеру: <имя>.<pid>.<номер><расширение>, например
+    traffic/requests.12345.0001.jsonl. PID в имени разделяет файлы воркеров Locust,
+    а replay.reader.read_traffic_records сливает их по времени при проигрывании.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        sample_rate: float = 1.0,
+        max_bytes: int = 100 * 1024 * 1024,
+        max_buffer: int = 100_000,
+        flush_interval: float = 0.5,
+        max_pending: float = 60.0,
+    ):
+        """
+        :param path: Базовый путь журнала, например traffic/requests.jsonl.
+        :param sample_rate: Доля записываемых запросов от 0 до 1.
+        :param max_bytes: Размер файла, после которого начинается следующий.
+        :param max_buffer: Максимум записей в очереди. Если фоновый поток не успевает,
+                           новые записи отбрасываются, а не замедляют запросы.
+        :param flush_interval: Как часто фоновый поток сбрасывает очередь на диск, с.
+        :param max_pending: Сколько секунд ждать завершения запроса, прежде чем
+                            записать его без статуса.
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self.queue: deque[TrafficEntry] = deque()
+        self.dropped = 0
+        self.file: TextIO | None = None
+        self.file_index = 0
+        self.file_bytes = 0
+        self.closed = False
+
+        self.join = start_native_thread(self.run)
+
+    def sample(self) -> bool:
+        """
+        Решает, записывать ли очередной запрос.
+        """
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def start(self, build: Callable[[], dict[str, Any]]) -> TrafficEntry | None:
+        """
+        Ставит в очередь запись об отправляемом запросе.
+
+        :param build: Функция, возвращающая поля запроса. Вызывается в фоновом потоке.
+        :return: Запись, которую нужно завершить (TrafficEntry.complete) по ответу,
+                 или None, если запрос не попал в выборку или очередь переполнена.
+        """
+        if not self.sample():
+            return None
+
+        if len(self.queue) >= self.max_buffer:
+            self.dropped += 1
+            return None
+
+        entry = TrafficEntry(time.time(), build)
+        self.queue.append(entry)
+        return entry
+
+    def run(self) -> None:
+        sleep = get_native_sleep()
+        while not self.closed:
+            sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Сериализует и записывает на диск записи из начала очереди,
+        вплоть до первого ещё не завершённого запроса.
+
+        :param force: Записать всю очередь, не дожидаясь завершения запросов.
+        """
+        deadline = time.time() - self.max_pending
+
+        lines = []
+        while self.queue:
+            entry = self.queue[0]
+            if not (force or entry.completed or entry.timestamp < deadline):
+                break
+
+            self.queue.popleft()
+            lines.append(json.dumps(entry.dump(), separators=(",", ":")))
+
+        if not lines:
+            return
+
+        data = "\n".join(lines) + "\n"
+        file = self.get_file(len(data))
+        file.write(data)
+        file.flush()
+        self.file_bytes += len(data)
+
+    def get_file(self, size: int) -> TextIO:
+        """
+        Возвращает текущий файл журнала, начиная новый при превышении max_bytes.
+        """
+        if self.file is not None and self.file_bytes + size <= self.max_bytes:
+            return self.file
+
+        if self.file is not None:
+            self.file.close()
+
+        self.file_index += 1
+        self.file_bytes = 0
+
+        path = self.path.with_name(
+            f"{self.path.stem}.{os.getpid()}.{self.file_index:04d}{self.path.suffix}"
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(path, "w", encoding="utf-8")
+        return self.file
+
+    def close(self) -> None:
+        """
+        Останавливает фоновый поток и записывает оставшиеся записи.
+        """
+        if self.closed:
+            return
+
+        self.closed = True
+        self.join()
+        self.flush(force=True)
+
+        if self.file is not None:
+            self.file.close()
+
+        if self.dropped:
+            logger.warning("Traffic writer dropped %d records: buffer overflow", self.dropped)
+
+
+# Фоновые записи журнала по PID процесса: форкнутые воркеры Locust
+# не должны писать через поток, унаследованный от родителя
+_writers: dict[int, TrafficWriter] = {}
+
+
+def build_traffic_writer(config: CaptureConfig) -> TrafficWriter:
+    """
+    Создаёт фоновую запись журнала трафика согласно настройкам.
+
+    :param config: Настройки записи трафика.
+    :return: Экземпляр TrafficWriter.
+    """
+    return TrafficWriter(
+        path=config.path,
+        sample_rate=config.sample_rate,
+        max_bytes=config.max_bytes,
+        max_buffer=config.max_buffer,
+        flush_interval=config.flush_interval,
+        max_pending=config.max_pending,
+    )
+
+
+def get_traffic_writer() -> TrafficWriter:
+    """
+    Возвращает общую для процесса фоновую запись журнала трафика (settings.capture).
+
+    Оставшиеся в очереди записи сбрасываются на диск при завершении процесса.
+    """
+    pid = os.getpid()
+
+    writer = _writers.get(pid)
+    if writer is None:
+        writer = _writers[pid] = build_traffic_writer(settings.capture)
+        atexit.register(writer.close)
+
+    return writer
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from seeds.builder import build_seeds_builder
+from seeds.dumps import save_seeds_result
+from seeds.schema import SeedAccountsPlan, SeedCardsPlan, SeedsPlan, SeedUsersPlan
+from tools.fakers import fake
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m seeds",
+        description="Создаёт пользователей, счета и карты через gateway до начала нагрузки",
+    )
+    parser.add_argument("--users", type=int, required=True, help="Сколько пользователей создать")
+    for account in ("deposit", "savings", "debit-card", "credit-card"):
+        parser.add_argument(
+            f"--{account}-accounts",
+            type=int,
+            default=0,
+            help=f"Сколько счетов {account} открыть каждому пользователю",
+        )
+    parser.add_argument(
+        "--physical-cards",
+        type=int,
+        default=0,
+        help="Сколько физических карт дополнительно выпустить на каждый дебетовый и кредитный счёт",
+    )
+    parser.add_argument(
+        "--virtual-cards",
+        type=int,
+        default=0,
+        help="Сколько виртуальных карт дополнительно выпустить на каждый дебетовый и кредитный счёт",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=50, help="Сколько пользователей создавать одновременно"
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="Сколько раз повторять запрос после временной ошибки (обрыв соединения, таймаут)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("dumps/seeds.json.gz"),
+        help="Файл результата (указывается в настройке SEEDS.PATH)",
+    )
+    return parser.parse_args()
+
+
+def build_seeds_plan(arguments: argparse.Namespace) -> SeedsPlan:
+    card_accounts = {
+        "physical_cards": SeedCardsPlan(count=arguments.physical_cards),
+        "virtual_cards": SeedCardsPlan(count=arguments.virtual_cards),
+    }
+    return SeedsPlan(
+        users=SeedUsersPlan(
+            count=arguments.users,
+            deposit_accounts=SeedAccountsPlan(count=arguments.deposit_accounts),
+            savings_accounts=SeedAccountsPlan(count=arguments.savings_accounts),
+            debit_card_accounts=SeedAccountsPlan(
+                count=arguments.debit_card_accounts, **card_accounts
+            ),
+            credit_card_accounts=SeedAccountsPlan(
+                count=arguments.credit_card_accounts, **card_accounts
+            ),
+        )
+    )
+
+
+async def main() -> None:
+    arguments = parse_arguments()
+    plan = build_seeds_plan(arguments)
+
+    # Разделы пачек сидинга совпадают по индексам с разделами пользователей Locust:
+    # свой идентификатор запуска не даёт им создать те же email и телефоны
+    fake.run_id = f"{fake.run_id}.seeds"
+
+    started = time.perf_counter()
+    builder = build_seeds_builder(concurrency=arguments.concurrency, retries=arguments.retries)
+    result = await builder.build(plan)
+    # Созданные пользователи сохраняются и тогда, когда часть пользователей не создалась
+    save_seeds_result(result, arguments.output)
+
+    print(
+        f"Created {len(result.users)} of {plan.users.count} users "
+        f"in {time.perf_counter() - started:.1f}s, saved to {arguments.output}"
+    )
+    if result.failures:
+        print(f"Failed to create {len(result.failures)} users:")
+        for failure, failures in Counter(result.failures).most_common(10):
+            print(f"  {failures} x {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,230 @@
+import asyncio
+from itertools import count, islice
+from typing import Awaitable, Callable, TypeVar
+
+import httpx
+
+from clients.http.gateway.accounts.async_client import (
+    AccountsGatewayAsyncHTTPClient,
+    build_accounts_gateway_async_http_client,
+)
+from clients.http.gateway.accounts.schema import AccountSchema
+from clients.http.gateway.cards.async_client import (
+    CardsGatewayAsyncHTTPClient,
+    build_cards_gateway_async_http_client,
+)
+from clients.http.gateway.cards.schema import CardSchema
+from clients.http.gateway.users.async_client import (
+    UsersGatewayAsyncHTTPClient,
+    build_users_gateway_async_http_client,
+)
+from seeds.schema import (
+    SeedAccountResult,
+    SeedAccountsPlan,
+    SeedCardResult,
+    SeedsPlan,
+    SeedsResult,
+    SeedUserResult,
+    SeedUsersPlan,
+)
+from tools.fakers import fake
+
+
+T = TypeVar("T")
+
+# Ошибки, после которых запрос стоит повторить: обрывы соединения, таймауты и т.п.
+TRANSIENT_ERRORS = (httpx.TransportError,)
+
+
+def build_seed_card_result(card: CardSchema) -> SeedCardResult:
+    return SeedCardResult(
+        card_id=card.id,
+        type=card.type,
+        status=card.status,
+        payment_system=card.payment_system,
+    )
+
+
+class SeedsBuilder:
+    """
+    Создаёт тестовые данные (пользователей, счета и карты) через асинхронные клиенты gateway.
+
+    Пользователи создаются конкурентно: одновременно обрабатывается не больше
+    concurrency пользователей, запросы одного пользователя выполняются последовательно,
+    потому что счёт нельзя открыть раньше пользователя, а карту — раньше счёта.
+
+    Корутины создаются пачками по batch_size пользователей, а не сразу на весь план;
+    тестовые данные каждой пачки берутся из собственного раздела fake.
+    Запросы, упавшие с временной ошибкой (TRANSIENT_ERRORS), повторяются до retries раз;
+    пользователь, которого так и не удалось создать, попадает в SeedsResult.failures,
+    а уже созданные пользователи сохраняются.
+    """
+
+    def __init__(
+        self,
+        users_gateway_client: UsersGatewayAsyncHTTPClient,
+        cards_gateway_client: CardsGatewayAsyncHTTPClient,
+        accounts_gateway_client: AccountsGatewayAsyncHTTPClient,
+        concurrency: int = 50,
+        batch_size: int = 1000,
+        retries: int = 3,
+        retry_delay: float = 0.5,
+    ):
+        """
+        :param users_gateway_client: Асинхронный клиент users gateway.
+        :param cards_gateway_client: Асинхронный клиент cards gateway.
+        :param accounts_gateway_client: Асинхронный клиент accounts gateway.
+        :param concurrency: Сколько пользователей создавать одновременно.
+        :param batch_size: Сколько пользователей ставить в обработку за раз.
+        :param retries: Сколько раз повторять запрос после временной ошибки.
+        :param retry_delay: Пауза перед первым повтором в секундах, дальше удваивается.
+        """
+        self.users_gateway_client = users_gateway_client
+        self.cards_gateway_client = cards_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.batch_size = max(batch_size, concurrency)
+        self.retries = retries
+        self.retry_delay = retry_delay
+
+    async def call(self, method: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """
+        Вызывает метод клиента, повторяя его после временных ошибок.
+
+        :param method: Асинхронный метод клиента, например create_user.
+        :return: Результат метода.
+        :raises httpx.TransportError: Ошибка не прошла и после retries повторов.
+        """
+        delay = self.retry_delay
+        for attempt in range(self.retries + 1):
+            try:
+                return await method(*args, **kwargs)
+            except TRANSIENT_ERRORS:
+                if attempt == self.retries:
+                    raise
+
+            await asyncio.sleep(delay)
+            delay *= 2
+
+    async def build_cards(
+        self, user_id: str, account: AccountSchema, plan: SeedAccountsPlan
+    ) -> SeedAccountResult:
+        """
+        Выпускает карты на созданный счёт.
+        """
+        result = SeedAccountResult(
+            account_id=account.id,
+            type=account.type,
+            status=account.status,
+            cards=[build_seed_card_result(card) for card in account.cards],
+        )
+
+        for _ in range(plan.physical_cards.count):
+            response = await self.call(
+                self.cards_gateway_client.issue_physical_card,
+                user_id=user_id,
+                account_id=account.id,
+            )
+            result.physical_cards.append(build_seed_card_result(response.card))
+
+        for _ in range(plan.virtual_cards.count):
+            response = await self.call(
+                self.cards_gateway_client.issue_virtual_card,
+                user_id=user_id,
+                account_id=account.id,
+            )
+            result.virtual_cards.append(build_seed_card_result(response.card))
+
+        return result
+
+    async def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        """
+        Создаёт пользователя, его счета и карты согласно плану.
+        """
+        async with self.semaphore:
+            response = await self.call(self.users_gateway_client.create_user)
+            user_id = response.user.id
+            result = SeedUserResult(user_id=user_id)
+
+            accounts = (
+                (
+                    plan.deposit_accounts,
+                    self.accounts_gateway_client.open_deposit_account,
+                    result.deposit_accounts,
+                ),
+                (
+                    plan.savings_accounts,
+                    self.accounts_gateway_client.open_savings_account,
+                    result.savings_accounts,
+                ),
+                (
+                    plan.debit_card_accounts,
+                    self.accounts_gateway_client.open_debit_card_account,
+                    result.debit_card_accounts,
+                ),
+                (
+                    plan.credit_card_accounts,
+                    self.accounts_gateway_client.open_credit_card_account,
+                    result.credit_card_accounts,
+                ),
+            )
+            for accounts_plan, open_account, accounts_result in accounts:
+                for _ in range(accounts_plan.count):
+                    account_response = await self.call(open_account, user_id)
+                    accounts_result.append(
+                        await self.build_cards(
+                            user_id, account_response.account, accounts_plan
+                        )
+                    )
+
+            return result
+
+    async def build(self, plan: SeedsPlan) -> SeedsResult:
+        """
+        Создаёт все сущности плана.
+
+        Ошибка одного пользователя не прерывает сидинг: она записывается
+        в failures результата, остальные пользователи создаются и сохраняются.
+
+        :param plan: План сидинга.
+        :return: Идентификаторы созданных сущностей и ошибки несозданных пользователей.
+        """
+        result = SeedsResult()
+
+        users = (self.build_user(plan.users) for _ in range(plan.users.count))
+        for batch_index in count(1):
+            batch = list(islice(users, self.batch_size))
+            if not batch:
+                break
+
+            # Каждая пачка генерирует данные в своём разделе (номеров телефонов
+            # в разделе ограниченное число), пачки выполняются по очереди
+            fake.activate(user_index=batch_index)
+            for user in await asyncio.gather(*batch, return_exceptions=True):
+                if isinstance(user, Exception):
+                    result.failures.append(f"{type(user).__name__}: {user}")
+                elif isinstance(user, BaseException):
+                    raise user
+                else:
+                    result.users.append(user)
+
+        return result
+
+
+def build_seeds_builder(concurrency: int = 50, retries: int = 3) -> SeedsBuilder:
+    """
+    Функция создаёт экземпляр SeedsBuilder с асинхронными HTTP-клиентами gateway.
+
+    Клиенты привязаны к event loop, поэтому вызывать билдер нужно внутри корутины.
+
+    :param concurrency: Сколько пользователей создавать одновременно.
+    :param retries: Сколько раз повторять запрос после временной ошибки.
+    :return: Готовый к использованию SeedsBuilder.
+    """
+    return SeedsBuilder(
+        users_gateway_client=build_users_gateway_async_http_client(),
+        cards_gateway_client=build_cards_gateway_async_http_client(),
+        accounts_gateway_client=build_accounts_gateway_async_http_client(),
+        concurrency=concurrency,
+        retries=retries,
+    )
@@ -0,0 +1,291 @@
+import mmap
+import struct
+from enum import StrEnum
+from pathlib import Path
+from typing import Callable, Generic, NamedTuple, Sequence, TypeVar, overload
+from uuid import UUID
+
+from clients.http.gateway.accounts.schema import AccountStatus, AccountType
+from clients.http.gateway.cards.schema import CardPaymentSystem, CardStatus, CardType
+from seeds.schema import SeedsResult
+
+# Заголовок файла: сигнатура, версия формата, число таблиц.
+# За ним следуют описания таблиц (смещение, число записей) в порядке DATASET_TABLES.
+DATASET_HEADER = struct.Struct("<4sHH")
+DATASET_TABLE_HEADER = struct.Struct("<QI")
+DATASET_MAGIC = b"SEED"
+DATASET_VERSION = 1
+
+# Записи таблиц фиксированной ширины, little-endian без выравнивания:
+# идентификаторы — 16 байт UUID, ссылки на другие таблицы — uint32 индекс записи,
+# значения enum — uint8 код (см. encode_enum).
+USER_RECORD = struct.Struct("<16s")
+ACCOUNT_RECORD = struct.Struct("<16sIBB")
+CARD_RECORD = struct.Struct("<16sIIBBB")
+
+DATASET_TABLES = ("users", "accounts", "cards")
+
+EnumType = TypeVar("EnumType", bound=StrEnum)
+Record = TypeVar("Record")
+
+
+def encode_enum(value: StrEnum) -> int:
+    """
+    Кодирует значение enum в uint8: код — позиция значения в объявлении enum.
+
+    Новые значения enum нужно добавлять в конец объявления, иначе коды
+    ранее записанных файлов поменяют смысл (тогда поднимается DATASET_VERSION).
+
+    :param value: Значение enum, например CardType.VIRTUAL.
+    :return: Код значения.
+    """
+    return list(type(value)).index(value)
+
+
+def decode_enum(enum: type[EnumType], code: int) -> EnumType:
+    """
+    Декодирует значение enum из uint8 кода (см. encode_enum).
+    """
+    return list(enum)[code]
+
+
+def encode_id(value: str) -> bytes:
+    """
+    Кодирует идентификатор сущности (UUID) в 16 байт.
+    """
+    return UUID(value).bytes
+
+
+def decode_id(value: bytes) -> str:
+    return str(UUID(bytes=value))
+
+
+class UserRecord(NamedTuple):
+    id: str
+
+
+class AccountRecord(NamedTuple):
+    id: str
+    user_index: int
+    type: AccountType
+    status: AccountStatus
+
+
+class CardRecord(NamedTuple):
+    id: str
+    account_index: int
+    user_index: int
+    type: CardType
+    status: CardStatus
+    payment_system: CardPaymentSystem
+
+
+def decode_user_record(values: tuple) -> UserRecord:
+    (user_id,) = values
+    return UserRecord(id=decode_id(user_id))
+
+
+def decode_account_record(values: tuple) -> AccountRecord:
+    account_id, user_index, account_type, status = values
+    return AccountRecord(
+        id=decode_id(account_id),
+        user_index=user_index,
+        type=decode_enum(AccountType, account_type),
+        status=decode_enum(AccountStatus, status),
+    )
+
+
+def decode_card_record(values: tuple) -> CardRecord:
+    card_id, account_index, user_index, card_type, status, payment_system = values
+    return CardRecord(
+        id=decode_id(card_id),
+        account_index=account_index,
+        user_index=user_index,
+        type=decode_enum(CardType, card_type),
+        status=decode_enum(CardStatus, status),
+        payment_system=decode_enum(CardPaymentSystem, payment_system),
+    )
+
+
+class DatasetTable(Sequence[Record], Generic[Record]):
+    """
+    Таблица записей фиксированной ширины внутри отображённого в память файла.
+
+    Запись декодируется только при обращении к ней, поэтому таблица не занимает
+    память процесса сверх страниц файла, которые ядро делит между процессами.
+    """
+
+    def __init__(
+        self,
+        buffer: mmap.mmap,
+        offset: int,
+        count: int,
+        record: struct.Struct,
+        decode: Callable[[tuple], Record],
+    ):
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+        self.record = record
+        self.decode = decode
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get_offset(self, index: int) -> int:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+
+        return self.offset + index * self.record.size
+
+    @overload
+    def __getitem__(self, index: int) -> Record: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Record]: ...
+
+    def __getitem__(self, index: int | slice) -> Record | list[Record]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self.count))]
+
+        return self.decode(self.record.unpack_from(self.buffer, self.get_offset(index)))
+
+    @property
+    def ids(self) -> "DatasetIds":
+        """
+        Идентификаторы записей таблицы без декодирования остальных полей.
+        """
+        return DatasetIds(self)
+
+
+class DatasetIds(Sequence[str]):
+    """
+    Идентификаторы записей таблицы (первое поле каждой записи).
+    """
+
+    def __init__(self, table: DatasetTable):
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        offset = self.table.get_offset(index)
+        return decode_id(self.table.buffer[offset : offset + 16])
+
+
+class SeedsDataset:
+    """
+    Результат сидинга в компактном бинарном формате, отображённый в память только на чтение.
+
+    Миллионы пользователей, счетов и карт в виде pydantic-моделей заняли бы гигабайты
+    в каждом воркере. Файл же отображается через mmap: все воркеры Locust на машине
+    читают одну копию страниц из page cache, а запись декодируется только при обращении.
+    """
+
+    def __init__(self, path: Path):
+        """
+        :param path: Файл, созданный write_seeds_dataset.
+        """
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, tables = DATASET_HEADER.unpack_from(self.buffer)
+        if magic != DATASET_MAGIC:
+            raise ValueError(f"{path} is not a seeds dataset")
+        if version != DATASET_VERSION or tables != len(DATASET_TABLES):
+            raise ValueError(
+                f"{path} has unsupported dataset version {version}, expected {DATASET_VERSION}"
+            )
+
+        (users_offset, users_count), (accounts_offset, accounts_count), (
+            cards_offset,
+            cards_count,
+        ) = DATASET_TABLE_HEADER.iter_unpack(
+            self.buffer[
+                DATASET_HEADER.size : DATASET_HEADER.size + DATASET_TABLE_HEADER.size * tables
+            ]
+        )
+
+        self.users: DatasetTable[UserRecord] = DatasetTable(
+            self.buffer, users_offset, users_count, USER_RECORD, decode_user_record
+        )
+        self.accounts: DatasetTable[AccountRecord] = DatasetTable(
+            self.buffer, accounts_offset, accounts_count, ACCOUNT_RECORD, decode_account_record
+        )
+        self.cards: DatasetTable[CardRecord] = DatasetTable(
+            self.buffer, cards_offset, cards_count, CARD_RECORD, decode_card_record
+        )
+
+    def close(self) -> None:
+        self.buffer.close()
+
+
+def write_seeds_dataset(result: SeedsResult, path: Path) -> None:
+    """
+    Сохраняет результат сидинга в бинарном формате (см. SeedsDataset).
+
+    :param result: Результат сидинга.
+    :param path: Путь к файлу, например dumps/seeds.dataset.
+    """
+    users = bytearray()
+    accounts = bytearray()
+    cards = bytearray()
+
+    account_index = 0
+    for user_index, user in enumerate(result.users):
+        users += USER_RECORD.pack(encode_id(user.user_id))
+
+        for account in (
+            *user.deposit_accounts,
+            *user.savings_accounts,
+            *user.debit_card_accounts,
+            *user.credit_card_accounts,
+        ):
+            accounts += ACCOUNT_RECORD.pack(
+                encode_id(account.account_id),
+                user_index,
+                encode_enum(account.type),
+                encode_enum(account.status),
+            )
+
+            for card in (*account.cards, *account.physical_cards, *account.virtual_cards):
+                cards += CARD_RECORD.pack(
+                    encode_id(card.card_id),
+                    account_index,
+                    user_index,
+                    encode_enum(card.type),
+                    encode_enum(card.status),
+                    encode_enum(card.payment_system),
+                )
+
+            account_index += 1
+
+    tables = (
+        (users, USER_RECORD),
+        (accounts, ACCOUNT_RECORD),
+        (cards, CARD_RECORD),
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(DATASET_HEADER.pack(DATASET_MAGIC, DATASET_VERSION, len(tables)))
+
+        offset = DATASET_HEADER.size + DATASET_TABLE_HEADER.size * len(tables)
+        for data, record in tables:
+            file.write(DATASET_TABLE_HEADER.pack(offset, len(data) // record.size))
+            offset += len(data)
+
+        for data, _ in tables:
+            file.write(data)
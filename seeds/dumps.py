@@ -0,0 +1,76 @@
+import gzip
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal
+
+from seeds.dataset import SeedsDataset, write_seeds_dataset
+from seeds.schema import SeedsResult
+
+# Виды сущностей (таблицы SeedsDataset)
+SeedEntityKind = Literal["users", "accounts", "cards"]
+
+
+def get_seeds_path(path: Path, suffix: str) -> Path:
+    """
+    Возвращает путь к сопутствующему файлу рядом с файлом результата.
+
+    :param path: Путь к файлу результата, например dumps/seeds.json.gz.
+    :param suffix: Суффикс файла, например "dataset".
+    :return: Путь вида dumps/seeds.dataset.
+    """
+    name = path.name.split(".", 1)[0]
+    return path.with_name(f"{name}.{suffix}")
+
+
+def get_seeds_dataset_path(path: Path) -> Path:
+    return get_seeds_path(path, "dataset")
+
+
+def get_seeds_busy_path(path: Path, kind: SeedEntityKind) -> Path:
+    """
+    Возвращает путь к файлу занятости сущностей общего пула (см. seeds.pool.SharedEntityPool).
+    """
+    return get_seeds_path(path, f"{kind}.busy")
+
+
+def save_seeds_result(result: SeedsResult, path: Path) -> None:
+    """
+    Сохраняет результат сидинга в сжатый (gzip) JSON-файл и рядом — в бинарном
+    формате для воркеров Locust (см. seeds.dataset.SeedsDataset).
+
+    :param result: Результат сидинга.
+    :param path: Путь к файлу, например dumps/seeds.json.gz.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # exclude_defaults убирает пустые списки карт и счетов, что заметно уменьшает файл
+    with gzip.open(path, "wb") as file:
+        file.write(result.model_dump_json(exclude_defaults=True).encode())
+
+    write_seeds_dataset(result, get_seeds_dataset_path(path))
+
+
+@lru_cache(maxsize=None)
+def load_seeds_result(path: Path) -> SeedsResult:
+    """
+    Загружает результат сидинга из файла.
+
+    Результат кешируется: все виртуальные пользователи процесса
+    работают с одним экземпляром.
+
+    :param path: Путь к файлу, созданному save_seeds_result.
+    :return: Результат сидинга.
+    """
+    with gzip.open(path, "rb") as file:
+        return SeedsResult.model_validate_json(file.read())
+
+
+@lru_cache(maxsize=None)
+def load_seeds_dataset(path: Path) -> SeedsDataset:
+    """
+    Открывает бинарный набор данных, сохранённый рядом с результатом сидинга.
+
+    :param path: Путь к файлу результата, например dumps/seeds.json.gz.
+    :return: Отображённый в память SeedsDataset, общий для процесса.
+    """
+    return SeedsDataset(get_seeds_dataset_path(path))
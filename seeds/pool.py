@@ -0,0 +1,251 @@
+import os
+import random
+from array import array
+from bisect import bisect
+from contextlib import contextmanager
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterator, Literal, Sequence
+
+EntityDistribution = Literal["uniform", "zipf"]
+
+
+class EntitySampler:
+    """
+    Выбирает индекс сущности с равномерным распределением.
+    """
+
+    def __init__(self, size: int, generator: random.Random):
+        """
+        :param size: Число сущностей.
+        :param generator: Генератор случайных чисел.
+        """
+        self.size = size
+        self.generator = generator
+
+    def sample(self) -> int:
+        return self.generator.randrange(self.size)
+
+
+class ZipfEntitySampler(EntitySampler):
+    """
+    Выбирает индекс сущности по закону Ципфа: сущность с рангом k выбирается
+    с вероятностью, пропорциональной 1 / k^s.
+
+    Так воспроизводится «горячее» множество реального трафика: небольшая доля
+    пользователей получает большую часть запросов, и кеши сервиса попадают
+    так же, как в проде. Ранг совпадает с индексом сущности в пуле.
+    """
+
+    def __init__(self, size: int, generator: random.Random, exponent: float = 1.1):
+        """
+        :param size: Число сущностей.
+        :param generator: Генератор случайных чисел.
+        :param exponent: Показатель s. Чем больше, тем уже горячее множество.
+        """
+        super().__init__(size, generator)
+
+        # Кумулятивные веса храним в array, а не в list: на миллионах сущностей
+        # это в несколько раз меньше памяти
+        self.cumulative_weights = array(
+            "d", accumulate(1 / rank**exponent for rank in range(1, size + 1))
+        )
+        self.total_weight = self.cumulative_weights[-1] if size else 0.0
+
+    def sample(self) -> int:
+        index = bisect(self.cumulative_weights, self.generator.random() * self.total_weight)
+        return min(index, self.size - 1)
+
+
+class EntityPool:
+    """
+    Пул идентификаторов заранее созданных сущностей (пользователей, счетов, карт).
+
+    sample() выдаёт идентификатор без захвата — для читающих сценариев, которым
+    важно только распределение обращений. checkout() захватывает сущность
+    эксклюзивно до release(), чтобы два виртуальных пользователя не меняли
+    одну сущность одновременно.
+
+    Пул не использует блокировок: виртуальные пользователи Locust — greenlet'ы,
+    которые не переключаются внутри checkout(), поэтому проверка и захват
+    занятости выполняются атомарно. Если выбранная сущность занята, пул не ждёт,
+    а выбирает другую.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        sampler: EntitySampler,
+        checkout_attempts: int = 64,
+    ):
+        """
+        :param ids: Идентификаторы сущностей.
+        :param sampler: Распределение обращений к сущностям.
+        :param checkout_attempts: Сколько раз выбрать сущность из распределения в checkout(),
+                                  прежде чем перейти к равномерному выбору.
+        """
+        self.ids = ids
+        self.sampler = sampler
+        self.checkout_attempts = checkout_attempts
+
+        self.busy = bytearray(len(ids))
+        self.checked_out: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def sample(self) -> str:
+        """
+        Возвращает идентификатор сущности согласно распределению, не захватывая её.
+        """
+        return self.ids[self.sampler.sample()]
+
+    def claim(self, index: int) -> bool:
+        """
+        Пытается захватить сущность по индексу.
+
+        :return: True, если сущность была свободна и теперь захвачена.
+        """
+        if self.busy[index]:
+            return False
+
+        self.busy[index] = 1
+        return True
+
+    def unclaim(self, index: int) -> None:
+        self.busy[index] = 0
+
+    def checkout(self) -> str:
+        """
+        Эксклюзивно захватывает сущность согласно распределению.
+
+        Если выбранная сущность занята, выбирается новая из того же распределения
+        (соседи горячей сущности при zipf тоже горячие и быстро заканчиваются).
+        После checkout_attempts неудач сущность выбирается равномерно, а если занятых
+        так много, что и это не помогает, — ищется первая свободная по всему пулу.
+
+        :return: Идентификатор захваченной сущности.
+        :raises LookupError: Все сущности пула заняты.
+        """
+        size = len(self.ids)
+        samplers = (self.sampler.sample, lambda: self.sampler.generator.randrange(size))
+        for sample in samplers:
+            for _ in range(min(self.checkout_attempts, size)):
+                index = sample()
+                if self.claim(index):
+                    return self.check_out(index)
+
+        start = self.sampler.generator.randrange(size) if size else 0
+        for offset in range(size):
+            index = (start + offset) % size
+            if self.claim(index):
+                return self.check_out(index)
+
+        raise LookupError(
+            f"No free entity: {len(self.checked_out)} of {size} checked out by this process"
+        )
+
+    def check_out(self, index: int) -> str:
+        entity_id = self.ids[index]
+        self.checked_out[entity_id] = index
+        return entity_id
+
+    def release(self, entity_id: str) -> None:
+        """
+        Возвращает захваченную сущность в пул.
+
+        :param entity_id: Идентификатор, полученный из checkout().
+        """
+        self.unclaim(self.checked_out.pop(entity_id))
+
+    @contextmanager
+    def entity(self) -> Iterator[str]:
+        """
+        Захватывает сущность на время блока with.
+        """
+        entity_id = self.checkout()
+        try:
+            yield entity_id
+        finally:
+            self.release(entity_id)
+
+
+class SharedEntityPool(EntityPool):
+    """
+    Пул сущностей, занятость которых видна всем процессам (воркерам Locust) на машине.
+
+    Захват сущности — неблокирующая блокировка её байта в общем файле занятости
+    (fcntl.lockf с LOCK_NB): занятая другим воркером сущность пропускается сразу,
+    без ожидания. Блокировки снимает ядро при завершении процесса, поэтому
+    упавший воркер не оставляет сущности занятыми навсегда.
+
+    Блокировки fcntl не различают greenlet'ы одного процесса, поэтому внутри
+    процесса занятость по-прежнему учитывается в busy (см. EntityPool).
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        sampler: EntitySampler,
+        busy_path: Path,
+        checkout_attempts: int = 64,
+    ):
+        """
+        :param ids: Идентификаторы сущностей, например из SeedsDataset.
+        :param sampler: Распределение обращений к сущностям.
+        :param busy_path: Файл занятости, общий для всех процессов пула.
+        :param checkout_attempts: Сколько сущностей проверить в checkout().
+        """
+        super().__init__(ids, sampler, checkout_attempts=checkout_attempts)
+
+        # Файл открывают все воркеры одновременно: "a+b" не обрезает его,
+        # а ftruncate до одинакового размера безопасен при гонке
+        self.busy_file = open(busy_path, "a+b")
+        os.ftruncate(self.busy_file.fileno(), max(len(ids), 1))
+
+    def claim(self, index: int) -> bool:
+        # fcntl есть только в Unix, поэтому импортируется при использовании общего пула
+        import fcntl
+
+        if not super().claim(index):
+            return False
+
+        try:
+            fcntl.lockf(self.busy_file, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, index, os.SEEK_SET)
+        except OSError:
+            super().unclaim(index)
+            return False
+
+        return True
+
+    def unclaim(self, index: int) -> None:
+        import fcntl
+
+        fcntl.lockf(self.busy_file, fcntl.LOCK_UN, 1, index, os.SEEK_SET)
+        super().unclaim(index)
+
+    def close(self) -> None:
+        self.busy_file.close()
+
+
+def build_entity_sampler(
+    size: int,
+    distribution: EntityDistribution = "uniform",
+    zipf_exponent: float = 1.1,
+    seed: str | None = None,
+) -> EntitySampler:
+    """
+    Создаёт распределение обращений к сущностям.
+
+    :param size: Число сущностей.
+    :param distribution: uniform — равномерно, zipf — с горячим множеством.
+    :param zipf_exponent: Показатель распределения Ципфа.
+    :param seed: Зерно генератора. None — случайная последовательность.
+    :return: Экземпляр EntitySampler.
+    """
+    generator = random.Random(seed)
+    if distribution == "zipf":
+        return ZipfEntitySampler(size, generator, exponent=zipf_exponent)
+
+    return EntitySampler(size, generator)
+
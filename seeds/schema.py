@@ -0,0 +1,120 @@
+import random
+from itertools import count
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from clients.http.gateway.accounts.schema import AccountStatus, AccountType
+from clients.http.gateway.cards.schema import CardPaymentSystem, CardStatus, CardType
+
+
+class SeedCardsPlan(BaseModel):
+    """
+    План создания карт для каждого счёта.
+
+    :param count: Сколько карт создать.
+    """
+
+    count: int = 0
+
+
+class SeedAccountsPlan(BaseModel):
+    """
+    План создания счетов определённого типа для каждого пользователя.
+
+    :param count: Сколько счетов создать.
+    :param physical_cards: Сколько физических карт дополнительно выпустить на каждый счёт.
+    :param virtual_cards: Сколько виртуальных карт дополнительно выпустить на каждый счёт.
+    """
+
+    count: int = 0
+    physical_cards: SeedCardsPlan = SeedCardsPlan()
+    virtual_cards: SeedCardsPlan = SeedCardsPlan()
+
+
+class SeedUsersPlan(BaseModel):
+    """
+    План создания пользователей и их счетов.
+
+    :param count: Сколько пользователей создать.
+    """
+
+    count: int = 0
+    deposit_accounts: SeedAccountsPlan = SeedAccountsPlan()
+    savings_accounts: SeedAccountsPlan = SeedAccountsPlan()
+    debit_card_accounts: SeedAccountsPlan = SeedAccountsPlan()
+    credit_card_accounts: SeedAccountsPlan = SeedAccountsPlan()
+
+
+class SeedsPlan(BaseModel):
+    """
+    План сидинга: какие сущности и в каком количестве создать до начала нагрузки.
+    """
+
+    users: SeedUsersPlan = SeedUsersPlan()
+
+
+class SeedCardResult(BaseModel):
+    """
+    Созданная карта.
+    """
+
+    card_id: str
+    type: CardType
+    status: CardStatus
+    payment_system: CardPaymentSystem
+
+
+class SeedAccountResult(BaseModel):
+    """
+    Созданный счёт и выпущенные на него карты.
+    Карты, выпущенные вместе со счётом (дебетовые и кредитные счета), попадают в cards.
+    """
+
+    account_id: str
+    type: AccountType
+    status: AccountStatus
+    cards: list[SeedCardResult] = Field(default_factory=list)
+    physical_cards: list[SeedCardResult] = Field(default_factory=list)
+    virtual_cards: list[SeedCardResult] = Field(default_factory=list)
+
+
+class SeedUserResult(BaseModel):
+    """
+    Созданный пользователь и его счета.
+    """
+
+    user_id: str
+    deposit_accounts: list[SeedAccountResult] = Field(default_factory=list)
+    savings_accounts: list[SeedAccountResult] = Field(default_factory=list)
+    debit_card_accounts: list[SeedAccountResult] = Field(default_factory=list)
+    credit_card_accounts: list[SeedAccountResult] = Field(default_factory=list)
+
+
+class SeedsResult(BaseModel):
+    """
+    Результат сидинга: идентификаторы созданных сущностей.
+
+    Сценарии Locust берут из него готовых пользователей вместо создания
+    собственных в on_start.
+
+    :param failures: Ошибки пользователей, которых не удалось создать.
+    """
+
+    users: list[SeedUserResult] = Field(default_factory=list)
+    failures: list[str] = Field(default_factory=list)
+
+    _users_counter: count = PrivateAttr(default_factory=count)
+
+    def get_next_user(self, offset: int = 0) -> SeedUserResult:
+        """
+        Возвращает следующего пользователя по кругу.
+
+        :param offset: Смещение начала круга, например своё для каждого воркера.
+        """
+        return self.users[(next(self._users_counter) + offset) % len(self.users)]
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя.
+        """
+        return random.choice(self.users)
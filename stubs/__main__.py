@@ -0,0 +1,76 @@
+import argparse
+import asyncio
+from typing import TypeVar
+
+from config import GRPCStubConfig, HTTPStubConfig, override_config, settings
+from stubs.grpc_server import build_grpc_stub_server
+from stubs.http_gateway import build_http_gateway_stub_server
+
+StubConfig = TypeVar("StubConfig", HTTPStubConfig, GRPCStubConfig)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m stubs",
+        description="Запускает локальную заглушку gateway (и внутренних gRPC-сервисов) "
+        "с состоянием в памяти",
+    )
+    subparsers = parser.add_subparsers(dest="gateway", required=True)
+
+    http = subparsers.add_parser(
+        "http",
+        help="Заглушка http-gateway (настройки HTTP_STUB.*)",
+    )
+    http.add_argument("--host", help="Адрес, на котором принимать соединения")
+    http.add_argument("--port", type=int, help="Порт заглушки")
+    http.add_argument(
+        "--seed", type=int, help="Зерно задержек, ошибок и выдуманных значений"
+    )
+
+    grpc = subparsers.add_parser(
+        "grpc",
+        help="Заглушка grpc-gateway и внутренних gRPC-сервисов (настройки GRPC_STUB.*)",
+    )
+    grpc.add_argument("--host", help="Адрес, на котором принимать соединения")
+    grpc.add_argument("--port", type=int, help="Порт заглушки")
+    grpc.add_argument(
+        "--seed", type=int, help="Зерно задержек, ошибок и выдуманных значений"
+    )
+    return parser.parse_args()
+
+
+def get_overridden_config(config: StubConfig, arguments: argparse.Namespace) -> StubConfig:
+    """
+    Возвращает настройки заглушки с адресом и портом из аргументов командной строки.
+    """
+    return override_config(config, host=arguments.host, port=arguments.port)
+
+
+def serve_http(arguments: argparse.Namespace) -> None:
+    config = get_overridden_config(settings.http_stub, arguments)
+
+    server = build_http_gateway_stub_server(config, seed=arguments.seed)
+    print(f"HTTP gateway stub listening on http://{config.host}:{config.port}")
+    server.serve_forever()
+
+
+async def serve_grpc(arguments: argparse.Namespace) -> None:
+    config = get_overridden_config(settings.grpc_stub, arguments)
+
+    server = build_grpc_stub_server(config, seed=arguments.seed)
+    await server.start()
+    print(f"gRPC stub listening on {config.host}:{config.port}")
+    await server.wait_for_termination()
+
+
+def main() -> None:
+    arguments = parse_arguments()
+
+    if arguments.gateway == "http":
+        serve_http(arguments)
+    elif arguments.gateway == "grpc":
+        asyncio.run(serve_grpc(arguments))
+
+
+if __name__ == "__main__":
+    main()
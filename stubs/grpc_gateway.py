@@ -0,0 +1,313 @@
+from typing import Callable
+
+from grpc.aio import ServicerContext
+
+from clients.http.gateway.accounts.schema import AccountType
+from clients.http.gateway.cards.schema import CardType
+from clients.http.gateway.operations.schema import OperationStatus as OperationStatusSchema
+from clients.http.gateway.operations.schema import OperationType as OperationTypeSchema
+from clients.http.gateway.users.schema import CreateUserRequestSchema
+from contracts.services.documents.contracts.contract_pb2 import Contract
+from contracts.services.documents.receipts.receipt_pb2 import Receipt
+from contracts.services.documents.tariffs.tariff_pb2 import Tariff
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import (
+    AccountsGatewayServiceServicer,
+)
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import (
+    GetAccountsRequest,
+    GetAccountsResponse,
+)
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
+    OpenCreditCardAccountRequest,
+    OpenCreditCardAccountResponse,
+)
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import (
+    OpenDebitCardAccountRequest,
+    OpenDebitCardAccountResponse,
+)
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import (
+    OpenDepositAccountRequest,
+    OpenDepositAccountResponse,
+)
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (
+    OpenSavingsAccountRequest,
+    OpenSavingsAccountResponse,
+)
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import (
+    CardsGatewayServiceServicer,
+)
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
+    IssuePhysicalCardRequest,
+    IssuePhysicalCardResponse,
+)
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
+    IssueVirtualCardRequest,
+    IssueVirtualCardResponse,
+)
+from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import (
+    DocumentsGatewayServiceServicer,
+)
+from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import (
+    GetContractDocumentRequest,
+    GetContractDocumentResponse,
+)
+from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import (
+    GetTariffDocumentRequest,
+    GetTariffDocumentResponse,
+)
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import (
+    OperationsGatewayServiceServicer,
+)
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import (
+    GetOperationRequest,
+    GetOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (
+    GetOperationReceiptRequest,
+    GetOperationReceiptResponse,
+)
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import (
+    GetOperationsRequest,
+    GetOperationsResponse,
+)
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import (
+    GetOperationsSummaryRequest,
+    GetOperationsSummaryResponse,
+)
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (
+    MakeBillPaymentOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (
+    MakeCashbackOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (
+    MakeFeeOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
+    MakePurchaseOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
+    MakeTopUpOperationResponse,
+)
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
+    MakeTransferOperationResponse,
+)
+from contracts.services.gateway.users.rpc_create_user_pb2 import (
+    CreateUserRequest,
+    CreateUserResponse,
+)
+from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
+from contracts.services.gateway.users.users_gateway_service_pb2_grpc import (
+    UsersGatewayServiceServicer,
+)
+from contracts.services.operations.operation_pb2 import OperationStatus
+from stubs.grpc_messages import (
+    build_account_view,
+    build_card,
+    build_operation,
+    build_operations_summary,
+    build_user,
+    encode_document,
+    from_proto_enum,
+)
+from stubs.store import GatewayStubStore
+
+
+class UsersGatewayStubServicer(UsersGatewayServiceServicer):
+    """
+    Заглушка UsersGatewayService.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetUser(self, request: GetUserRequest, context: ServicerContext) -> GetUserResponse:
+        return GetUserResponse(user=build_user(self.store.get_user(request.id)))
+
+    async def CreateUser(
+        self, request: CreateUserRequest, context: ServicerContext
+    ) -> CreateUserResponse:
+        # Та же валидация, что у HTTP-заглушки: ValidationError — INVALID_ARGUMENT
+        user = self.store.create_user(
+            CreateUserRequestSchema(
+                email=request.email,
+                lastName=request.last_name,
+                firstName=request.first_name,
+                middleName=request.middle_name,
+                phoneNumber=request.phone_number,
+            )
+        )
+        return CreateUserResponse(user=build_user(user))
+
+
+class AccountsGatewayStubServicer(AccountsGatewayServiceServicer):
+    """
+    Заглушка AccountsGatewayService: у дебетовых и кредитных счетов при открытии
+    сразу есть виртуальная карта.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetAccounts(
+        self, request: GetAccountsRequest, context: ServicerContext
+    ) -> GetAccountsResponse:
+        accounts = self.store.get_accounts(request.user_id)
+        return GetAccountsResponse(accounts=[build_account_view(account) for account in accounts])
+
+    async def OpenDepositAccount(
+        self, request: OpenDepositAccountRequest, context: ServicerContext
+    ) -> OpenDepositAccountResponse:
+        account = self.store.open_account(request.user_id, AccountType.DEPOSIT)
+        return OpenDepositAccountResponse(account=build_account_view(account))
+
+    async def OpenSavingsAccount(
+        self, request: OpenSavingsAccountRequest, context: ServicerContext
+    ) -> OpenSavingsAccountResponse:
+        account = self.store.open_account(request.user_id, AccountType.SAVINGS)
+        return OpenSavingsAccountResponse(account=build_account_view(account))
+
+    async def OpenDebitCardAccount(
+        self, request: OpenDebitCardAccountRequest, context: ServicerContext
+    ) -> OpenDebitCardAccountResponse:
+        account = self.store.open_account(request.user_id, AccountType.DEBIT_CARD)
+        return OpenDebitCardAccountResponse(account=build_account_view(account))
+
+    async def OpenCreditCardAccount(
+        self, request: OpenCreditCardAccountRequest, context: ServicerContext
+    ) -> OpenCreditCardAccountResponse:
+        account = self.store.open_account(request.user_id, AccountType.CREDIT_CARD)
+        return OpenCreditCardAccountResponse(account=build_account_view(account))
+
+
+class CardsGatewayStubServicer(CardsGatewayServiceServicer):
+    """
+    Заглушка CardsGatewayService.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def IssueVirtualCard(
+        self, request: IssueVirtualCardRequest, context: ServicerContext
+    ) -> IssueVirtualCardResponse:
+        card = self.store.issue_card(request.user_id, request.account_id, CardType.VIRTUAL)
+        return IssueVirtualCardResponse(card=build_card(card))
+
+    async def IssuePhysicalCard(
+        self, request: IssuePhysicalCardRequest, context: ServicerContext
+    ) -> IssuePhysicalCardResponse:
+        card = self.store.issue_card(request.user_id, request.account_id, CardType.PHYSICAL)
+        return IssuePhysicalCardResponse(card=build_card(card))
+
+
+class DocumentsGatewayStubServicer(DocumentsGatewayServiceServicer):
+    """
+    Заглушка DocumentsGatewayService.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetTariffDocument(
+        self, request: GetTariffDocumentRequest, context: ServicerContext
+    ) -> GetTariffDocumentResponse:
+        document = self.store.get_document(request.account_id, "tariff")
+        return GetTariffDocumentResponse(
+            tariff=Tariff(url=document.url, document=encode_document(document.document))
+        )
+
+    async def GetContractDocument(
+        self, request: GetContractDocumentRequest, context: ServicerContext
+    ) -> GetContractDocumentResponse:
+        document = self.store.get_document(request.account_id, "contract")
+        return GetContractDocumentResponse(
+            contract=Contract(url=document.url, document=encode_document(document.document))
+        )
+
+
+def build_make_operation_method(
+    operation_type: OperationTypeSchema, response: type
+) -> Callable:
+    """
+    Создаёт метод Make*Operation: запросы всех операций, кроме покупки, одинаковы
+    (status, amount, card_id, account_id), покупка добавляет category.
+
+    :param operation_type: Тип создаваемой операции.
+    :param response: Класс ответа метода, например MakeFeeOperationResponse.
+    """
+
+    async def make_operation(self: "OperationsGatewayStubServicer", request, context):
+        operation = self.store.make_operation(
+            operation_type,
+            from_proto_enum(OperationStatus, request.status, OperationStatusSchema),
+            request.amount,
+            request.card_id,
+            request.account_id,
+            category=getattr(request, "category", ""),
+        )
+        return response(operation=build_operation(operation))
+
+    return make_operation
+
+
+class OperationsGatewayStubServicer(OperationsGatewayServiceServicer):
+    """
+    Заглушка OperationsGatewayService: завершённые операции меняют баланс счёта,
+    сводка считается по последним операциям счёта.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetOperation(
+        self, request: GetOperationRequest, context: ServicerContext
+    ) -> GetOperationResponse:
+        return GetOperationResponse(operation=build_operation(self.store.get_operation(request.id)))
+
+    async def GetOperations(
+        self, request: GetOperationsRequest, context: ServicerContext
+    ) -> GetOperationsResponse:
+        operations = self.store.get_operations(request.account_id)
+        return GetOperationsResponse(
+            operations=[build_operation(operation) for operation in operations]
+        )
+
+    async def GetOperationReceipt(
+        self, request: GetOperationReceiptRequest, context: ServicerContext
+    ) -> GetOperationReceiptResponse:
+        receipt = self.store.get_operation_receipt(request.operation_id)
+        return GetOperationReceiptResponse(
+            receipt=Receipt(url=receipt.url, document=encode_document(receipt.document))
+        )
+
+    async def GetOperationsSummary(
+        self, request: GetOperationsSummaryRequest, context: ServicerContext
+    ) -> GetOperationsSummaryResponse:
+        summary = self.store.get_operations_summary(request.account_id)
+        return GetOperationsSummaryResponse(summary=build_operations_summary(summary))
+
+    MakeFeeOperation = build_make_operation_method(
+        OperationTypeSchema.FEE, MakeFeeOperationResponse
+    )
+    MakeTopUpOperation = build_make_operation_method(
+        OperationTypeSchema.TOP_UP, MakeTopUpOperationResponse
+    )
+    MakeCashbackOperation = build_make_operation_method(
+        OperationTypeSchema.CASHBACK, MakeCashbackOperationResponse
+    )
+    MakePurchaseOperation = build_make_operation_method(
+        OperationTypeSchema.PURCHASE, MakePurchaseOperationResponse
+    )
+    MakeTransferOperation = build_make_operation_method(
+        OperationTypeSchema.TRANSFER, MakeTransferOperationResponse
+    )
+    MakeBillPaymentOperation = build_make_operation_method(
+        OperationTypeSchema.BILL_PAYMENT, MakeBillPaymentOperationResponse
+    )
+    MakeCashWithdrawalOperation = build_make_operation_method(
+        OperationTypeSchema.CASH_WITHDRAWAL, MakeCashWithdrawalOperationResponse
+    )
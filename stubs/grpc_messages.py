@@ -0,0 +1,129 @@
+from enum import StrEnum
+from typing import TypeVar
+
+from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+
+from clients.http.gateway.accounts.schema import AccountSchema
+from clients.http.gateway.cards.schema import CardSchema
+from clients.http.gateway.operations.schema import OperationSchema, OperationsSummarySchema
+from clients.http.gateway.users.schema import UserSchema
+from contracts.services.accounts.account_pb2 import Account, AccountStatus, AccountType
+from contracts.services.cards.card_pb2 import Card, CardPaymentSystem, CardStatus, CardType
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+from contracts.services.operations.operation_pb2 import (
+    Operation,
+    OperationStatus,
+    OperationType,
+)
+from contracts.services.operations.operations_summary_pb2 import OperationsSummary
+from contracts.services.users.user_pb2 import User
+
+SchemaEnum = TypeVar("SchemaEnum", bound=StrEnum)
+
+# Префиксы значений proto enum: значение схемы HTTP-клиента без префикса
+# совпадает с именем значения proto, например DEBIT_CARD и ACCOUNT_TYPE_DEBIT_CARD
+PROTO_ENUM_PREFIXES: dict[str, str] = {
+    AccountType.DESCRIPTOR.full_name: "ACCOUNT_TYPE_",
+    AccountStatus.DESCRIPTOR.full_name: "ACCOUNT_STATUS_",
+    CardType.DESCRIPTOR.full_name: "CARD_TYPE_",
+    CardStatus.DESCRIPTOR.full_name: "CARD_STATUS_",
+    CardPaymentSystem.DESCRIPTOR.full_name: "CARD_PAYMENT_SYSTEM_",
+    OperationType.DESCRIPTOR.full_name: "OPERATION_TYPE_",
+    OperationStatus.DESCRIPTOR.full_name: "OPERATION_STATUS_",
+}
+
+
+def to_proto_enum(enum: EnumTypeWrapper, value: StrEnum) -> int:
+    """
+    Переводит значение enum схемы HTTP-клиента в значение proto enum.
+    """
+    return enum.Value(PROTO_ENUM_PREFIXES[enum.DESCRIPTOR.full_name] + value)
+
+
+def from_proto_enum(enum: EnumTypeWrapper, value: int, schema_enum: type[SchemaEnum]) -> SchemaEnum:
+    """
+    Переводит значение proto enum в значение enum схемы HTTP-клиента.
+
+    :raises ValueError: Значения нет в proto enum или в схеме (например, *_UNSPECIFIED).
+    """
+    name = enum.Name(value).removeprefix(PROTO_ENUM_PREFIXES[enum.DESCRIPTOR.full_name])
+    return schema_enum(name)
+
+
+def build_user(user: UserSchema) -> User:
+    return User(
+        id=user.id,
+        email=user.email,
+        last_name=user.last_name,
+        first_name=user.first_name,
+        middle_name=user.middle_name,
+        phone_number=user.phone_number,
+    )
+
+
+def build_card(card: CardSchema) -> Card:
+    return Card(
+        id=card.id,
+        pin=card.pin,
+        cvv=card.cvv,
+        type=to_proto_enum(CardType, card.type),
+        status=to_proto_enum(CardStatus, card.status),
+        account_id=card.account_id,
+        card_number=card.card_number,
+        card_holder=card.card_holder,
+        expiry_date=card.expiry_date.isoformat(),
+        payment_system=to_proto_enum(CardPaymentSystem, card.payment_system),
+    )
+
+
+def build_account_view(account: AccountSchema) -> AccountView:
+    return AccountView(
+        id=account.id,
+        type=to_proto_enum(AccountType, account.type),
+        cards=[build_card(card) for card in account.cards],
+        status=to_proto_enum(AccountStatus, account.status),
+        balance=account.balance,
+    )
+
+
+def build_account(account: AccountSchema, user_id: str) -> Account:
+    return Account(
+        id=account.id,
+        type=to_proto_enum(AccountType, account.type),
+        status=to_proto_enum(AccountStatus, account.status),
+        user_id=user_id,
+        balance=account.balance,
+    )
+
+
+def build_operation(operation: OperationSchema) -> Operation:
+    return Operation(
+        id=operation.id,
+        type=to_proto_enum(OperationType, operation.type),
+        status=to_proto_enum(OperationStatus, operation.status),
+        amount=operation.amount,
+        card_id=operation.card_id,
+        category=operation.category,
+        created_at=operation.created_at,
+        account_id=operation.account_id,
+    )
+
+
+def build_operations_summary(summary: OperationsSummarySchema) -> OperationsSummary:
+    return OperationsSummary(
+        spent_amount=summary.spent_amount,
+        received_amount=summary.received_amount,
+        cashback_amount=summary.cashback_amount,
+    )
+
+
+def encode_document(document: str) -> bytes:
+    """
+    Содержимое документа для сообщения gRPC. Документы, загруженные через внутренние
+    сервисы (decode_document), возвращаются байт в байт.
+    """
+    return document.encode("utf-8", errors="surrogateescape")
+
+
+def decode_document(content: bytes) -> str:
+    return content.decode("utf-8", errors="surrogateescape")
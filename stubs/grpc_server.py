@@ -0,0 +1,267 @@
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, NamedTuple
+
+import grpc
+from google.protobuf.descriptor import ServiceDescriptor
+from grpc import aio
+
+from config import GRPCStubConfig
+from contracts.services.accounts import accounts_service_pb2, accounts_service_pb2_grpc
+from contracts.services.cards import cards_service_pb2, cards_service_pb2_grpc
+from contracts.services.documents.contracts import (
+    contracts_service_pb2,
+    contracts_service_pb2_grpc,
+)
+from contracts.services.documents.receipts import receipts_service_pb2, receipts_service_pb2_grpc
+from contracts.services.documents.tariffs import tariffs_service_pb2, tariffs_service_pb2_grpc
+from contracts.services.gateway.accounts import (
+    accounts_gateway_service_pb2,
+    accounts_gateway_service_pb2_grpc,
+)
+from contracts.services.gateway.cards import (
+    cards_gateway_service_pb2,
+    cards_gateway_service_pb2_grpc,
+)
+from contracts.services.gateway.documents import (
+    documents_gateway_service_pb2,
+    documents_gateway_service_pb2_grpc,
+)
+from contracts.services.gateway.operations import (
+    operations_gateway_service_pb2,
+    operations_gateway_service_pb2_grpc,
+)
+from contracts.services.gateway.users import (
+    users_gateway_service_pb2,
+    users_gateway_service_pb2_grpc,
+)
+from contracts.services.operations import operations_service_pb2, operations_service_pb2_grpc
+from contracts.services.payments import payments_service_pb2, payments_service_pb2_grpc
+from contracts.services.users import users_service_pb2, users_service_pb2_grpc
+from stubs.grpc_gateway import (
+    AccountsGatewayStubServicer,
+    CardsGatewayStubServicer,
+    DocumentsGatewayStubServicer,
+    OperationsGatewayStubServicer,
+    UsersGatewayStubServicer,
+)
+from stubs.grpc_services import (
+    AccountsStubServicer,
+    CardsStubServicer,
+    ContractsStubServicer,
+    OperationsStubServicer,
+    PaymentsStubServicer,
+    ReceiptsStubServicer,
+    TariffsStubServicer,
+    UsersStubServicer,
+)
+from stubs.profile import StubProfile
+from stubs.store import GatewayStubStore, StubNotFoundError
+
+
+class GRPCStubService(NamedTuple):
+    """
+    Сервис заглушки: описание из контрактов, функция регистрации из *_pb2_grpc
+    и фабрика servicer'а поверх общего хранилища.
+    """
+
+    descriptor: ServiceDescriptor
+    add_to_server: Callable[[Any, aio.Server], None]
+    build_servicer: Callable[[GatewayStubStore, GRPCStubConfig], Any]
+
+
+# Все сервисы контрактов: gateway и внутренние
+GRPC_STUB_SERVICES: list[GRPCStubService] = [
+    GRPCStubService(
+        users_gateway_service_pb2.DESCRIPTOR.services_by_name["UsersGatewayService"],
+        users_gateway_service_pb2_grpc.add_UsersGatewayServiceServicer_to_server,
+        lambda store, config: UsersGatewayStubServicer(store),
+    ),
+    GRPCStubService(
+        accounts_gateway_service_pb2.DESCRIPTOR.services_by_name["AccountsGatewayService"],
+        accounts_gateway_service_pb2_grpc.add_AccountsGatewayServiceServicer_to_server,
+        lambda store, config: AccountsGatewayStubServicer(store),
+    ),
+    GRPCStubService(
+        cards_gateway_service_pb2.DESCRIPTOR.services_by_name["CardsGatewayService"],
+        cards_gateway_service_pb2_grpc.add_CardsGatewayServiceServicer_to_server,
+        lambda store, config: CardsGatewayStubServicer(store),
+    ),
+    GRPCStubService(
+        documents_gateway_service_pb2.DESCRIPTOR.services_by_name["DocumentsGatewayService"],
+        documents_gateway_service_pb2_grpc.add_DocumentsGatewayServiceServicer_to_server,
+        lambda store, config: DocumentsGatewayStubServicer(store),
+    ),
+    GRPCStubService(
+        operations_gateway_service_pb2.DESCRIPTOR.services_by_name["OperationsGatewayService"],
+        operations_gateway_service_pb2_grpc.add_OperationsGatewayServiceServicer_to_server,
+        lambda store, config: OperationsGatewayStubServicer(store),
+    ),
+    GRPCStubService(
+        users_service_pb2.DESCRIPTOR.services_by_name["UsersService"],
+        users_service_pb2_grpc.add_UsersServiceServicer_to_server,
+        lambda store, config: UsersStubServicer(store),
+    ),
+    GRPCStubService(
+        accounts_service_pb2.DESCRIPTOR.services_by_name["AccountsService"],
+        accounts_service_pb2_grpc.add_AccountsServiceServicer_to_server,
+        lambda store, config: AccountsStubServicer(store),
+    ),
+    GRPCStubService(
+        cards_service_pb2.DESCRIPTOR.services_by_name["CardsService"],
+        cards_service_pb2_grpc.add_CardsServiceServicer_to_server,
+        lambda store, config: CardsStubServicer(store),
+    ),
+    GRPCStubService(
+        operations_service_pb2.DESCRIPTOR.services_by_name["OperationsService"],
+        operations_service_pb2_grpc.add_OperationsServiceServicer_to_server,
+        lambda store, config: OperationsStubServicer(store),
+    ),
+    GRPCStubService(
+        payments_service_pb2.DESCRIPTOR.services_by_name["PaymentsService"],
+        payments_service_pb2_grpc.add_PaymentsServiceServicer_to_server,
+        lambda store, config: PaymentsStubServicer(store, config.max_entities),
+    ),
+    GRPCStubService(
+        contracts_service_pb2.DESCRIPTOR.services_by_name["ContractsService"],
+        contracts_service_pb2_grpc.add_ContractsServiceServicer_to_server,
+        lambda store, config: ContractsStubServicer(store),
+    ),
+    GRPCStubService(
+        tariffs_service_pb2.DESCRIPTOR.services_by_name["TariffsService"],
+        tariffs_service_pb2_grpc.add_TariffsServiceServicer_to_server,
+        lambda store, config: TariffsStubServicer(store),
+    ),
+    GRPCStubService(
+        receipts_service_pb2.DESCRIPTOR.services_by_name["ReceiptsService"],
+        receipts_service_pb2_grpc.add_ReceiptsServiceServicer_to_server,
+        lambda store, config: ReceiptsStubServicer(store),
+    ),
+]
+
+
+def get_method_names(services: list[GRPCStubService]) -> list[str]:
+    """
+    Возвращает полные имена методов сервисов, например
+    "/contracts.services.users.UsersService/GetUser" — так их видят интерсепторы.
+    """
+    return [
+        f"/{service.descriptor.full_name}/{method.name}"
+        for service in services
+        for method in service.descriptor.methods
+    ]
+
+
+UnaryBehavior = Callable[[Any, aio.ServicerContext], Awaitable[Any]]
+
+
+class StubProfileInterceptor(aio.ServerInterceptor):
+    """
+    Серверный интерсептор заглушки: задержка ответа и внедрённые ошибки по профилю
+    метода, ошибки хранилища — коды gRPC.
+
+    Servicer'ы заглушки отвечают сразу, профиль применяется к любому методу
+    одинаково: задержка — asyncio.sleep (ожидающие вызовы не занимают потоки),
+    затем с вероятностью error_rate вызов завершается кодом из GRPC_STUB.ERROR_CODES.
+    StubNotFoundError становится NOT_FOUND, ошибки валидации запроса
+    (ValueError, ValidationError) — INVALID_ARGUMENT.
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, StubProfile],
+        error_codes: list[grpc.StatusCode],
+        generator: random.Random,
+    ):
+        """
+        :param profiles: Профили методов по полному имени метода.
+        :param error_codes: Коды внедрённых ошибок.
+        :param generator: Генератор случайных чисел.
+        """
+        self.profiles = profiles
+        self.error_codes = error_codes
+        self.generator = generator
+        # Обёрнутые обработчики методов: создаются при первом вызове метода
+        self.handlers: dict[str, grpc.RpcMethodHandler] = {}
+
+    def wrap_behavior(self, behavior: UnaryBehavior, profile: StubProfile) -> UnaryBehavior:
+        async def unary_unary(request: Any, context: aio.ServicerContext) -> Any:
+            latency = profile.get_latency()
+            if latency > 0:
+                await asyncio.sleep(latency)
+
+            if profile.is_error():
+                await context.abort(self.generator.choice(self.error_codes), "Injected error")
+
+            try:
+                return await behavior(request, context)
+            except StubNotFoundError as error:
+                await context.abort(grpc.StatusCode.NOT_FOUND, str(error))
+            except ValueError as error:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(error))
+
+        return unary_unary
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        method = handler_call_details.method
+        handler = self.handlers.get(method)
+        if handler is not None:
+            return handler
+
+        handler = await continuation(handler_call_details)
+        profile = self.profiles.get(method)
+        # Неизвестный метод (UNIMPLEMENTED) и потоковые методы — без профиля
+        if handler is None or handler.unary_unary is None or profile is None:
+            return handler
+
+        handler = grpc.unary_unary_rpc_method_handler(
+            self.wrap_behavior(handler.unary_unary, profile),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+        self.handlers[method] = handler
+        return handler
+
+
+def build_grpc_stub_server(config: GRPCStubConfig, seed: int | None = None) -> aio.Server:
+    """
+    Создаёт сервер grpc.aio со всеми сервисами контрактов поверх общего хранилища.
+
+    Сервер нужно создавать и запускать внутри event loop (asyncio.run):
+    await server.start(), затем await server.wait_for_termination().
+
+    :param config: Настройки заглушки (адрес, профили, режим хранилища).
+    :param seed: Зерно генератора задержек, ошибок и выдуманных значений. None — случайные.
+    :return: Экземпляр grpc.aio.Server с занятым портом config.port.
+    :raises ValueError: Переопределение профиля или код ошибки не существуют.
+    """
+    generator = random.Random(seed)
+    store = GatewayStubStore(generator, strict=config.strict, max_entities=config.max_entities)
+
+    methods = get_method_names(GRPC_STUB_SERVICES)
+    unknown = set(config.methods) - set(methods)
+    if unknown:
+        raise ValueError(f"Unknown gRPC stub methods: {', '.join(sorted(unknown))}")
+
+    unknown = set(config.error_codes) - set(grpc.StatusCode.__members__)
+    if unknown:
+        raise ValueError(f"Unknown gRPC status codes: {', '.join(sorted(unknown))}")
+
+    interceptor = StubProfileInterceptor(
+        profiles={
+            method: StubProfile(config.get_profile(method), generator) for method in methods
+        },
+        error_codes=[grpc.StatusCode[code] for code in config.error_codes],
+        generator=generator,
+    )
+
+    server = aio.server(interceptors=[interceptor])
+    for service in GRPC_STUB_SERVICES:
+        service.add_to_server(service.build_servicer(store, config), server)
+
+    server.add_insecure_port(f"{config.host}:{config.port}")
+    return server
@@ -0,0 +1,413 @@
+from grpc.aio import ServicerContext
+
+from clients.http.gateway.accounts.schema import AccountStatus as AccountStatusSchema
+from clients.http.gateway.accounts.schema import AccountType as AccountTypeSchema
+from clients.http.gateway.cards.schema import CardPaymentSystem as CardPaymentSystemSchema
+from clients.http.gateway.cards.schema import CardSchema
+from clients.http.gateway.cards.schema import CardStatus as CardStatusSchema
+from clients.http.gateway.cards.schema import CardType as CardTypeSchema
+from clients.http.gateway.operations.schema import OperationStatus as OperationStatusSchema
+from clients.http.gateway.operations.schema import OperationType as OperationTypeSchema
+from clients.http.gateway.users.schema import CreateUserRequestSchema
+from contracts.services.accounts.account_pb2 import AccountStatus, AccountType
+from contracts.services.accounts.accounts_service_pb2_grpc import AccountsServiceServicer
+from contracts.services.accounts.rpc_create_account_pb2 import (
+    CreateAccountRequest,
+    CreateAccountResponse,
+)
+from contracts.services.accounts.rpc_get_account_pb2 import GetAccountRequest, GetAccountResponse
+from contracts.services.accounts.rpc_get_accounts_pb2 import (
+    GetAccountsRequest,
+    GetAccountsResponse,
+)
+from contracts.services.accounts.rpc_update_account_balance_pb2 import (
+    UpdateAccountBalanceRequest,
+    UpdateAccountBalanceResponse,
+)
+from contracts.services.cards.card_pb2 import CardPaymentSystem, CardStatus, CardType
+from contracts.services.cards.cards_service_pb2_grpc import CardsServiceServicer
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardRequest, CreateCardResponse
+from contracts.services.cards.rpc_get_card_pb2 import GetCardRequest, GetCardResponse
+from contracts.services.cards.rpc_get_cards_pb2 import GetCardsRequest, GetCardsResponse
+from contracts.services.documents.contracts.contract_pb2 import Contract
+from contracts.services.documents.contracts.contracts_service_pb2_grpc import (
+    ContractsServiceServicer,
+)
+from contracts.services.documents.contracts.rpc_create_contract_pb2 import (
+    CreateContractRequest,
+    CreateContractResponse,
+)
+from contracts.services.documents.contracts.rpc_get_contract_pb2 import (
+    GetContractRequest,
+    GetContractResponse,
+)
+from contracts.services.documents.receipts.receipt_pb2 import Receipt
+from contracts.services.documents.receipts.receipts_service_pb2_grpc import (
+    ReceiptsServiceServicer,
+)
+from contracts.services.documents.receipts.rpc_create_receipt_pb2 import (
+    CreateReceiptRequest,
+    CreateReceiptResponse,
+)
+from contracts.services.documents.receipts.rpc_get_receipt_pb2 import (
+    GetReceiptRequest,
+    GetReceiptResponse,
+)
+from contracts.services.documents.tariffs.rpc_create_tariff_pb2 import (
+    CreateTariffRequest,
+    CreateTariffResponse,
+)
+from contracts.services.documents.tariffs.rpc_get_tariff_pb2 import (
+    GetTariffRequest,
+    GetTariffResponse,
+)
+from contracts.services.documents.tariffs.tariff_pb2 import Tariff
+from contracts.services.documents.tariffs.tariffs_service_pb2_grpc import TariffsServiceServicer
+from contracts.services.operations.operation_pb2 import OperationStatus, OperationType
+from contracts.services.operations.operations_service_pb2_grpc import OperationsServiceServicer
+from contracts.services.operations.rpc_create_operation_pb2 import (
+    CreateOperationRequest,
+    CreateOperationResponse,
+)
+from contracts.services.operations.rpc_get_operation_pb2 import (
+    GetOperationRequest,
+    GetOperationResponse,
+)
+from contracts.services.operations.rpc_get_operations_pb2 import (
+    GetOperationsRequest,
+    GetOperationsResponse,
+)
+from contracts.services.operations.rpc_get_operations_summary_pb2 import (
+    GetOperationsSummaryRequest,
+    GetOperationsSummaryResponse,
+)
+from contracts.services.payments.payment_pb2 import Payment, PaymentStatus, PaymentSystem
+from contracts.services.payments.payments_service_pb2_grpc import PaymentsServiceServicer
+from contracts.services.payments.rpc_authorize_payment_pb2 import (
+    AuthorizePaymentRequest,
+    AuthorizePaymentResponse,
+)
+from contracts.services.payments.rpc_capture_payment_pb2 import (
+    CapturePaymentRequest,
+    CapturePaymentResponse,
+)
+from contracts.services.payments.rpc_refund_payment_pb2 import (
+    RefundPaymentRequest,
+    RefundPaymentResponse,
+)
+from contracts.services.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
+from contracts.services.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
+from contracts.services.users.users_service_pb2_grpc import UsersServiceServicer
+from stubs.grpc_messages import (
+    build_account,
+    build_card,
+    build_operation,
+    build_operations_summary,
+    build_user,
+    decode_document,
+    encode_document,
+    from_proto_enum,
+)
+from stubs.store import EntityStore, GatewayStubStore
+
+
+class UsersStubServicer(UsersServiceServicer):
+    """
+    Заглушка внутреннего UsersService.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetUser(self, request: GetUserRequest, context: ServicerContext) -> GetUserResponse:
+        return GetUserResponse(user=build_user(self.store.get_user(request.id)))
+
+    async def CreateUser(
+        self, request: CreateUserRequest, context: ServicerContext
+    ) -> CreateUserResponse:
+        user = self.store.create_user(
+            CreateUserRequestSchema(
+                email=request.email,
+                lastName=request.last_name,
+                firstName=request.first_name,
+                middleName=request.middle_name,
+                phoneNumber=request.phone_number,
+            )
+        )
+        return CreateUserResponse(user=build_user(user))
+
+
+class AccountsStubServicer(AccountsServiceServicer):
+    """
+    Заглушка внутреннего AccountsService: счета создаются без карт.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetAccount(
+        self, request: GetAccountRequest, context: ServicerContext
+    ) -> GetAccountResponse:
+        account = self.store.get_account(request.id)
+        return GetAccountResponse(
+            account=build_account(account, self.store.get_account_user_id(account.id))
+        )
+
+    async def GetAccounts(
+        self, request: GetAccountsRequest, context: ServicerContext
+    ) -> GetAccountsResponse:
+        accounts = self.store.get_accounts(request.user_id)
+        return GetAccountsResponse(
+            accounts=[build_account(account, request.user_id) for account in accounts]
+        )
+
+    async def CreateAccount(
+        self, request: CreateAccountRequest, context: ServicerContext
+    ) -> CreateAccountResponse:
+        account = self.store.create_account(
+            request.user_id,
+            from_proto_enum(AccountType, request.type, AccountTypeSchema),
+            from_proto_enum(AccountStatus, request.status, AccountStatusSchema),
+            request.balance,
+        )
+        return CreateAccountResponse(account=build_account(account, request.user_id))
+
+    async def UpdateAccountBalance(
+        self, request: UpdateAccountBalanceRequest, context: ServicerContext
+    ) -> UpdateAccountBalanceResponse:
+        account = self.store.update_account_balance(request.account_id, request.balance)
+        return UpdateAccountBalanceResponse(
+            account=build_account(account, self.store.get_account_user_id(account.id))
+        )
+
+
+class CardsStubServicer(CardsServiceServicer):
+    """
+    Заглушка внутреннего CardsService.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetCard(self, request: GetCardRequest, context: ServicerContext) -> GetCardResponse:
+        return GetCardResponse(card=build_card(self.store.get_card(request.id)))
+
+    async def GetCards(
+        self, request: GetCardsRequest, context: ServicerContext
+    ) -> GetCardsResponse:
+        cards = self.store.get_cards(request.account_id)
+        return GetCardsResponse(cards=[build_card(card) for card in cards])
+
+    async def CreateCard(
+        self, request: CreateCardRequest, context: ServicerContext
+    ) -> CreateCardResponse:
+        account = self.store.get_account(request.account_id)
+        card = CardSchema(
+            id=self.store.build_id(),
+            pin=request.pin,
+            cvv=request.cvv,
+            type=from_proto_enum(CardType, request.type, CardTypeSchema),
+            status=from_proto_enum(CardStatus, request.status, CardStatusSchema),
+            accountId=account.id,
+            cardNumber=request.card_number,
+            cardHolder=request.card_holder,
+            expiryDate=request.expiry_date,
+            paymentSystem=from_proto_enum(
+                CardPaymentSystem, request.payment_system, CardPaymentSystemSchema
+            ),
+        )
+        return CreateCardResponse(card=build_card(self.store.add_card(account, card)))
+
+
+class OperationsStubServicer(OperationsServiceServicer):
+    """
+    Заглушка внутреннего OperationsService.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetOperation(
+        self, request: GetOperationRequest, context: ServicerContext
+    ) -> GetOperationResponse:
+        return GetOperationResponse(operation=build_operation(self.store.get_operation(request.id)))
+
+    async def GetOperations(
+        self, request: GetOperationsRequest, context: ServicerContext
+    ) -> GetOperationsResponse:
+        operations = self.store.get_operations(request.account_id)
+        return GetOperationsResponse(
+            operations=[build_operation(operation) for operation in operations]
+        )
+
+    async def CreateOperation(
+        self, request: CreateOperationRequest, context: ServicerContext
+    ) -> CreateOperationResponse:
+        operation = self.store.make_operation(
+            from_proto_enum(OperationType, request.type, OperationTypeSchema),
+            from_proto_enum(OperationStatus, request.status, OperationStatusSchema),
+            request.amount,
+            request.card_id,
+            request.account_id,
+            category=request.category,
+            created_at=request.created_at,
+        )
+        return CreateOperationResponse(operation=build_operation(operation))
+
+    async def GetOperationsSummary(
+        self, request: GetOperationsSummaryRequest, context: ServicerContext
+    ) -> GetOperationsSummaryResponse:
+        summary = self.store.get_operations_summary(request.account_id)
+        return GetOperationsSummaryResponse(summary=build_operations_summary(summary))
+
+
+class PaymentsStubServicer(PaymentsServiceServicer):
+    """
+    Заглушка внутреннего PaymentsService: платёж проходит авторизацию, списание
+    и возврат. Операция не по порядку (списание неавторизованного платежа, возврат
+    несписанного) завершается статусом PAYMENT_STATUS_FAILED, авторизация
+    с неположительной суммой или без платёжной системы — PAYMENT_STATUS_DECLINED.
+    """
+
+    def __init__(self, store: GatewayStubStore, max_entities: int = 100_000):
+        """
+        :param store: Хранилище заглушки: генератор идентификаторов и строгий режим.
+        :param max_entities: Сколько платежей хранить в памяти.
+        """
+        self.store = store
+        self.payments: EntityStore[Payment] = EntityStore(max_entities)
+
+    def get_payment(self, payment_id: str, system: int, status: int) -> Payment:
+        """
+        Возвращает платёж. В нестрогом режиме неизвестный платёж считается
+        находящимся в статусе status.
+        """
+        payment = self.store.get_entity(self.payments, payment_id, "Payment")
+        if payment is None:
+            payment = Payment(id=payment_id, status=status, system=system)
+
+        return payment
+
+    def update_payment(self, payment: Payment, expected: int, status: int) -> Payment:
+        """
+        Переводит платёж из статуса expected в status. Иначе отвечает статусом
+        PAYMENT_STATUS_FAILED, а сохранённый платёж не меняется.
+        """
+        if payment.status != expected:
+            return Payment(
+                id=payment.id,
+                status=PaymentStatus.PAYMENT_STATUS_FAILED,
+                system=payment.system,
+                message=f"Payment is in {PaymentStatus.Name(payment.status)} status",
+            )
+
+        payment.status, payment.message = status, ""
+        return self.payments.add(payment.id, payment)
+
+    async def AuthorizePayment(
+        self, request: AuthorizePaymentRequest, context: ServicerContext
+    ) -> AuthorizePaymentResponse:
+        payment = Payment(id=self.store.build_id(), system=request.system)
+        if request.amount <= 0 or request.system == PaymentSystem.PAYMENT_SYSTEM_UNSPECIFIED:
+            payment.status = PaymentStatus.PAYMENT_STATUS_DECLINED
+            payment.message = "Invalid amount or payment system"
+        else:
+            payment.status = PaymentStatus.PAYMENT_STATUS_AUTHORIZED
+
+        return AuthorizePaymentResponse(payment=self.payments.add(payment.id, payment))
+
+    async def CapturePayment(
+        self, request: CapturePaymentRequest, context: ServicerContext
+    ) -> CapturePaymentResponse:
+        authorized = PaymentStatus.PAYMENT_STATUS_AUTHORIZED
+        payment = self.get_payment(request.payment_id, request.system, authorized)
+        return CapturePaymentResponse(
+            payment=self.update_payment(
+                payment, authorized, PaymentStatus.PAYMENT_STATUS_CAPTURED
+            )
+        )
+
+    async def RefundPayment(
+        self, request: RefundPaymentRequest, context: ServicerContext
+    ) -> RefundPaymentResponse:
+        captured = PaymentStatus.PAYMENT_STATUS_CAPTURED
+        payment = self.get_payment(request.payment_id, request.system, captured)
+        return RefundPaymentResponse(
+            payment=self.update_payment(payment, captured, PaymentStatus.PAYMENT_STATUS_REFUNDED)
+        )
+
+
+class ContractsStubServicer(ContractsServiceServicer):
+    """
+    Заглушка внутреннего ContractsService.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetContract(
+        self, request: GetContractRequest, context: ServicerContext
+    ) -> GetContractResponse:
+        document = self.store.get_document(request.account_id, "contract")
+        return GetContractResponse(
+            contract=Contract(url=document.url, document=encode_document(document.document))
+        )
+
+    async def CreateContract(
+        self, request: CreateContractRequest, context: ServicerContext
+    ) -> CreateContractResponse:
+        document = self.store.create_document(
+            request.account_id, "contract", decode_document(request.content)
+        )
+        return CreateContractResponse(contract=Contract(url=document.url, document=request.content))
+
+
+class TariffsStubServicer(TariffsServiceServicer):
+    """
+    Заглушка внутреннего TariffsService.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetTariff(
+        self, request: GetTariffRequest, context: ServicerContext
+    ) -> GetTariffResponse:
+        document = self.store.get_document(request.account_id, "tariff")
+        return GetTariffResponse(
+            tariff=Tariff(url=document.url, document=encode_document(document.document))
+        )
+
+    async def CreateTariff(
+        self, request: CreateTariffRequest, context: ServicerContext
+    ) -> CreateTariffResponse:
+        document = self.store.create_document(
+            request.account_id, "tariff", decode_document(request.content)
+        )
+        return CreateTariffResponse(tariff=Tariff(url=document.url, document=request.content))
+
+
+class ReceiptsStubServicer(ReceiptsServiceServicer):
+    """
+    Заглушка внутреннего ReceiptsService: загруженный чек возвращает
+    и OperationsGatewayService.GetOperationReceipt.
+    """
+
+    def __init__(self, store: GatewayStubStore):
+        self.store = store
+
+    async def GetReceipt(
+        self, request: GetReceiptRequest, context: ServicerContext
+    ) -> GetReceiptResponse:
+        receipt = self.store.get_operation_receipt(request.operation_id)
+        return GetReceiptResponse(
+            receipt=Receipt(url=receipt.url, document=encode_document(receipt.document))
+        )
+
+    async def CreateReceipt(
+        self, request: CreateReceiptRequest, context: ServicerContext
+    ) -> CreateReceiptResponse:
+        document = self.store.create_document(
+            request.operation_id, "receipt", decode_document(request.content)
+        )
+        return CreateReceiptResponse(receipt=Receipt(url=document.url, document=request.content))
@@ -0,0 +1,497 @@
+import json
+import random
+import re
+import socket
+from typing import Any, Callable, Iterable, TypeVar
+from urllib.parse import parse_qsl
+
+import gevent
+from gevent.pywsgi import WSGIServer
+from pydantic import BaseModel, ValidationError
+
+from clients.http.gateway.accounts.schema import (
+    AccountType,
+    GetAccountsQuerySchema,
+    GetAccountsResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema,
+)
+from clients.http.gateway.cards.schema import (
+    CardType,
+    IssuePhysicalCardRequestSchema,
+    IssuePhysicalCardResponseSchema,
+    IssueVirtualCardRequestSchema,
+    IssueVirtualCardResponseSchema,
+)
+from clients.http.gateway.documents.schema import (
+    GetContractDocumentResponseSchema,
+    GetTariffDocumentResponseSchema,
+)
+from clients.http.gateway.operations.schema import (
+    GetOperationQuerySchema,
+    GetOperationReceiptResponseSchema,
+    GetOperationResponseSchema,
+    GetOperationsResponseSchema,
+    GetOperationSummaryResponseSchema,
+    MakeBillPaymentOperationRequestSchema,
+    MakeBillPaymentOperationResponseSchema,
+    MakeCashbackOperationRequestSchema,
+    MakeCashbackOperationResponseSchema,
+    MakeCashWithdrawalOperationRequestSchema,
+    MakeCashWithdrawalOperationResponseSchema,
+    MakeFeeOperationRequestSchema,
+    MakeFeeOperationResponseSchema,
+    MakePurchaseOperationRequestSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeTopUpOperationRequestSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeTransferOperationRequestSchema,
+    MakeTransferOperationResponseSchema,
+    OperationType,
+)
+from clients.http.gateway.users.schema import (
+    CreateUserRequestSchema,
+    CreateUserResponseSchema,
+    GetUserResponseSchema,
+)
+from config import HTTPStubConfig
+from stubs.profile import StubProfile
+from stubs.store import GatewayStubStore, StubNotFoundError
+
+Model = TypeVar("Model", bound=BaseModel)
+
+# Тексты статусов ответов заглушки
+HTTP_STATUS_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    422: "Unprocessable Entity",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+# Карточные операции: путь make-<операция>-operation, тип операции и схемы запроса и ответа
+OPERATIONS: list[tuple[str, OperationType, type[BaseModel], type[BaseModel]]] = [
+    ("fee", OperationType.FEE, MakeFeeOperationRequestSchema, MakeFeeOperationResponseSchema),
+    (
+        "top-up",
+        OperationType.TOP_UP,
+        MakeTopUpOperationRequestSchema,
+        MakeTopUpOperationResponseSchema,
+    ),
+    (
+        "cashback",
+        OperationType.CASHBACK,
+        MakeCashbackOperationRequestSchema,
+        MakeCashbackOperationResponseSchema,
+    ),
+    (
+        "transfer",
+        OperationType.TRANSFER,
+        MakeTransferOperationRequestSchema,
+        MakeTransferOperationResponseSchema,
+    ),
+    (
+        "purchase",
+        OperationType.PURCHASE,
+        MakePurchaseOperationRequestSchema,
+        MakePurchaseOperationResponseSchema,
+    ),
+    (
+        "bill-payment",
+        OperationType.BILL_PAYMENT,
+        MakeBillPaymentOperationRequestSchema,
+        MakeBillPaymentOperationResponseSchema,
+    ),
+    (
+        "cash-withdrawal",
+        OperationType.CASH_WITHDRAWAL,
+        MakeCashWithdrawalOperationRequestSchema,
+        MakeCashWithdrawalOperationResponseSchema,
+    ),
+]
+
+# Открытие счетов: путь open-<счёт>-account, тип счёта и схемы запроса и ответа
+ACCOUNTS: list[tuple[str, AccountType, type[BaseModel], type[BaseModel]]] = [
+    (
+        "deposit",
+        AccountType.DEPOSIT,
+        OpenDepositAccountRequestSchema,
+        OpenDepositAccountResponseSchema,
+    ),
+    (
+        "savings",
+        AccountType.SAVINGS,
+        OpenSavingsAccountRequestSchema,
+        OpenSavingsAccountResponseSchema,
+    ),
+    (
+        "debit-card",
+        AccountType.DEBIT_CARD,
+        OpenDebitCardAccountRequestSchema,
+        OpenDebitCardAccountResponseSchema,
+    ),
+    (
+        "credit-card",
+        AccountType.CREDIT_CARD,
+        OpenCreditCardAccountRequestSchema,
+        OpenCreditCardAccountResponseSchema,
+    ),
+]
+
+
+class HTTPStubError(Exception):
+    """
+    Ошибка, которую заглушка возвращает клиенту с заданным статусом.
+    """
+
+    def __init__(self, status: int, detail: Any):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class HTTPStubRequest:
+    """
+    Запрос к заглушке: параметры пути, строка запроса и тело.
+    """
+
+    __slots__ = ("params", "environ")
+
+    def __init__(self, params: dict[str, str], environ: dict[str, Any]):
+        self.params = params
+        self.environ = environ
+
+    def get_query(self, schema: type[Model]) -> Model:
+        """
+        Разбирает строку запроса по схеме.
+
+        :raises ValidationError: Строка запроса не соответствует схеме.
+        """
+        return schema.model_validate(dict(parse_qsl(self.environ.get("QUERY_STRING", ""))))
+
+    def get_body(self, schema: type[Model]) -> Model:
+        """
+        Разбирает JSON-тело запроса по схеме.
+
+        :raises ValidationError: Тело не соответствует схеме.
+        """
+        length = int(self.environ.get("CONTENT_LENGTH") or 0)
+        return schema.model_validate_json(self.environ["wsgi.input"].read(length) or b"{}")
+
+
+HTTPStubHandler = Callable[[HTTPStubRequest], BaseModel]
+
+
+class HTTPStubRoute:
+    """
+    Маршрут заглушки. Имя маршрута совпадает с именем запроса в статистике Locust,
+    например "GET /api/v1/users/{user_id}": по нему задаются переопределения профиля.
+    """
+
+    def __init__(self, method: str, path: str, handler: HTTPStubHandler):
+        self.method = method
+        self.path = path
+        self.handler = handler
+        self.name = f"{method} {path}"
+        self.pattern = re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path) + "$")
+
+    @property
+    def is_static(self) -> bool:
+        return "{" not in self.path
+
+
+class HTTPGatewayStub:
+    """
+    WSGI-приложение, заменяющее http-gateway: все маршруты, к которым обращаются
+    HTTP-клиенты gateway (clients.http.gateway), с состоянием в памяти (GatewayStubStore).
+
+    Тела запросов проверяются схемами клиентов (ошибка — 422, как у gateway),
+    ответы строятся из тех же схем. Перед ответом выдерживается задержка
+    из профиля маршрута, и с заданной долей возвращается внедрённая ошибка
+    (см. StubProfile). Задержка — gevent.sleep, поэтому медленные ответы
+    не задерживают остальные запросы.
+    """
+
+    def __init__(self, store: GatewayStubStore, config: HTTPStubConfig, generator: random.Random):
+        """
+        :param store: Состояние заглушки.
+        :param config: Настройки заглушки (профили маршрутов, статусы ошибок).
+        :param generator: Генератор случайных чисел для задержек и ошибок.
+        """
+        self.store = store
+        self.config = config
+        self.generator = generator
+
+        self.routes = self.build_routes()
+        self.static_routes = {
+            (route.method, route.path): route for route in self.routes if route.is_static
+        }
+        self.pattern_routes = [route for route in self.routes if not route.is_static]
+        self.profiles = {
+            route.name: StubProfile(config.get_profile(route.name), generator)
+            for route in self.routes
+        }
+
+        unknown = set(config.routes) - set(self.profiles)
+        if unknown:
+            raise ValueError(f"Unknown stub routes in profile overrides: {sorted(unknown)}")
+
+    def build_routes(self) -> list[HTTPStubRoute]:
+        return [
+            HTTPStubRoute("GET", "/api/v1/users/{user_id}", self.get_user),
+            HTTPStubRoute("POST", "/api/v1/users", self.create_user),
+            HTTPStubRoute("GET", "/api/v1/accounts", self.get_accounts),
+            *(
+                HTTPStubRoute(
+                    "POST",
+                    f"/api/v1/accounts/open-{path}-account",
+                    self.open_account(account_type, request_schema, response_schema),
+                )
+                for path, account_type, request_schema, response_schema in ACCOUNTS
+            ),
+            HTTPStubRoute(
+                "POST",
+                "/api/v1/cards/issue-virtual-card",
+                self.issue_card(
+                    CardType.VIRTUAL, IssueVirtualCardRequestSchema, IssueVirtualCardResponseSchema
+                ),
+            ),
+            HTTPStubRoute(
+                "POST",
+                "/api/v1/cards/issue-physical-card",
+                self.issue_card(
+                    CardType.PHYSICAL,
+                    IssuePhysicalCardRequestSchema,
+                    IssuePhysicalCardResponseSchema,
+                ),
+            ),
+            HTTPStubRoute(
+                "GET", "/api/v1/documents/tariff-document/{account_id}", self.get_tariff_document
+            ),
+            HTTPStubRoute(
+                "GET",
+                "/api/v1/documents/contract-document/{account_id}",
+                self.get_contract_document,
+            ),
+            HTTPStubRoute("GET", "/api/v1/operations", self.get_operations),
+            HTTPStubRoute(
+                "GET", "/api/v1/operations/operations-summary", self.get_operations_summary
+            ),
+            HTTPStubRoute(
+                "GET",
+                "/api/v1/operations/operation-receipt/{operation_id}",
+                self.get_operation_receipt,
+            ),
+            HTTPStubRoute("GET", "/api/v1/operations/{operation_id}", self.get_operation),
+            *(
+                HTTPStubRoute(
+                    "POST",
+                    f"/api/v1/operations/make-{path}-operation",
+                    self.make_operation(operation_type, request_schema, response_schema),
+                )
+                for path, operation_type, request_schema, response_schema in OPERATIONS
+            ),
+        ]
+
+    def get_user(self, request: HTTPStubRequest) -> GetUserResponseSchema:
+        return GetUserResponseSchema(user=self.store.get_user(request.params["user_id"]))
+
+    def create_user(self, request: HTTPStubRequest) -> CreateUserResponseSchema:
+        user = self.store.create_user(request.get_body(CreateUserRequestSchema))
+        return CreateUserResponseSchema(user=user)
+
+    def get_accounts(self, request: HTTPStubRequest) -> GetAccountsResponseSchema:
+        query = request.get_query(GetAccountsQuerySchema)
+        return GetAccountsResponseSchema(accounts=self.store.get_accounts(query.user_id))
+
+    def open_account(
+        self,
+        account_type: AccountType,
+        request_schema: type[BaseModel],
+        response_schema: type[BaseModel],
+    ) -> HTTPStubHandler:
+        def handler(request: HTTPStubRequest) -> BaseModel:
+            body = request.get_body(request_schema)
+            return response_schema(account=self.store.open_account(body.user_id, account_type))
+
+        return handler
+
+    def issue_card(
+        self,
+        card_type: CardType,
+        request_schema: type[BaseModel],
+        response_schema: type[BaseModel],
+    ) -> HTTPStubHandler:
+        def handler(request: HTTPStubRequest) -> BaseModel:
+            body = request.get_body(request_schema)
+            card = self.store.issue_card(body.user_id, body.account_id, card_type)
+            return response_schema(card=card)
+
+        return handler
+
+    def get_tariff_document(self, request: HTTPStubRequest) -> GetTariffDocumentResponseSchema:
+        document = self.store.get_document(request.params["account_id"], "tariff")
+        return GetTariffDocumentResponseSchema(tariff=document)
+
+    def get_contract_document(
+        self, request: HTTPStubRequest
+    ) -> GetContractDocumentResponseSchema:
+        document = self.store.get_document(request.params["account_id"], "contract")
+        return GetContractDocumentResponseSchema(contract=document)
+
+    def get_operations(self, request: HTTPStubRequest) -> GetOperationsResponseSchema:
+        query = request.get_query(GetOperationQuerySchema)
+        return GetOperationsResponseSchema(operations=self.store.get_operations(query.account_id))
+
+    def get_operations_summary(
+        self, request: HTTPStubRequest
+    ) -> GetOperationSummaryResponseSchema:
+        query = request.get_query(GetOperationQuerySchema)
+        summary = self.store.get_operations_summary(query.account_id)
+        return GetOperationSummaryResponseSchema(summary=summary)
+
+    def get_operation(self, request: HTTPStubRequest) -> GetOperationResponseSchema:
+        operation = self.store.get_operation(request.params["operation_id"])
+        return GetOperationResponseSchema(operations=operation)
+
+    def get_operation_receipt(
+        self, request: HTTPStubRequest
+    ) -> GetOperationReceiptResponseSchema:
+        receipt = self.store.get_operation_receipt(request.params["operation_id"])
+        return GetOperationReceiptResponseSchema(operations=receipt)
+
+    def make_operation(
+        self,
+        operation_type: OperationType,
+        request_schema: type[BaseModel],
+        response_schema: type[BaseModel],
+    ) -> HTTPStubHandler:
+        def handler(request: HTTPStubRequest) -> BaseModel:
+            body = request.get_body(request_schema)
+            operation = self.store.make_operation(
+                operation_type,
+                status=body.status,
+                amount=body.amount,
+                card_id=body.card_id,
+                account_id=body.account_id,
+                category=getattr(body, "category", ""),
+            )
+            return response_schema(operation=operation)
+
+        return handler
+
+    def match(self, method: str, path: str) -> tuple[HTTPStubRoute | None, dict[str, str]]:
+        route = self.static_routes.get((method, path))
+        if route is not None:
+            return route, {}
+
+        for route in self.pattern_routes:
+            if route.method != method:
+                continue
+
+            match = route.pattern.match(path)
+            if match:
+                return route, match.groupdict()
+
+        return None, {}
+
+    def handle(self, route: HTTPStubRoute, request: HTTPStubRequest) -> BaseModel:
+        """
+        Выполняет запрос с задержкой и внедрёнными ошибками из профиля маршрута.
+
+        :raises HTTPStubError: Внедрённая ошибка, неверный запрос или неизвестная сущность.
+        """
+        profile = self.profiles[route.name]
+
+        latency = profile.get_latency()
+        if latency > 0:
+            gevent.sleep(latency)
+
+        if profile.is_error():
+            status = self.generator.choice(self.config.error_statuses)
+            raise HTTPStubError(status, "Injected error")
+
+        try:
+            return route.handler(request)
+        except ValidationError as error:
+            raise HTTPStubError(422, json.loads(error.json(include_url=False)))
+        except StubNotFoundError as error:
+            raise HTTPStubError(404, str(error))
+        except ValueError as error:
+            # Прочие ошибки значений запроса (как INVALID_ARGUMENT в gRPC-заглушке)
+            raise HTTPStubError(422, str(error))
+
+    def __call__(
+        self, environ: dict[str, Any], start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        route, params = self.match(environ["REQUEST_METHOD"], environ["PATH_INFO"])
+
+        try:
+            if route is None:
+                raise HTTPStubError(404, "Not Found")
+
+            response = self.handle(route, HTTPStubRequest(params, environ))
+            status, body = 200, response.model_dump_json(by_alias=True).encode()
+        except HTTPStubError as error:
+            status, body = error.status, json.dumps({"detail": error.detail}).encode()
+
+        start_response(
+            f"{status} {HTTP_STATUS_REASONS.get(status, 'Error')}",
+            [("Content-Type", "application/json"), ("Content-Length", str(len(body)))],
+        )
+        return [body]
+
+
+class HTTPStubServer(WSGIServer):
+    """
+    gevent WSGI-сервер заглушки с отключённым алгоритмом Нейгла.
+
+    pywsgi отправляет заголовки и тело ответа отдельными вызовами send: без TCP_NODELAY
+    тело ждёт подтверждения заголовков, которое клиент откладывает (delayed ACK),
+    и к каждому ответу добавляется ~40 мс.
+    """
+
+    def handle(self, sock: socket.socket, address: tuple[str, int]) -> None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().handle(sock, address)
+
+
+def build_http_gateway_stub(config: HTTPStubConfig, seed: int | None = None) -> HTTPGatewayStub:
+    """
+    Создаёт WSGI-приложение заглушки http-gateway.
+
+    :param config: Настройки заглушки.
+    :param seed: Зерно генератора задержек, ошибок и выдуманных значений. None — случайные.
+    :return: Экземпляр HTTPGatewayStub.
+    """
+    generator = random.Random(seed)
+    store = GatewayStubStore(generator, strict=config.strict, max_entities=config.max_entities)
+    return HTTPGatewayStub(store, config, generator)
+
+
+def build_http_gateway_stub_server(
+    config: HTTPStubConfig, seed: int | None = None
+) -> HTTPStubServer:
+    """
+    Создаёт gevent WSGI-сервер заглушки http-gateway.
+
+    Сервер можно запустить отдельным процессом (python -m stubs http, serve_forever)
+    или внутри процесса с gevent, например рядом с Locust (start): соединения
+    обслуживаются greenlet'ами и не блокируют остальной код.
+
+    :param config: Настройки заглушки (адрес, профили, режим хранилища).
+    :param seed: Зерно генератора задержек, ошибок и выдуманных значений. None — случайные.
+    :return: Экземпляр HTTPStubServer.
+    """
+    application = build_http_gateway_stub(config, seed)
+    return HTTPStubServer((config.host, config.port), application, log=None)
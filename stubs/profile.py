@@ -0,0 +1,58 @@
+import math
+import random
+
+from config import StubProfileConfig
+
+
+class StubProfile:
+    """
+    Задержки и ошибки ответов заглушки согласно профилю (StubProfileConfig).
+
+    Реальный сервис отвечает не за постоянное время: у задержек бывает тяжёлый хвост,
+    часть запросов завершается ошибкой. Профиль воспроизводит это, чтобы на заглушке
+    проверялись и поведение генератора нагрузки при медленных ответах и ошибках,
+    и отчёты (перцентили, доля ошибок), а не только «идеальный» сервер.
+    """
+
+    def __init__(self, config: StubProfileConfig, generator: random.Random):
+        """
+        :param config: Профиль ответов.
+        :param generator: Генератор случайных чисел.
+        """
+        self.config = config
+        self.generator = generator
+
+        # Параметры логнормального распределения с заданным средним:
+        # mean = exp(mu + sigma^2 / 2)
+        sigma = config.latency_sigma
+        self.lognormal_mu = math.log(max(config.latency_mean, 1e-3)) - sigma * sigma / 2
+
+    def get_latency(self) -> float:
+        """
+        Возвращает задержку очередного ответа, с.
+        """
+        config = self.config
+        match config.latency:
+            case "none":
+                return 0
+            case "constant":
+                latency = config.latency_mean
+            case "uniform":
+                return self.generator.uniform(config.latency_min, config.latency_max) / 1000
+            case "exponential":
+                mean = config.latency_mean
+                latency = self.generator.expovariate(1 / mean) if mean > 0 else 0
+            case "lognormal":
+                latency = self.generator.lognormvariate(self.lognormal_mu, config.latency_sigma)
+
+        if config.latency_max > 0:
+            latency = min(latency, config.latency_max)
+
+        return latency / 1000
+
+    def is_error(self) -> bool:
+        """
+        Решает, ответить ли очередным запросом с ошибкой.
+        """
+        return self.config.error_rate > 0 and self.generator.random() < self.config.error_rate
+
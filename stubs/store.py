@@ -0,0 +1,360 @@
+import random
+import uuid
+from collections import OrderedDict, deque
+from datetime import date, datetime, timezone
+from typing import Generic, TypeVar
+
+from clients.http.gateway.accounts.schema import AccountSchema, AccountStatus, AccountType
+from clients.http.gateway.cards.schema import CardPaymentSystem, CardSchema, CardStatus, CardType
+from clients.http.gateway.documents.schema import DocumentSchema
+from clients.http.gateway.operations.schema import (
+    OperationReceiptSchema,
+    OperationSchema,
+    OperationsSummarySchema,
+    OperationStatus,
+    OperationType,
+)
+from clients.http.gateway.users.schema import CreateUserRequestSchema, UserSchema
+from tools.fakers import CATEGORIES, fake
+
+Entity = TypeVar("Entity")
+
+# Счета, к которым при открытии сразу выпускается виртуальная карта
+CARD_ACCOUNT_TYPES = (AccountType.DEBIT_CARD, AccountType.CREDIT_CARD)
+
+# Операции, которые уменьшают и увеличивают баланс счёта
+SPENDING_OPERATION_TYPES = (
+    OperationType.FEE,
+    OperationType.PURCHASE,
+    OperationType.TRANSFER,
+    OperationType.BILL_PAYMENT,
+    OperationType.CASH_WITHDRAWAL,
+)
+RECEIVING_OPERATION_TYPES = (OperationType.TOP_UP, OperationType.CASHBACK)
+
+# Сколько последних операций счёта хранится для списка операций и сводки
+MAX_ACCOUNT_OPERATIONS = 100
+
+
+class StubNotFoundError(LookupError):
+    """
+    Сущность не найдена в хранилище заглушки (только в строгом режиме).
+    """
+
+
+class EntityStore(Generic[Entity]):
+    """
+    Сущности одного вида по идентификатору. Хранится не больше max_size сущностей:
+    при добавлении сверх лимита вытесняется самая старая.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entities: OrderedDict[str, Entity] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def get(self, entity_id: str) -> Entity | None:
+        return self.entities.get(entity_id)
+
+    def add(self, entity_id: str, entity: Entity) -> Entity:
+        self.entities[entity_id] = entity
+        if len(self.entities) > self.max_size:
+            self.entities.popitem(last=False)
+
+        return entity
+
+
+class GatewayStubStore:
+    """
+    Состояние заглушки gateway в памяти: пользователи, счета с картами, операции и документы.
+
+    Хранилище общее для gateway и внутренних сервисов у gRPC-заглушки: счёт, открытый
+    через AccountsGatewayService, виден в AccountsService, карта — в CardsService.
+
+    Ответы строятся из схем HTTP-клиентов (clients.http.gateway), поэтому каждый
+    ответ заглушки проходит ту же валидацию, что и ответ настоящего gateway.
+
+    В строгом режиме обращение к неизвестному идентификатору — ошибка StubNotFoundError
+    (404 у HTTP-заглушки, NOT_FOUND у gRPC). Иначе заглушка отвечает выдуманной сущностью с этим
+    идентификатором: так её можно нагружать данными, созданными на настоящем gateway
+    (SEEDS.PATH), или журналом трафика (REPLAY.PATH).
+    """
+
+    def __init__(self, generator: random.Random, strict: bool = False, max_entities: int = 100_000):
+        """
+        :param generator: Генератор случайных чисел для выдуманных значений.
+        :param strict: Строгий режим: неизвестные идентификаторы — ошибка.
+        :param max_entities: Сколько сущностей каждого вида хранить.
+        """
+        self.generator = generator
+        self.strict = strict
+
+        self.users: EntityStore[UserSchema] = EntityStore(max_entities)
+        self.accounts: EntityStore[AccountSchema] = EntityStore(max_entities)
+        self.account_users: EntityStore[str] = EntityStore(max_entities)
+        self.user_accounts: EntityStore[list[str]] = EntityStore(max_entities)
+        self.cards: EntityStore[CardSchema] = EntityStore(max_entities)
+        self.documents: EntityStore[DocumentSchema] = EntityStore(max_entities)
+        self.operations: EntityStore[OperationSchema] = EntityStore(max_entities)
+        self.account_operations: EntityStore[deque[str]] = EntityStore(max_entities)
+
+    def get_entity(self, store: EntityStore[Entity], entity_id: str, kind: str) -> Entity | None:
+        """
+        Возвращает сущность или None, если её нет и режим нестрогий.
+
+        :raises StubNotFoundError: Сущности нет, режим строгий.
+        """
+        entity = store.get(entity_id)
+        if entity is None and self.strict:
+            raise StubNotFoundError(f"{kind} {entity_id} not found")
+
+        return entity
+
+    def build_id(self) -> str:
+        return str(uuid.UUID(int=self.generator.getrandbits(128), version=4))
+
+    def build_user(self, user_id: str) -> UserSchema:
+        return UserSchema(
+            id=user_id,
+            email=f"{user_id}@stub.example.com",
+            lastName=fake.last_name(),
+            firstName=fake.first_name(),
+            middleName=fake.middle_name(),
+            phoneNumber=f"+7{self.generator.randrange(10**10):010d}",
+        )
+
+    def build_card(self, account_id: str, card_type: CardType, card_holder: str) -> CardSchema:
+        today = date.today()
+        return CardSchema(
+            id=self.build_id(),
+            pin=f"{self.generator.randrange(10**4):04d}",
+            cvv=f"{self.generator.randrange(10**3):03d}",
+            type=card_type,
+            status=CardStatus.ACTIVE,
+            accountId=account_id,
+            cardNumber=f"4{self.generator.randrange(10**15):015d}",
+            cardHolder=card_holder,
+            expiryDate=today.replace(year=today.year + 5, day=1),
+            paymentSystem=self.generator.choice(list(CardPaymentSystem)),
+        )
+
+    def build_account(
+        self,
+        account_id: str,
+        account_type: AccountType,
+        status: AccountStatus = AccountStatus.ACTIVE,
+        balance: float = 0,
+        with_card: bool = True,
+    ) -> AccountSchema:
+        account = AccountSchema(
+            id=account_id,
+            type=account_type,
+            cards=[],
+            status=status,
+            balance=balance,
+        )
+        if with_card and account_type in CARD_ACCOUNT_TYPES:
+            account.cards.append(self.build_card(account_id, CardType.VIRTUAL, "STUB CARDHOLDER"))
+
+        return account
+
+    def build_operation(self, operation_id: str) -> OperationSchema:
+        return OperationSchema(
+            id=operation_id,
+            type=self.generator.choice(list(OperationType)),
+            status=OperationStatus.COMPLETED,
+            amount=round(self.generator.uniform(1, 1000), 2),
+            cardId=self.build_id(),
+            category=self.generator.choice(CATEGORIES),
+            createdAt=datetime.now(timezone.utc).isoformat(),
+            accountId=self.build_id(),
+        )
+
+    def create_user(self, request: CreateUserRequestSchema) -> UserSchema:
+        user_id = self.build_id()
+        user = UserSchema(id=user_id, **request.model_dump(by_alias=True))
+        return self.users.add(user_id, user)
+
+    def get_user(self, user_id: str) -> UserSchema:
+        return self.get_entity(self.users, user_id, "User") or self.build_user(user_id)
+
+    def get_accounts(self, user_id: str) -> list[AccountSchema]:
+        account_ids = self.user_accounts.get(user_id) or []
+        accounts = (self.accounts.get(account_id) for account_id in account_ids)
+        return [account for account in accounts if account is not None]
+
+    def add_account(self, user_id: str, account: AccountSchema) -> AccountSchema:
+        account_ids = self.user_accounts.get(user_id)
+        if account_ids is None:
+            account_ids = self.user_accounts.add(user_id, [])
+        account_ids.append(account.id)
+
+        for card in account.cards:
+            self.cards.add(card.id, card)
+
+        self.account_users.add(account.id, user_id)
+        return self.accounts.add(account.id, account)
+
+    def open_account(self, user_id: str, account_type: AccountType) -> AccountSchema:
+        user = self.get_user(user_id)
+
+        account = self.build_account(self.build_id(), account_type)
+        for card in account.cards:
+            card.card_holder = f"{user.first_name} {user.last_name}".upper()
+
+        return self.add_account(user_id, account)
+
+    def create_account(
+        self, user_id: str, account_type: AccountType, status: AccountStatus, balance: float
+    ) -> AccountSchema:
+        """
+        Создаёт счёт без карт, как внутренний сервис счетов: карты выпускает CardsService.
+        """
+        account = self.build_account(
+            self.build_id(), account_type, status=status, balance=balance, with_card=False
+        )
+        return self.add_account(user_id, account)
+
+    def get_account(self, account_id: str) -> AccountSchema:
+        account = self.get_entity(self.accounts, account_id, "Account")
+        return account or self.build_account(account_id, self.generator.choice(CARD_ACCOUNT_TYPES))
+
+    def get_account_user_id(self, account_id: str) -> str:
+        return self.account_users.get(account_id) or self.build_id()
+
+    def update_account_balance(self, account_id: str, balance: float) -> AccountSchema:
+        account = self.get_account(account_id)
+        account.balance = balance
+        return account
+
+    def add_card(self, account: AccountSchema, card: CardSchema) -> CardSchema:
+        account.cards.append(card)
+        return self.cards.add(card.id, card)
+
+    def issue_card(self, user_id: str, account_id: str, card_type: CardType) -> CardSchema:
+        user = self.get_user(user_id)
+        account = self.get_account(account_id)
+
+        card = self.build_card(
+            account.id, card_type, f"{user.first_name} {user.last_name}".upper()
+        )
+        return self.add_card(account, card)
+
+    def get_card(self, card_id: str) -> CardSchema:
+        card = self.get_entity(self.cards, card_id, "Card")
+        if card is None:
+            card = self.build_card(self.build_id(), CardType.VIRTUAL, "STUB CARDHOLDER")
+            card.id = card_id
+
+        return card
+
+    def get_cards(self, account_id: str) -> list[CardSchema]:
+        return self.get_account(account_id).cards
+
+    def make_operation(
+        self,
+        operation_type: OperationType,
+        status: OperationStatus,
+        amount: float,
+        card_id: str,
+        account_id: str,
+        category: str = "",
+        created_at: str = "",
+    ) -> OperationSchema:
+        account = self.get_account(account_id)
+
+        operation = OperationSchema(
+            id=self.build_id(),
+            type=operation_type,
+            status=status,
+            amount=amount,
+            cardId=card_id,
+            category=category,
+            createdAt=created_at or datetime.now(timezone.utc).isoformat(),
+            accountId=account.id,
+        )
+
+        if status == OperationStatus.COMPLETED:
+            sign = 1 if operation_type in RECEIVING_OPERATION_TYPES else -1
+            account.balance = round(account.balance + sign * amount, 2)
+
+        operation_ids = self.account_operations.get(account.id)
+        if operation_ids is None:
+            operation_ids = self.account_operations.add(
+                account.id, deque(maxlen=MAX_ACCOUNT_OPERATIONS)
+            )
+        operation_ids.append(operation.id)
+
+        return self.operations.add(operation.id, operation)
+
+    def get_operation(self, operation_id: str) -> OperationSchema:
+        operation = self.get_entity(self.operations, operation_id, "Operation")
+        return operation or self.build_operation(operation_id)
+
+    def get_operations(self, account_id: str) -> list[OperationSchema]:
+        self.get_entity(self.accounts, account_id, "Account")
+
+        operation_ids = self.account_operations.get(account_id) or ()
+        operations = (self.operations.get(operation_id) for operation_id in operation_ids)
+        return [operation for operation in operations if operation is not None]
+
+    def get_operations_summary(self, account_id: str) -> OperationsSummarySchema:
+        spent = received = cashback = 0.0
+        for operation in self.get_operations(account_id):
+            if operation.type == OperationType.CASHBACK:
+                cashback += operation.amount
+            elif operation.type in RECEIVING_OPERATION_TYPES:
+                received += operation.amount
+            elif operation.type in SPENDING_OPERATION_TYPES:
+                spent += operation.amount
+
+        return OperationsSummarySchema(
+            spentAmount=round(spent, 2),
+            receivedAmount=round(received, 2),
+            cashbackAmount=round(cashback, 2),
+        )
+
+    def get_operation_receipt(self, operation_id: str) -> OperationReceiptSchema:
+        receipt = self.documents.get(f"receipt/{operation_id}")
+        if receipt is not None:
+            return OperationReceiptSchema(url=receipt.url, document=receipt.document)
+
+        operation = self.get_operation(operation_id)
+        return OperationReceiptSchema(
+            url=f"https://stub.example.com/receipts/{operation.id}.pdf",
+            document=f"Receipt {operation.id}: {operation.type} {operation.amount:.2f}",
+        )
+
+    def create_document(self, entity_id: str, kind: str, document: str) -> DocumentSchema:
+        """
+        Сохраняет документ, загруженный во внутренний сервис документов.
+
+        :param entity_id: Счёт (tariff, contract) или операция (receipt).
+        :param kind: Вид документа: tariff, contract или receipt.
+        :param document: Содержимое документа.
+        """
+        folder = "receipts" if kind == "receipt" else f"documents/{kind}"
+        return self.documents.add(
+            f"{kind}/{entity_id}",
+            DocumentSchema(
+                url=f"https://stub.example.com/{folder}/{entity_id}.pdf", document=document
+            ),
+        )
+
+    def get_document(self, account_id: str, kind: str) -> DocumentSchema:
+        """
+        Возвращает документ счёта: загруженный через create_document или выдуманный.
+
+        :param kind: Вид документа: tariff или contract.
+        """
+        document = self.documents.get(f"{kind}/{account_id}")
+        if document is not None:
+            return document
+
+        account = self.get_account(account_id)
+        return DocumentSchema(
+            url=f"https://stub.example.com/documents/{kind}/{account.id}.pdf",
+            document=f"{kind.capitalize()} document for {account.type} account {account.id}",
+        )
@@ -1,20 +1,158 @@
-import time
+import hashlib
+import random
+import threading
+from functools import lru_cache
+from itertools import count
+from typing import Any, Callable, Hashable, Iterator
+from uuid import uuid4
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+from config import FakeConfig, settings
+
+# Категории покупок, используемые для имитации типов расходов
+CATEGORIES = (
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+)
+
+# Разрядность частей уникального номера телефона: <воркер> <пользователь> <порядковый номер>.
+# Вместе с кодом страны +7 получается 15 цифр — максимум для формата E.164.
+PHONE_WORKER_DIGITS = 3
+PHONE_USER_DIGITS = 5
+PHONE_SEQUENCE_DIGITS = 6
+PHONE_SPACE = 10 ** (PHONE_WORKER_DIGITS + PHONE_USER_DIGITS + PHONE_SEQUENCE_DIGITS)
+
+
+@lru_cache(maxsize=None)
+def get_phone_permutation(run_id: str) -> tuple[int, int]:
+    """
+    Возвращает ключ перестановки номеров телефонов запуска: x -> (a * x + b) mod PHONE_SPACE.
+
+    Множитель a взаимно прост с PHONE_SPACE (не делится на 2 и 5), поэтому перестановка
+    взаимно однозначна: номера одного запуска не пересекаются, а разные запуски
+    с теми же индексами воркеров и пользователей получают разные номера.
+
+    :param run_id: Идентификатор запуска.
+    :return: Пара (a, b).
+    """
+    digest = hashlib.sha256(run_id.encode()).digest()
+    a = int.from_bytes(digest[:8]) % (PHONE_SPACE // 10) * 10 + (1, 3, 7, 9)[digest[8] % 4]
+    b = int.from_bytes(digest[9:17]) % PHONE_SPACE
+    return a, b
+
+
+class FakeStream:
+    """
+    Поток случайных данных одного раздела: воркера и виртуального пользователя.
+
+    У каждого раздела свой генератор random.Random, зерно которого выводится
+    из общего зерна и индексов раздела, и свой экземпляр Faker поверх него (создаётся
+    при первом обращении, см. Fake.generator). Поэтому данные раздела не зависят от того,
+    как чередуются вызовы других пользователей и потоков, и повторяются от запуска к запуску.
+    """
+
+    def __init__(self, seed: int | None, worker_index: int = 0, user_index: int = 0):
+        """
+        :param seed: Общее зерно генерации. None — случайные данные.
+        :param worker_index: Индекс воркера Locust.
+        :param user_index: Индекс виртуального пользователя в воркере.
+        """
+        self.worker_index = worker_index
+        self.user_index = user_index
+        self.random = random.Random(
+            f"{seed}:{worker_index}:{user_index}" if seed is not None else None
+        )
+        self.faker: Faker | None = None
+        self.sequence = count()
+        self.phones = count()
+        self.counters: dict[Hashable, Iterator[int]] = {}
+
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    Данные генерируются в разделах (см. FakeStream): текущий раздел хранится
+    отдельно для каждого потока/greenlet'а и переключается через activate().
+    Email и телефоны уникальны в рамках запуска без обращения к системным часам:
+    они строятся из идентификатора запуска, индексов воркера и пользователя
+    и порядкового номера (у телефонов — своего).
     """
 
-    def __init__(self, faker: Faker):
+    def __init__(self, faker: Faker, seed: int | None = None, run_id: str | None = None):
         """
-        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param faker: Экземпляр класса Faker — образец (локали) для экземпляров Faker разделов.
+        :param seed: Зерно генерации. С одинаковым зерном запуск воспроизводится полностью.
+        :param run_id: Идентификатор запуска в уникальных значениях. По умолчанию
+                       выводится из seed, а без seed — случайный.
         """
         self.faker = faker
+        self.seed = seed
+        self.run_id = run_id or (f"s{seed}" if seed is not None else uuid4().hex[:8])
+
+        self.local = threading.local()
+        self.default_stream = FakeStream(seed)
+
+    def activate(self, worker_index: int = 0, user_index: int = 0) -> None:
+        """
+        Переключает текущий поток/greenlet на раздел данных (воркер, пользователь).
+
+        Вызывается один раз при старте виртуального пользователя. Индексы пользователей
+        внутри воркера должны быть уникальными, иначе уникальность email не гарантируется.
+
+        :param worker_index: Индекс воркера Locust.
+        :param user_index: Индекс виртуального пользователя в воркере (начиная с 1,
+                           0 занят разделом по умолчанию).
+        """
+        self.local.stream = FakeStream(self.seed, worker_index, user_index)
+
+    @property
+    def stream(self) -> FakeStream:
+        """
+        Текущий раздел данных: активированный в этом потоке или раздел по умолчанию.
+        """
+        return getattr(self.local, "stream", None) or self.default_stream
+
+    def build_faker(self, generator: random.Random) -> Faker:
+        """
+        Создаёт экземпляр Faker с локалями образца поверх заданного генератора.
+
+        Общий Faker не перенастраивается на генератор раздела при каждом вызове:
+        потоки и greenlet'ы, переключаемые посреди вызова, брали бы случайные
+        числа из чужого раздела, и воспроизводимость данных терялась бы.
+        """
+        faker = Faker(self.faker.locales)
+        faker.random = generator
+        return faker
+
+    @property
+    def generator(self) -> Faker:
+        """
+        Faker текущего раздела (создаётся при первом обращении раздела).
+        """
+        stream = self.stream
+        if stream.faker is None:
+            stream.faker = self.build_faker(stream.random)
+
+        return stream.faker
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -23,16 +161,24 @@ class Fake:
         :param value: Enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.enum(value)
+        return self.generator.enum(value)
+
+    def unique_id(self) -> str:
+        """
+        Возвращает идентификатор, уникальный в рамках запуска:
+        <запуск>.<воркер>.<пользователь>.<порядковый номер>.
+        """
+        stream = self.stream
+        return f"{self.run_id}.{stream.worker_index}.{stream.user_index}.{next(stream.sequence)}"
 
     def email(self) -> str:
         """
-        Генерирует случайный email.
+        Генерирует уникальный email.
 
         Если не указан, будет использован случайный домен.
         :return: Случайный email.
         """
-        return f"{time.time()}.{self.faker.email()}"
+        return f"{self.unique_id()}.{self.generator.email()}"
 
     def category(self) -> str:
         """
@@ -43,25 +189,7 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        return self.generator.random_element(CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -69,7 +197,7 @@ class Fake:
 
         :return: Случайная фамилия.
         """
-        return self.faker.last_name()
+        return self.generator.last_name()
 
     def first_name(self) -> str:
         """
@@ -77,7 +205,7 @@ class Fake:
 
         :return: Случайное имя.
         """
-        return self.faker.first_name()
+        return self.generator.first_name()
 
     def middle_name(self) -> str:
         """
@@ -85,15 +213,38 @@ class Fake:
 
         :return: Случайное отчество.
         """
-        return self.faker.first_name()
+        return self.generator.first_name()
 
     def phone_number(self) -> str:
         """
-        Генерирует случайный номер телефона.
+        Генерирует уникальный в рамках запуска номер телефона.
+
+        Номер составляется из индекса воркера, индекса пользователя и собственного
+        порядкового номера телефонов раздела фиксированной разрядности и переставляется
+        ключом запуска (см. get_phone_permutation): номера разных разделов
+        не пересекаются, а повторный запуск не повторяет номера предыдущего.
 
-        :return: Случайный номер телефона.
+        :return: Номер телефона в формате E.164, например +748213907765120.
         """
-        return self.faker.phone_number()
+        stream = self.stream
+        sequence = next(stream.phones)
+        parts = (
+            (stream.worker_index, PHONE_WORKER_DIGITS),
+            (stream.user_index, PHONE_USER_DIGITS),
+            (sequence, PHONE_SEQUENCE_DIGITS),
+        )
+        if any(value >= 10**digits for value, digits in parts):
+            raise ValueError(
+                f"Phone number space exhausted for worker {stream.worker_index}, "
+                f"user {stream.user_index}, sequence {sequence}"
+            )
+
+        number = 0
+        for value, digits in parts:
+            number = number * 10**digits + value
+
+        a, b = get_phone_permutation(self.run_id)
+        return f"+7{(a * number + b) % PHONE_SPACE:014d}"
 
     def float(self, start: int = 1, end: int = 100) -> float:
         """
@@ -103,7 +254,7 @@ class Fake:
         :param end: Конец диапазона (включительно).
         :return: Случайное число с плавающей запятой.
         """
-        return self.faker.pyfloat(min_value=start, max_value=end, right_digits=2)
+        return self.generator.pyfloat(min_value=start, max_value=end, right_digits=2)
 
     def amount(self) -> float:
         """
@@ -112,7 +263,7 @@ class Fake:
         :return: Сумма от 1 до 1000.
         """
         return self.float(1, 1000)
-    
+
     def proto_enum(self, value: EnumTypeWrapper) -> int:
         """
         Выбирает случайное значение из proto enum-типа.
@@ -120,8 +271,127 @@ class Fake:
         :param value: Proto enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.random_element(value.values())
+        return self.generator.random_element(value.values())
+
+
+class PooledFake(Fake):
+    """
+    Генератор тестовых данных с заранее сгенерированными пулами значений.
+
+    Faker заметно нагружает CPU генератора нагрузки, а вызывается на горячем пути
+    (create_user, make_*_operation). PooledFake генерирует пулы строковых полей
+    Faker (имена, email) по size значений сразу при создании — до старта
+    пользователей, а затем раздаёт их по кругу за O(1). Числа и выбор из наборов
+    (enum, категории) Faker не требуют и берутся напрямую из генератора
+    random.Random раздела.
+
+    Пулы общие для всех разделов, а позиция чтения у каждого раздела своя
+    (со случайным для раздела смещением), поэтому раздача воспроизводима.
+    """
+
+    def __init__(
+        self,
+        faker: Faker,
+        size: int = 10_000,
+        seed: int | None = None,
+        run_id: str | None = None,
+    ):
+        """
+        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param size: Размер пула каждого поля.
+        :param seed: Зерно генерации. None — случайные значения.
+        :param run_id: Идентификатор запуска в уникальных значениях (см. Fake).
+        """
+        super().__init__(faker, seed=seed, run_id=run_id)
+
+        self.size = size
+        self.random = random.Random(f"{seed}:pools" if seed is not None else None)
+        self.values: dict[Hashable, list[Any]] = {}
+
+        faker = self.build_faker(self.random)
+        self.pools: dict[str, list[Any]] = {
+            "email": self.generate(faker.email),
+            "last_name": self.generate(faker.last_name),
+            "first_name": self.generate(faker.first_name),
+        }
+        # Отчества — те же имена: у раздела своё смещение в пуле для каждого поля
+        self.pools["middle_name"] = self.pools["first_name"]
+
+    def generate(self, factory: Callable[[], Any]) -> list[Any]:
+        """
+        Генерирует пул из size значений функции Faker.
+        """
+        return [factory() for _ in range(self.size)]
+
+    def take(self, key: str) -> Any:
+        """
+        Возвращает следующее значение из пула для текущего раздела.
+
+        :param key: Ключ пула, например "first_name".
+        :return: Значение из пула.
+        """
+        pool = self.pools[key]
+
+        stream = self.stream
+        counter = stream.counters.get(key)
+        if counter is None:
+            counter = stream.counters[key] = count(stream.random.randrange(len(pool)))
+
+        return pool[next(counter) % len(pool)]
+
+    def choice(self, key: Hashable, values: Callable[[], list[Any]]) -> Any:
+        """
+        Выбирает случайный элемент из набора значений, кешируя сам набор.
+
+        :param key: Ключ набора, например enum-класс.
+        :param values: Функция, возвращающая набор значений.
+        :return: Случайный элемент набора.
+        """
+        cached = self.values.get(key)
+        if cached is None:
+            cached = self.values[key] = list(values())
+
+        return self.stream.random.choice(cached)
+
+    def enum(self, value: type[TEnum]) -> TEnum:
+        return self.choice(value, lambda: list(value))
+
+    def email(self) -> str:
+        return f"{self.unique_id()}.{self.take('email')}"
+
+    def category(self) -> str:
+        return self.choice("category", lambda: list(CATEGORIES))
+
+    def last_name(self) -> str:
+        return self.take("last_name")
+
+    def first_name(self) -> str:
+        return self.take("first_name")
+
+    def middle_name(self) -> str:
+        return self.take("middle_name")
+
+    def float(self, start: int = 1, end: int = 100) -> float:
+        return round(self.stream.random.uniform(start, end), 2)
+
+    def proto_enum(self, value: EnumTypeWrapper) -> int:
+        return self.choice(value, value.values)
+
+
+def build_fake(config: FakeConfig) -> Fake:
+    """
+    Создаёт генератор тестовых данных согласно настройкам.
+
+    :param config: Настройки генерации данных.
+    :return: PooledFake при pool_size > 0, иначе Fake.
+    """
+    if config.pool_size > 0:
+        return PooledFake(
+            faker=Faker(), size=config.pool_size, seed=config.seed, run_id=config.run_id
+        )
+
+    return Fake(faker=Faker(), seed=config.seed, run_id=config.run_id)
 
 
-# Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker=Faker())
\ No newline at end of file
+# Создаем экземпляр генератора тестовых данных согласно настройкам
+fake = build_fake(settings.fake)
@@ -0,0 +1,231 @@
+import time
+from typing import Callable
+
+from locust import User, events
+from locust.exception import StopUser
+from locust.env import Environment
+
+from config import ArrivalRateConfig, settings
+
+WaitTime = Callable[[User], float]
+
+
+class ArrivalRateScheduler:
+    """
+    Расписание запусков итераций сценария с заданной частотой (открытая модель нагрузки).
+
+    В закрытой модели (wait_time = between(1, 3)) пользователь начинает следующую
+    итерацию только после завершения предыдущей: когда gateway замедляется,
+    частота запросов падает, а задержки, которые увидели бы клиенты, в статистику
+    не попадают (coordinated omission).
+
+    Здесь моменты запуска (intended start) выдаются по расписанию независимо от времени
+    ответа: k-я итерация должна начаться в момент t0 + k / rate. Виртуальные
+    пользователи работают как пул исполнителей: свободный пользователь берёт следующий
+    момент из расписания и ждёт его, а если момент уже прошёл (все были заняты),
+    начинает сразу — и это опоздание учитывается в метриках.
+
+    Частота может меняться ступенями с линейным переходом (stages). Если после последней
+    ступени частота равна нулю, пользователи останавливаются, когда расписание исчерпано.
+    """
+
+    def __init__(self, rate: float, stages: list[tuple[float, float]] | None = None):
+        """
+        :param rate: Начальная частота итераций в секунду.
+        :param stages: Ступени (длительность в секундах, целевая частота). Частота
+                       линейно меняется от предыдущей до целевой за длительность ступени,
+                       после последней ступени держится последняя целевая частота.
+        """
+        self.rate = rate
+        self.stages = stages or []
+        self.started: float | None = None
+        self.next_start: float | None = None
+
+    def get_rate(self, elapsed: float) -> float:
+        """
+        Возвращает целевую частоту итераций через elapsed секунд после начала.
+        """
+        rate = self.rate
+        for duration, target in self.stages:
+            if elapsed < duration:
+                return rate + (target - rate) * elapsed / duration
+
+            elapsed -= duration
+            rate = target
+
+        return rate
+
+    def get_stage_end(self, elapsed: float) -> float | None:
+        """
+        Возвращает момент окончания текущей ступени (от начала) или None после последней.
+        """
+        end = 0.0
+        for duration, _ in self.stages:
+            end += duration
+            if elapsed < end:
+                return end
+
+        return None
+
+    def claim(self) -> float:
+        """
+        Выдаёт следующий момент запуска итерации (по time.monotonic).
+
+        :return: Запланированный момент запуска (intended start).
+        :raises ValueError: Частота равна нулю и больше не изменится.
+        """
+        now = time.monotonic()
+        if self.started is None:
+            self.started = self.next_start = now
+
+        intended = self.next_start
+        elapsed = intended - self.started
+
+        rate = self.get_rate(elapsed)
+        if rate > 0:
+            self.next_start = intended + 1 / rate
+        else:
+            # На участке с нулевой частотой итераций нет до конца ступени
+            stage_end = self.get_stage_end(elapsed)
+            if stage_end is None:
+                raise ValueError("Arrival rate is zero after the last stage")
+            self.next_start = self.started + stage_end
+
+        return intended
+
+
+class ArrivalRateUserState:
+    """
+    Отметки текущей итерации виртуального пользователя.
+    """
+
+    __slots__ = ("intended", "started")
+
+    def __init__(self, intended: float, started: float):
+        self.intended = intended
+        self.started = started
+
+
+# Расписания процесса (воркера) по классу пользователей: все пользователи
+# одного сценария берут моменты запуска из общего расписания
+_schedulers: dict[tuple[int, type[User]], ArrivalRateScheduler] = {}
+
+
+@events.test_start.add_listener
+def reset_arrival_rate_schedulers(**kwargs) -> None:
+    """
+    Сбрасывает расписания в начале теста: повторный запуск (например, из веб-интерфейса)
+    начинает расписание заново, а не догоняет пропущенные моменты.
+    """
+    _schedulers.clear()
+
+
+def build_arrival_rate_scheduler(config: ArrivalRateConfig) -> ArrivalRateScheduler:
+    """
+    Создаёт расписание запусков согласно настройкам.
+
+    :param config: Настройки открытой модели нагрузки.
+    :return: Экземпляр ArrivalRateScheduler.
+    """
+    return ArrivalRateScheduler(rate=config.rate, stages=config.stages)
+
+
+def get_arrival_rate_scheduler(user: User) -> ArrivalRateScheduler | None:
+    """
+    Возвращает общее расписание запусков для сценария пользователя
+    или None, если открытая модель не включена (ARRIVAL_RATE.RATE = 0 и нет ступеней).
+    """
+    config = settings.arrival_rate
+    if not config.enabled:
+        return None
+
+    key = (id(user.environment), type(user))
+    scheduler = _schedulers.get(key)
+    if scheduler is None:
+        scheduler = _schedulers[key] = build_arrival_rate_scheduler(config)
+
+    return scheduler
+
+
+def fire_arrival_rate_events(
+    environment: Environment, name: str, state: ArrivalRateUserState, finished: float
+) -> None:
+    """
+    Отправляет в Locust метрики завершённой итерации:
+
+    - "ARRIVAL" — время итерации от запланированного момента запуска до завершения.
+      Это задержка, которую увидел бы клиент, пришедший по расписанию;
+    - "ARRIVAL:delay" — опоздание фактического запуска относительно запланированного
+      (все виртуальные пользователи были заняты).
+
+    :param environment: Окружение Locust.
+    :param name: Имя сценария в статистике.
+    :param state: Отметки итерации.
+    :param finished: Момент завершения итерации (time.monotonic).
+    """
+    environment.events.request.fire(
+        name=name,
+        context={"intended_start": state.intended, "actual_start": state.started},
+        response=None,
+        exception=None,
+        request_type="ARRIVAL",
+        response_time=(finished - state.intended) * 1000,
+        response_length=0,
+    )
+    environment.events.request.fire(
+        name=name,
+        context=None,
+        response=None,
+        exception=None,
+        request_type="ARRIVAL:delay",
+        response_time=(state.started - state.intended) * 1000,
+        response_length=0,
+    )
+
+
+def arrival_rate(fallback: WaitTime) -> WaitTime:
+    """
+    Возвращает функцию wait_time для открытой модели нагрузки.
+
+    Если открытая модель включена в настройках (settings.arrival_rate), пользователь
+    ждёт не случайную паузу, а следующий момент запуска из общего расписания сценария
+    (см. ArrivalRateScheduler), и после каждой итерации в Locust уходят метрики
+    запланированного и фактического запуска. Иначе используется fallback.
+
+    Число пользователей (-u) задаёт размер пула исполнителей: его должно хватать,
+    чтобы держать целевую частоту при ожидаемом времени итерации. Первая итерация
+    каждого пользователя, как и в закрытой модели, выполняется сразу после старта
+    и в метрики ARRIVAL не попадает.
+
+    Пример:
+
+        class GetUserScenarioUser(User):
+            wait_time = arrival_rate(between(1, 3))
+
+    :param fallback: wait_time закрытой модели, например between(1, 3).
+    :return: Функция wait_time для класса пользователя Locust.
+    """
+
+    def wait_time(user: User) -> float:
+        scheduler = get_arrival_rate_scheduler(user)
+        if scheduler is None:
+            return fallback(user)
+
+        now = time.monotonic()
+
+        # wait_time вызывается после каждой итерации: завершаем предыдущую
+        state: ArrivalRateUserState | None = getattr(user, "arrival_rate_state", None)
+        if state is not None:
+            fire_arrival_rate_events(user.environment, type(user).__name__, state, now)
+
+        try:
+            intended = scheduler.claim()
+        except ValueError:
+            # Расписание закончилось: итераций больше не будет
+            raise StopUser()
+
+        user.arrival_rate_state = ArrivalRateUserState(intended, max(intended, now))
+
+        return max(intended - now, 0)
+
+    return wait_time
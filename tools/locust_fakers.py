@@ -0,0 +1,42 @@
+from itertools import count
+
+from locust.env import Environment
+
+from tools.fakers import fake
+
+# Индексы виртуальных пользователей воркера. 0 занят разделом данных по умолчанию.
+_user_indexes = count(1)
+
+
+def activate_user_fake(environment: Environment) -> None:
+    """
+    Переключает текущего виртуального пользователя Locust на собственный раздел данных.
+
+    Раздел определяется индексом воркера (назначается мастером, в локальном
+    запуске равен 0) и порядковым номером пользователя в воркере. Вызывается
+    в начале on_start: все данные, которые пользователь затем генерирует через fake,
+    уникальны между воркерами и при заданном seed повторяются от запуска к запуску.
+
+    :param environment: Объект окружения Locust.
+    """
+    worker_index = getattr(environment.runner, "worker_index", 0)
+
+    fake.activate(worker_index=max(worker_index, 0), user_index=next(_user_indexes))
+
+
+def reset_user_fakes(run_id: str | None = None) -> None:
+    """
+    Начинает нумерацию разделов данных пользователей заново.
+
+    Нужен, когда в одном процессе один за другим проходят несколько запусков
+    (например, сравнение транспортов в пакете compare): с заданным seed пользователи
+    каждого запуска получают те же разделы и генерируют те же данные.
+
+    :param run_id: Новый идентификатор запуска в уникальных значениях (email и т.п.),
+                   чтобы повторный запуск не создавал тех же пользователей. None — не менять.
+    """
+    global _user_indexes
+
+    _user_indexes = count(1)
+    if run_id is not None:
+        fake.run_id = run_id
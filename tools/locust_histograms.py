@@ -0,0 +1,104 @@
+import logging
+import time
+
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+import tools.locust_settings  # noqa: F401 — настройки из командной строки применяются раньше
+from config import HistogramsConfig, settings
+from metrics.encoding import add_encoded_histograms, encode_histograms, save_histograms
+from metrics.sink import (
+    LatencyHistogramSink,
+    format_histograms_report,
+    write_histograms_report,
+)
+
+logger = logging.getLogger(__name__)
+
+# Ключ данных воркера в сообщении мастеру (events.report_to_master)
+REPORT_KEY = "latency_histograms"
+
+# Приёмники гистограмм по окружению Locust
+_sinks: dict[int, LatencyHistogramSink] = {}
+
+
+def build_latency_histogram_sink(config: HistogramsConfig) -> LatencyHistogramSink:
+    """
+    Создаёт приёмник гистограмм задержек согласно настройкам.
+
+    :param config: Настройки гистограмм задержек.
+    :return: Экземпляр LatencyHistogramSink.
+    """
+    return LatencyHistogramSink(
+        expected_interval=config.expected_interval,
+        significant_figures=config.significant_figures,
+        request_types=config.request_types,
+    )
+
+
+def get_latency_histogram_sink(environment: Environment) -> LatencyHistogramSink | None:
+    """
+    Возвращает приёмник гистограмм окружения или None, если гистограммы не включены.
+    """
+    return _sinks.get(id(environment))
+
+
+@events.init.add_listener
+def register_latency_histograms(environment: Environment, **kwargs) -> None:
+    """
+    Подключает HDR-гистограммы задержек к окружению Locust (settings.histograms).
+
+    Гистограммы получают те же метрики, что и статистика Locust: события запросов,
+    которые отправляют event hooks HTTP-клиентов и LocustInterceptor gRPC-клиентов.
+
+    В распределённом режиме воркер отправляет накопленные гистограммы вместе
+    со своей статистикой компактным бинарным блобом (metrics.encoding) и начинает
+    новые, а мастер складывает их без потерь: перцентили точные по всем воркерам,
+    при этом отдельные значения не передаются.
+
+    По завершении теста мастер (или единственный процесс) выводит перцентили в лог,
+    сохраняет их в CSV (HISTOGRAMS.PATH), а сами гистограммы — в файл запуска
+    в HISTOGRAMS.RUNS_PATH (см. python -m metrics).
+
+    Чтобы гистограммы подключились, модуль нужно импортировать в locustfile.
+    """
+    config = settings.histograms
+    if not config.enabled:
+        return
+
+    sink = _sinks[id(environment)] = build_latency_histogram_sink(config)
+    run_started = time.strftime("%Y%m%d-%H%M%S")
+
+    def on_request(request_type: str, name: str, response_time: float, **kwargs) -> None:
+        sink.record(request_type, name, response_time)
+
+    environment.events.request.add_listener(on_request)
+    environment.events.reset_stats.add_listener(sink.reset)
+
+    if isinstance(environment.runner, WorkerRunner):
+
+        def on_report_to_master(client_id: str, data: dict) -> None:
+            data[REPORT_KEY] = encode_histograms(sink)
+            sink.reset()
+
+        environment.events.report_to_master.add_listener(on_report_to_master)
+        return
+
+    def on_worker_report(client_id: str, data: dict) -> None:
+        if REPORT_KEY in data:
+            add_encoded_histograms(sink, data[REPORT_KEY])
+
+    def on_quitting(environment: Environment, **kwargs) -> None:
+        report = format_histograms_report(sink)
+        if not report:
+            return
+
+        logger.info("Latency histograms:\n%s", report)
+        write_histograms_report(sink, config.path)
+
+        if config.runs_path is not None:
+            save_histograms(sink, config.runs_path / f"{run_started}.hist")
+
+    environment.events.worker_report.add_listener(on_worker_report)
+    environment.events.quitting.add_listener(on_quitting)
@@ -0,0 +1,66 @@
+from locust.env import Environment
+
+from config import settings
+from seeds.dumps import SeedEntityKind, get_seeds_busy_path, load_seeds_dataset
+from seeds.pool import EntityPool, SharedEntityPool, build_entity_sampler
+
+# Пулы сущностей процесса (воркера) по виду сущностей
+_pools: dict[SeedEntityKind, EntityPool] = {}
+
+
+def build_seeds_pool(environment: Environment, kind: SeedEntityKind) -> EntityPool:
+    """
+    Создаёт пул сущностей из результата сидинга согласно настройкам (settings.seeds).
+
+    Генератор распределения у каждого воркера свой: с заданным зерном тестовых
+    данных (FAKE.SEED) последовательность обращений воспроизводится от запуска к запуску.
+
+    :param environment: Объект окружения Locust.
+    :param kind: Вид сущностей: users, accounts или cards.
+    :return: EntityPool или SharedEntityPool при включённой настройке shared.
+    """
+    config = settings.seeds
+    worker_index = max(getattr(environment.runner, "worker_index", 0), 0)
+
+    # Идентификаторы читаются из отображённого в память набора данных,
+    # а не из JSON: воркеры не держат собственных копий миллионов строк
+    ids = getattr(load_seeds_dataset(config.path), kind).ids
+
+    seed = settings.fake.seed
+    sampler = build_entity_sampler(
+        size=len(ids),
+        distribution=config.distribution,
+        zipf_exponent=config.zipf_exponent,
+        seed=f"{seed}:{kind}:{worker_index}" if seed is not None else None,
+    )
+
+    if config.shared:
+        return SharedEntityPool(
+            ids,
+            sampler,
+            busy_path=get_seeds_busy_path(config.path, kind),
+            checkout_attempts=config.checkout_attempts,
+        )
+
+    return EntityPool(ids, sampler, checkout_attempts=config.checkout_attempts)
+
+
+def get_seeds_pool(environment: Environment, kind: SeedEntityKind) -> EntityPool | None:
+    """
+    Возвращает пул заранее созданных сущностей, общий для виртуальных пользователей воркера.
+
+    Если файл сидинга не задан (настройка SEEDS.PATH), возвращается None
+    и сценарий создаёт нужные сущности сам.
+
+    :param environment: Объект окружения Locust.
+    :param kind: Вид сущностей: users, accounts или cards.
+    :return: Пул сущностей или None.
+    """
+    if settings.seeds.path is None:
+        return None
+
+    pool = _pools.get(kind)
+    if pool is None:
+        pool = _pools[kind] = build_seeds_pool(environment, kind)
+
+    return pool
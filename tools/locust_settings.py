@@ -0,0 +1,140 @@
+from locust import events
+from locust.argument_parser import LocustArgumentParser
+from locust.env import Environment
+
+from config import override_config, settings
+
+
+@events.init_command_line_parser.add_listener
+def add_settings_arguments(parser: LocustArgumentParser) -> None:
+    """
+    Регистрирует аргументы командной строки Locust для основных настроек (config.settings).
+
+    Аргументы переопределяют значения из переменных окружения и .env,
+    незаданные аргументы настройки не меняют. Например:
+
+        locust -f locust_get_user_scenario.py --gateway-http-url http://staging-gateway:8003
+
+    Чтобы аргументы появились, модуль нужно импортировать в locustfile.
+    """
+    group = parser.add_argument_group("gateway", "Настройки клиентов gateway")
+    group.add_argument("--gateway-http-url", help="Базовый URL http-gateway")
+    group.add_argument("--gateway-http-timeout", type=float, help="Таймаут HTTP-запроса, с")
+    group.add_argument(
+        "--gateway-http2",
+        action="store_true",
+        default=None,
+        help="Использовать HTTP/2 для http-gateway",
+    )
+    group.add_argument(
+        "--gateway-http-max-connections",
+        type=int,
+        help="Размер пула HTTP-соединений на воркер",
+    )
+    group.add_argument("--gateway-grpc-host", help="Хост grpc-gateway")
+    group.add_argument("--gateway-grpc-port", type=int, help="Порт grpc-gateway")
+    group.add_argument(
+        "--gateway-grpc-channels",
+        type=int,
+        help="Число gRPC-каналов (соединений) в пуле на воркер",
+    )
+    group.add_argument(
+        "--report-phases",
+        action="store_true",
+        default=None,
+        help="Отправлять фазы HTTP-запросов и gRPC-вызовов отдельными метриками",
+    )
+    group.add_argument(
+        "--seeds-path",
+        help="Файл с заранее созданными пользователями (python -m seeds)",
+    )
+    group.add_argument(
+        "--seeds-distribution",
+        choices=("uniform", "zipf"),
+        help="Распределение обращений к заранее созданным сущностям",
+    )
+    group.add_argument(
+        "--seeds-shared",
+        action="store_true",
+        default=None,
+        help="Общий для всех воркеров машины пул заранее созданных сущностей",
+    )
+    group.add_argument("--replay-path", help="Журнал трафика для проигрывания (JSONL)")
+    group.add_argument(
+        "--replay-speed",
+        type=float,
+        help="Ускорение проигрывания журнала трафика",
+    )
+    group.add_argument(
+        "--capture-traffic",
+        action="store_true",
+        default=None,
+        help="Записывать запросы клиентов gateway в журнал трафика",
+    )
+    group.add_argument(
+        "--capture-sample-rate",
+        type=float,
+        help="Доля записываемых запросов от 0 до 1",
+    )
+    group.add_argument(
+        "--arrival-rate",
+        type=float,
+        help="Частота итераций сценария в секунду на воркер (открытая модель нагрузки)",
+    )
+    group.add_argument(
+        "--latency-histograms",
+        action="store_true",
+        default=None,
+        help="Вести HDR-гистограммы задержек и сохранить перцентили по завершении теста",
+    )
+    group.add_argument(
+        "--expected-interval",
+        type=float,
+        help="Ожидаемый интервал между запросами пользователя для поправки гистограмм, мс",
+    )
+
+
+@events.init.add_listener
+def apply_settings_arguments(environment: Environment, **kwargs) -> None:
+    """
+    Применяет аргументы командной строки к настройкам до запуска пользователей.
+    """
+    options = environment.parsed_options
+    if options is None:
+        return
+
+    settings.gateway_http_client = override_config(
+        settings.gateway_http_client,
+        url=options.gateway_http_url,
+        timeout=options.gateway_http_timeout,
+        http2=options.gateway_http2,
+        max_connections=options.gateway_http_max_connections,
+        report_phases=options.report_phases,
+    )
+    settings.gateway_grpc_client = override_config(
+        settings.gateway_grpc_client,
+        host=options.gateway_grpc_host,
+        port=options.gateway_grpc_port,
+        channels=options.gateway_grpc_channels,
+        report_phases=options.report_phases,
+    )
+    settings.seeds = override_config(
+        settings.seeds,
+        path=options.seeds_path,
+        distribution=options.seeds_distribution,
+        shared=options.seeds_shared,
+    )
+    settings.replay = override_config(
+        settings.replay, path=options.replay_path, speed=options.replay_speed
+    )
+    settings.capture = override_config(
+        settings.capture,
+        enabled=options.capture_traffic,
+        sample_rate=options.capture_sample_rate,
+    )
+    settings.arrival_rate = override_config(settings.arrival_rate, rate=options.arrival_rate)
+    settings.histograms = override_config(
+        settings.histograms,
+        enabled=options.latency_histograms,
+        expected_interval=options.expected_interval,
+    )
@@ -0,0 +1,53 @@
+import tomllib
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, NonNegativeInt
+
+
+class MixedTaskWeights(BaseModel):
+    """
+    Веса задач смешанной нагрузки: по одной задаче на каждый метод gateway.
+
+    Вес — относительная доля задачи среди всех задач пользователя (как в @task(weight)).
+    Задачи с весом 0 не выполняются. Неизвестные имена задач в файле считаются ошибкой,
+    чтобы опечатка не превращала задачу в молча выключенную.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    get_user: NonNegativeInt = 0
+    create_user: NonNegativeInt = 0
+    get_accounts: NonNegativeInt = 0
+    open_deposit_account: NonNegativeInt = 0
+    open_savings_account: NonNegativeInt = 0
+    open_debit_card_account: NonNegativeInt = 0
+    open_credit_card_account: NonNegativeInt = 0
+    issue_virtual_card: NonNegativeInt = 0
+    issue_physical_card: NonNegativeInt = 0
+    get_tariff_document: NonNegativeInt = 0
+    get_contract_document: NonNegativeInt = 0
+    get_operation: NonNegativeInt = 0
+    get_operation_receipt: NonNegativeInt = 0
+    get_operations: NonNegativeInt = 0
+    get_operations_summary: NonNegativeInt = 0
+    make_fee_operation: NonNegativeInt = 0
+    make_top_up_operation: NonNegativeInt = 0
+    make_cashback_operation: NonNegativeInt = 0
+    make_transfer_operation: NonNegativeInt = 0
+    make_purchase_operation: NonNegativeInt = 0
+    make_bill_payment_operation: NonNegativeInt = 0
+    make_cash_withdrawal_operation: NonNegativeInt = 0
+
+
+def load_mixed_task_weights(path: Path) -> MixedTaskWeights:
+    """
+    Загружает веса задач смешанной нагрузки из TOML-файла (таблица [tasks]).
+
+    :param path: Путь к файлу, например mixed_weights.toml.
+    :return: Экземпляр MixedTaskWeights.
+    :raises ValueError: Файл содержит неизвестные задачи или отрицательные веса.
+    """
+    with open(path, "rb") as file:
+        data = tomllib.load(file)
+
+    return MixedTaskWeights.model_validate(data.get("tasks", {}))